@@ -208,7 +208,7 @@ finish #15168: 3 Simple fix, #15167: 8 More complex than expected
         if not active_batch or active_batch.id is None:
             return
 
-        deadline = datetime.fromisoformat(active_batch.deadline)
+        deadline = active_batch.deadline_dt
         now = datetime.now(UTC)
 
         if now >= deadline:
@@ -269,7 +269,7 @@ finish #15168: 3 Simple fix, #15167: 8 More complex than expected
             )
             return
 
-        voter_mentions = ", ".join([f"@**{voter}**" for voter in voters_without_votes])
+        voter_mentions = ", ".join(f"@**{voter}**" for voter in voters_without_votes)
 
         reminder_message = f"""⏰ **Voting Reminder** - {time_remaining} left!
 
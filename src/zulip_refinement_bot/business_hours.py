@@ -18,6 +18,8 @@ class BusinessHoursCalculator:
     def __init__(self, config: Config) -> None:
         self.config = config
         self.holidays_calendar = self._get_holidays_calendar()
+        # Batch messages re-render the same deadline on every edit
+        self._formatted_deadlines: dict[datetime, str] = {}
 
     def _get_holidays_calendar(self) -> dict[str, str] | None:
         if not self.config.holiday_country:
@@ -40,11 +42,15 @@ class BusinessHoursCalculator:
                     )
 
             logger.info(
-                f"Loaded {len(holiday_calendar)} holidays for {self.config.holiday_country}"
+                "Loaded holidays",
+                holiday_count=len(holiday_calendar),
+                countries=self.config.holiday_country,
             )
             return holiday_calendar
         except Exception as e:
-            logger.warning(f"Failed to load holidays for {self.config.holiday_country}: {e}")
+            logger.warning(
+                "Failed to load holidays", countries=self.config.holiday_country, error=str(e)
+            )
             return None
 
     def is_business_day(self, dt: datetime) -> bool:
@@ -122,6 +128,13 @@ class BusinessHoursCalculator:
         return None
 
     def format_business_deadline(self, deadline: datetime) -> str:
+        formatted = self._formatted_deadlines.get(deadline)
+        if formatted is None:
+            formatted = self._format_business_deadline(deadline)
+            self._formatted_deadlines[deadline] = formatted
+        return formatted
+
+    def _format_business_deadline(self, deadline: datetime) -> str:
         local_deadline = deadline.astimezone(UTC)
         formatted = local_deadline.strftime("%Y-%m-%d %H:%M %Z")
 
@@ -33,6 +33,7 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
     import logging
 
     level = getattr(logging, log_level.upper(), logging.INFO)
+    # Calls below the level return before any processor runs
 
     if log_format.lower() == "console":
         # Rich console logging for development
@@ -49,7 +50,7 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
+            wrapper_class=structlog.make_filtering_bound_logger(level),
             cache_logger_on_first_use=True,
         )
 
@@ -73,7 +74,7 @@ def setup_logging(log_level: str = "INFO", log_format: str = "json") -> None:
             ],
             context_class=dict,
             logger_factory=structlog.stdlib.LoggerFactory(),
-            wrapper_class=structlog.stdlib.BoundLogger,
+            wrapper_class=structlog.make_filtering_bound_logger(level),
             cache_logger_on_first_use=True,
         )
 
@@ -198,6 +199,9 @@ STREAM_NAME=conda-maintainers
 DEFAULT_DEADLINE_HOURS=48
 MAX_ISSUES_PER_BATCH=6
 MAX_TITLE_LENGTH=50
+BATCH_EDIT_DEBOUNCE_SECONDS=0
+BACKGROUND_REPLIES=false
+BACKGROUND_RESULTS=false
 
 # Database settings (optional)
 DATABASE_PATH=./data/refinement.db
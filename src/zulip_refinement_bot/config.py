@@ -23,6 +23,9 @@ class Config(BaseSettings):
     default_deadline_hours: int = 48
     max_issues_per_batch: int = 6
     max_title_length: int = 200
+    batch_edit_debounce_seconds: float = 0.0
+    background_replies: bool = False
+    background_results: bool = False
 
     # Holiday configuration
     holiday_country: str = "US"
@@ -27,6 +27,9 @@ class Container:
 
     def cleanup(self) -> None:
         """Clean up any resources held by the container."""
+        handler = self._instances.get(MessageHandlerInterface)
+        if isinstance(handler, MessageHandler):
+            handler.close()
         self._instances.clear()
 
     def get_github_api(self) -> GitHubAPIInterface:
@@ -95,6 +98,9 @@ class Container:
                 voting_service=self.get_voting_service(),
                 results_service=self.get_results_service(),
                 github_api=self.get_github_api(),
+                edit_debounce_seconds=self.config.batch_edit_debounce_seconds,
+                background_replies=self.config.background_replies,
+                background_results=self.config.background_results,
             )
         return self._instances[MessageHandlerInterface]  # type: ignore[return-value]
 
@@ -3,19 +3,53 @@
 from __future__ import annotations
 
 import sqlite3
+import threading
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
+from typing import Any, cast
 
 import structlog
 
 from .interfaces import DatabaseInterface
-from .migrations.runner import MigrationRunner
+from .migrations.runner import MigrationRunner, connect
 from .migrations.versions import ALL_MIGRATIONS
 from .models import BatchData, EstimationVote, FinalEstimate, IssueData
 
 logger = structlog.get_logger(__name__)
 
 
+class _TransactionConnection:
+    """Connection handed to methods running inside DatabaseManager.transaction().
+
+    Commits are left to the enclosing transaction, and each statement gets its own
+    cursor. DatabaseManager._connect() resets row_factory each time it hands the
+    wrapper out, so a method that sets it doesn't change the next method's rows.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self._conn = conn
+        self.row_factory: Any = None
+
+    def __enter__(self) -> _TransactionConnection:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:
+        cursor = self._conn.cursor()
+        cursor.row_factory = self.row_factory
+        return cursor.execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Iterable[Any]) -> sqlite3.Cursor:
+        return self._conn.executemany(sql, seq_of_parameters)
+
+    def commit(self) -> None:
+        """No-op: the enclosing transaction commits once on exit."""
+
+
 class DatabaseManager(DatabaseInterface):
     """Database manager that uses the migration system for schema management."""
 
@@ -29,6 +63,8 @@ class DatabaseManager(DatabaseInterface):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self._local = threading.local()
+
         self.migration_runner = MigrationRunner(self.db_path)
         self.migration_runner.register_migrations(ALL_MIGRATIONS)
 
@@ -46,6 +82,44 @@ class DatabaseManager(DatabaseInterface):
         except Exception as e:
             logger.error("Failed to run migrations on startup", error=str(e))
             raise
+        finally:
+            # Startup is the runner's only busy period; it reconnects if needed later
+            self.migration_runner.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[None]:
+        """Run the database calls made in the block as one transaction.
+
+        Calls on this thread inside the block share a single connection and are
+        committed together on exit, or rolled back if the block raises. Nested
+        blocks join the outermost transaction.
+
+        The transaction is per thread: calls made from other threads while the
+        block is open (executor workers, debounce timers, the sender thread) use
+        their own connections and don't see its uncommitted writes.
+        """
+        if getattr(self._local, "conn", None) is not None:
+            yield
+            return
+
+        conn = connect(self.db_path)
+        self._local.conn = _TransactionConnection(conn)
+        try:
+            with conn:
+                yield
+        finally:
+            self._local.conn = None
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Return the current transaction's connection, or a new one outside a transaction."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            # Each method starts with tuple rows, as it would on a fresh connection
+            conn.row_factory = None
+            # Supports the subset of the Connection API that this class uses
+            return cast(sqlite3.Connection, conn)
+        return connect(self.db_path)
 
     def get_migration_status(self) -> dict[str, dict]:
         """Get the status of all migrations."""
@@ -61,31 +135,10 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             Active batch data or None if no active batch exists
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT * FROM batches WHERE status IN ('active', 'discussing') "
-                "ORDER BY created_at DESC LIMIT 1"
-            )
-            row = cursor.fetchone()
-
-            if not row:
-                return None
-
-            batch_data = dict(row)
-
-            issues_cursor = conn.execute(
-                "SELECT * FROM issues WHERE batch_id = ? ORDER BY id", (batch_data["id"],)
-            )
-            issues = [
-                IssueData(
-                    issue_number=issue_row["issue_number"],
-                    url=issue_row["url"],
-                )
-                for issue_row in issues_cursor.fetchall()
-            ]
-
-            return BatchData(**batch_data, issues=issues)
+        return self._load_batch(
+            "SELECT id FROM batches WHERE status IN ('active', 'discussing') "
+            "ORDER BY created_at DESC LIMIT 1"
+        )
 
     def get_most_recent_batch(self) -> BatchData | None:
         """Get the most recent batch regardless of status.
@@ -93,28 +146,42 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             Most recent batch data or None if no batches exist
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("SELECT * FROM batches ORDER BY created_at DESC LIMIT 1")
-            row = cursor.fetchone()
+        return self._load_batch("SELECT id FROM batches ORDER BY created_at DESC LIMIT 1")
 
-            if not row:
-                return None
+    def _load_batch(self, batch_id_query: str) -> BatchData | None:
+        """Load a batch and its issues with a single joined query.
 
-            batch_data = dict(row)
+        Args:
+            batch_id_query: Subquery selecting the ID of the batch to load
 
-            issues_cursor = conn.execute(
-                "SELECT * FROM issues WHERE batch_id = ? ORDER BY id", (batch_data["id"],)
+        Returns:
+            Batch data with issues populated, or None if no batch matches
+        """
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            cursor = conn.execute(
+                f"""
+                SELECT b.*, i.issue_number AS issue_number, i.url AS issue_url
+                FROM batches b
+                LEFT JOIN issues i ON i.batch_id = b.id
+                WHERE b.id = ({batch_id_query})
+                ORDER BY i.id
+                """  # nosec B608 - batch_id_query is a fixed string from this class
             )
-            issues = [
-                IssueData(
-                    issue_number=issue_row["issue_number"],
-                    url=issue_row["url"],
-                )
-                for issue_row in issues_cursor.fetchall()
-            ]
+            rows = cursor.fetchall()
+
+        if not rows:
+            return None
 
-            return BatchData(**batch_data, issues=issues)
+        batch_data = {
+            key: rows[0][key] for key in rows[0].keys() if key not in ("issue_number", "issue_url")
+        }
+        issues = [
+            IssueData(issue_number=row["issue_number"], url=row["issue_url"])
+            for row in rows
+            if row["issue_number"] is not None
+        ]
+        return BatchData(**batch_data, issues=issues)
 
     def create_batch(self, date: str, deadline: str, facilitator: str) -> int:
         """Create a new batch and return its ID.
@@ -127,7 +194,7 @@ class DatabaseManager(DatabaseInterface):
         t       Returns:
                     ID of the created batch
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "INSERT INTO batches (date, deadline, facilitator) VALUES (?, ?, ?)",
                 (date, deadline, facilitator),
@@ -143,11 +210,13 @@ class DatabaseManager(DatabaseInterface):
     def add_issues_to_batch(self, batch_id: int, issues: list[IssueData]) -> None:
         """Add issues to a batch.
 
+        All rows are inserted with one executemany and committed together.
+
         Args:
             batch_id: ID of the batch to add issues to
             issues: List of issues to add
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.executemany(
                 "INSERT INTO issues (batch_id, issue_number, url) VALUES (?, ?, ?)",
                 [(batch_id, issue.issue_number, issue.url) for issue in issues],
@@ -165,7 +234,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             List of issues in the batch
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 "SELECT * FROM issues WHERE batch_id = ? ORDER BY id", (batch_id,)
@@ -181,7 +250,7 @@ class DatabaseManager(DatabaseInterface):
         Args:
             batch_id: ID of the batch to cancel
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("UPDATE batches SET status = 'cancelled' WHERE id = ?", (batch_id,))
             conn.commit()
 
@@ -193,19 +262,17 @@ class DatabaseManager(DatabaseInterface):
         Args:
             batch_id: ID of the batch to complete
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("UPDATE batches SET status = 'completed' WHERE id = ?", (batch_id,))
             conn.commit()
 
-        logger.info("Batch completed", batch_id=batch_id)
-
     def set_batch_discussing(self, batch_id: int) -> None:
         """Set batch status to discussing.
 
         Args:
             batch_id: ID of the batch to update
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("UPDATE batches SET status = 'discussing' WHERE id = ?", (batch_id,))
             conn.commit()
 
@@ -223,7 +290,7 @@ class DatabaseManager(DatabaseInterface):
             rationale: Brief rationale for the estimate
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute(
                     """
                     INSERT OR REPLACE INTO final_estimates
@@ -245,6 +312,40 @@ class DatabaseManager(DatabaseInterface):
             logger.error("Error storing final estimate", error=str(e))
             raise
 
+    def store_final_estimates(
+        self, batch_id: int, estimates: Iterable[tuple[str, int, str]]
+    ) -> None:
+        """Store several final estimates for a batch in a single transaction.
+
+        Args:
+            batch_id: ID of the batch
+            estimates: (issue_number, final_points, rationale) tuples to store
+        """
+        rows = [
+            (batch_id, issue_number, final_points, rationale)
+            for issue_number, final_points, rationale in estimates
+        ]
+        if not rows:
+            return
+
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO final_estimates
+                    (batch_id, issue_number, final_points, rationale, timestamp)
+                    VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)
+                """,
+                    rows,
+                )
+
+                conn.commit()
+                logger.info("Final estimates stored", batch_id=batch_id, count=len(rows))
+
+        except sqlite3.Error as e:
+            logger.error("Error storing final estimates", error=str(e))
+            raise
+
     def get_final_estimates(self, batch_id: int) -> list[FinalEstimate]:
         """Get all final estimates for a batch.
 
@@ -255,7 +356,7 @@ class DatabaseManager(DatabaseInterface):
             List of final estimates
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.row_factory = sqlite3.Row
                 cursor = conn.execute(
                     """
@@ -297,7 +398,7 @@ class DatabaseManager(DatabaseInterface):
             True if vote was stored successfully, False if it was a duplicate
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute(
                     "INSERT INTO votes (batch_id, issue_number, voter, points) VALUES (?, ?, ?, ?)",
                     (batch_id, issue_number, voter, points),
@@ -333,7 +434,7 @@ class DatabaseManager(DatabaseInterface):
             - success: True if vote was stored/updated successfully
             - was_update: True if this was an update, False if it was a new vote
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT points FROM votes WHERE batch_id = ? AND issue_number = ? AND voter = ?",
                 (batch_id, issue_number, voter),
@@ -372,6 +473,60 @@ class DatabaseManager(DatabaseInterface):
                 )
                 return True, False
 
+    def bulk_upsert_votes(
+        self, batch_id: int, voter: str, estimates: dict[str, int]
+    ) -> tuple[int, int]:
+        """Store or update all of a voter's estimates for a batch in one transaction.
+
+        Any abstentions the voter recorded on those issues are cleared, since an
+        issue is either voted on or abstained from.
+
+        Args:
+            batch_id: ID of the batch
+            voter: Name of the voter
+            estimates: Mapping of issue number to story points
+
+        Returns:
+            Tuple of (new_count, updated_count)
+        """
+        if not estimates:
+            return 0, 0
+
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "SELECT issue_number FROM votes WHERE batch_id = ? AND voter = ?",
+                (batch_id, voter),
+            )
+            existing = {row[0] for row in cursor.fetchall()}
+
+            conn.executemany(
+                "DELETE FROM abstentions WHERE batch_id = ? AND voter = ? AND issue_number = ?",
+                ((batch_id, voter, issue_number) for issue_number in estimates),
+            )
+            conn.executemany(
+                """
+                INSERT INTO votes (batch_id, issue_number, voter, points) VALUES (?, ?, ?, ?)
+                ON CONFLICT(batch_id, issue_number, voter)
+                DO UPDATE SET points = excluded.points, created_at = CURRENT_TIMESTAMP
+                """,
+                (
+                    (batch_id, issue_number, voter, points)
+                    for issue_number, points in estimates.items()
+                ),
+            )
+            conn.commit()
+
+        updated_count = len(existing.intersection(estimates))
+        new_count = len(estimates) - updated_count
+        logger.info(
+            "Votes stored",
+            batch_id=batch_id,
+            voter=voter,
+            new_votes=new_count,
+            updated_votes=updated_count,
+        )
+        return new_count, updated_count
+
     def get_batch_votes(self, batch_id: int) -> list[EstimationVote]:
         """Get all votes for a batch.
 
@@ -381,7 +536,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             List of votes for the batch
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 "SELECT * FROM votes WHERE batch_id = ? ORDER BY created_at", (batch_id,)
@@ -405,7 +560,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             Number of unique voters
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT COUNT(DISTINCT voter) FROM votes WHERE batch_id = ?", (batch_id,)
             )
@@ -421,7 +576,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             Number of voters who have completed voting
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Get total number of issues in the batch
             cursor = conn.execute("SELECT COUNT(*) FROM issues WHERE batch_id = ?", (batch_id,))
             total_issues = cursor.fetchone()[0]
@@ -446,6 +601,108 @@ class DatabaseManager(DatabaseInterface):
             )
             return len(cursor.fetchall())
 
+    def get_batch_voters_and_counts(self, batch_id: int) -> tuple[list[str], list[str], int]:
+        """Get a batch's voters and voting progress on a single connection.
+
+        Args:
+            batch_id: ID of the batch
+
+        Returns:
+            Tuple of (all voters, voters without any votes, number of voters who completed
+            voting on every issue)
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                SELECT bv.voter_name,
+                       EXISTS(
+                           SELECT 1 FROM votes v
+                           WHERE v.batch_id = bv.batch_id AND v.voter = bv.voter_name
+                       )
+                FROM batch_voters bv
+                WHERE bv.batch_id = ?
+                ORDER BY bv.voter_name
+                """,
+                (batch_id,),
+            )
+            voters = []
+            remaining_voters = []
+            for voter, has_voted in cursor:
+                voters.append(voter)
+                if not has_voted:
+                    remaining_voters.append(voter)
+
+            completed_count = self._count_completed_voters(conn, batch_id)
+
+        return voters, remaining_voters, completed_count
+
+    def get_batch_votes_and_voters(
+        self, batch_id: int
+    ) -> tuple[list[EstimationVote], list[str], int]:
+        """Get a batch's votes, voters and completed-voter count on a single connection.
+
+        Args:
+            batch_id: ID of the batch
+
+        Returns:
+            Tuple of (votes in submission order, voter names, number of voters who
+            completed voting on every issue)
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                """
+                SELECT voter, issue_number, points, created_at
+                FROM votes WHERE batch_id = ? ORDER BY created_at
+                """,
+                (batch_id,),
+            )
+            votes = [
+                EstimationVote(
+                    voter=voter, issue_number=issue_number, points=points, timestamp=created_at
+                )
+                for voter, issue_number, points, created_at in cursor
+            ]
+
+            cursor = conn.execute(
+                "SELECT voter_name FROM batch_voters WHERE batch_id = ? ORDER BY voter_name",
+                (batch_id,),
+            )
+            voters = [row[0] for row in cursor]
+
+            completed_count = self._count_completed_voters(conn, batch_id)
+
+        return votes, voters, completed_count
+
+    @staticmethod
+    def _count_completed_voters(conn: sqlite3.Connection, batch_id: int) -> int:
+        """Count voters who voted or abstained on every issue in a batch.
+
+        Args:
+            conn: Open database connection
+            batch_id: ID of the batch
+
+        Returns:
+            Number of voters who completed voting
+        """
+        cursor = conn.execute(
+            """
+            SELECT COUNT(*) FROM (
+                SELECT voter
+                FROM (
+                    SELECT voter, issue_number FROM votes WHERE batch_id = ?
+                    UNION
+                    SELECT voter, issue_number FROM abstentions WHERE batch_id = ?
+                ) combined
+                GROUP BY voter
+                HAVING COUNT(DISTINCT issue_number) = (
+                    SELECT COUNT(*) FROM issues WHERE batch_id = ?
+                )
+            )
+            """,
+            (batch_id, batch_id, batch_id),
+        )
+        return int(cursor.fetchone()[0])
+
     def has_voter_voted(self, batch_id: int, voter: str) -> bool:
         """Check if a voter has already submitted votes for a batch.
 
@@ -456,7 +713,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             True if the voter has already voted, False otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT COUNT(*) FROM votes WHERE batch_id = ? AND voter = ?", (batch_id, voter)
             )
@@ -471,7 +728,7 @@ class DatabaseManager(DatabaseInterface):
             message_id: Zulip message ID of the batch refinement message
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.execute(
                     "UPDATE batches SET message_id = ? WHERE id = ?", (message_id, batch_id)
                 )
@@ -504,7 +761,7 @@ class DatabaseManager(DatabaseInterface):
             results_message_id: Zulip message ID of the estimation results message
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 cursor = conn.execute(
                     "UPDATE batches SET results_message_id = ? WHERE id = ?",
                     (results_message_id, batch_id),
@@ -539,7 +796,7 @@ class DatabaseManager(DatabaseInterface):
             batch_id: ID of the batch
             voters: List of voter names
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.executemany(
                 "INSERT INTO batch_voters (batch_id, voter_name) VALUES (?, ?)",
                 [(batch_id, voter) for voter in voters],
@@ -557,7 +814,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             List of voter names for the batch
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT voter_name FROM batch_voters WHERE batch_id = ? ORDER BY voter_name",
                 (batch_id,),
@@ -578,7 +835,7 @@ class DatabaseManager(DatabaseInterface):
             True if voter was added, False if they were already in the batch
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute(
                     "INSERT INTO batch_voters (batch_id, voter_name) VALUES (?, ?)",
                     (batch_id, voter),
@@ -601,7 +858,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             True if voter was removed, False if they weren't in the batch
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "DELETE FROM batch_voters WHERE batch_id = ? AND voter_name = ?",
                 (batch_id, voter),
@@ -616,6 +873,72 @@ class DatabaseManager(DatabaseInterface):
                 logger.debug("Voter not found in batch", batch_id=batch_id, voter=voter)
                 return False
 
+    def add_voters_to_batch(self, batch_id: int, voters: list[str]) -> tuple[list[str], list[str]]:
+        """Add several voters to a batch in a single transaction.
+
+        Args:
+            batch_id: ID of the batch
+            voters: Names of the voters to add
+
+        Returns:
+            Tuple of (added voters, voters already in the batch)
+        """
+        added: list[str] = []
+        already_present: list[str] = []
+        with self._connect() as conn:
+            for voter in voters:
+                cursor = conn.execute(
+                    "INSERT OR IGNORE INTO batch_voters (batch_id, voter_name) VALUES (?, ?)",
+                    (batch_id, voter),
+                )
+                if cursor.rowcount > 0:
+                    added.append(voter)
+                else:
+                    already_present.append(voter)
+            conn.commit()
+
+        logger.info(
+            "Added voters to batch",
+            batch_id=batch_id,
+            added=added,
+            already_present=already_present,
+        )
+        return added, already_present
+
+    def remove_voters_from_batch(
+        self, batch_id: int, voters: list[str]
+    ) -> tuple[list[str], list[str]]:
+        """Remove several voters from a batch in a single transaction.
+
+        Args:
+            batch_id: ID of the batch
+            voters: Names of the voters to remove
+
+        Returns:
+            Tuple of (removed voters, voters that weren't in the batch)
+        """
+        removed: list[str] = []
+        not_present: list[str] = []
+        with self._connect() as conn:
+            for voter in voters:
+                cursor = conn.execute(
+                    "DELETE FROM batch_voters WHERE batch_id = ? AND voter_name = ?",
+                    (batch_id, voter),
+                )
+                if cursor.rowcount > 0:
+                    removed.append(voter)
+                else:
+                    not_present.append(voter)
+            conn.commit()
+
+        logger.info(
+            "Removed voters from batch",
+            batch_id=batch_id,
+            removed=removed,
+            not_present=not_present,
+        )
+        return removed, not_present
+
     def upsert_abstention(self, batch_id: int, voter: str, issue_number: str) -> tuple[bool, bool]:
         """Store or update an abstention for an issue in a batch.
 
@@ -627,7 +950,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             Tuple of (success: bool, was_update: bool)
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             # Check if abstention already exists
             cursor = conn.execute(
                 "SELECT id FROM abstentions WHERE batch_id = ? AND issue_number = ? AND voter = ?",
@@ -674,7 +997,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             List of issue numbers
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT issue_number FROM abstentions WHERE batch_id = ? AND voter = ?",
                 (batch_id, voter),
@@ -692,7 +1015,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             True if voter has abstained from this issue
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT 1 FROM abstentions WHERE batch_id = ? AND voter = ? AND issue_number = ?",
                 (batch_id, voter, issue_number),
@@ -710,7 +1033,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             True if a vote was removed
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "DELETE FROM votes WHERE batch_id = ? AND voter = ? AND issue_number = ?",
                 (batch_id, voter, issue_number),
@@ -739,7 +1062,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             True if an abstention was removed
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "DELETE FROM abstentions WHERE batch_id = ? AND voter = ? AND issue_number = ?",
                 (batch_id, voter, issue_number),
@@ -767,7 +1090,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             True if reminder has been sent, False otherwise
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 "SELECT 1 FROM batch_reminders WHERE batch_id = ? AND reminder_type = ?",
                 (batch_id, reminder_type),
@@ -783,7 +1106,7 @@ class DatabaseManager(DatabaseInterface):
             reminder_type: Type of reminder (e.g., 'halfway', '1_hour')
         """
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute(
                     "INSERT INTO batch_reminders (batch_id, reminder_type) VALUES (?, ?)",
                     (batch_id, reminder_type),
@@ -805,7 +1128,7 @@ class DatabaseManager(DatabaseInterface):
         Returns:
             List of voter names who haven't voted
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute(
                 """
                 SELECT bv.voter_name
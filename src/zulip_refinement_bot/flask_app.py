@@ -20,8 +20,15 @@ def create_app() -> Flask:
     app.config["bot_instance"] = None
     app.config["config"] = None
 
+    config = Config()
+    if not structlog.is_configured():
+        # The server command sets up logging itself; WSGI and script entry points don't
+        from .cli import setup_logging
+
+        setup_logging(config.log_level, config.log_format)
+
     logger.info("Flask app initializing")
-    app.config["config"] = Config()
+    app.config["config"] = config
     app.config["bot_instance"] = RefinementBot(app.config["config"])
     logger.info("Bot instance created for Flask")
 
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 
 import httpx
 import structlog
@@ -11,6 +13,38 @@ from .interfaces import GitHubAPIInterface
 
 logger = structlog.get_logger(__name__)
 
+# Shared by every title lookup; worker threads are started on demand and then reused
+_title_fetch_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="github-title")
+
+
+def fetch_issue_titles(github_api: GitHubAPIInterface, urls: Iterable[str]) -> list[str | None]:
+    """Fetch several issue titles with their requests in flight together.
+
+    Each lookup is one GitHub round-trip, so overlapping them makes a batch cost
+    about one request's latency instead of one per issue. Lookups run on a
+    long-lived pool shared by all callers. If collecting a result fails, lookups
+    that have not started yet are cancelled rather than run.
+
+    Args:
+        github_api: GitHub API used for each lookup
+        urls: GitHub issue URLs
+
+    Returns:
+        Titles in the order of ``urls``, None where one could not be fetched
+    """
+    urls = list(urls)
+    if len(urls) < 2:
+        return [github_api.fetch_issue_title_by_url(url) for url in urls]
+
+    futures = [
+        _title_fetch_executor.submit(github_api.fetch_issue_title_by_url, url) for url in urls
+    ]
+    try:
+        return [future.result() for future in futures]
+    finally:
+        for future in futures:
+            future.cancel()
+
 
 class GitHubAPI(GitHubAPIInterface):
     """Handles GitHub API interactions to fetch issue information."""
@@ -2,22 +2,102 @@
 
 from __future__ import annotations
 
+import queue
 import random
 import re
+import threading
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
-from typing import Any
+from functools import partial
+from itertools import chain
+from operator import itemgetter
+from string import Template
+from typing import Any, cast
 
 import structlog
 
 from .business_hours import BusinessHoursCalculator
 from .config import Config
 from .exceptions import AuthorizationError, BatchError, ValidationError, VotingError
+from .github_api import fetch_issue_titles
 from .interfaces import GitHubAPIInterface, MessageHandlerInterface, ZulipClientInterface
 from .models import BatchData, FinalEstimate, IssueData
 from .services import BatchService, ResultsService, VoterValidationService, VotingService
 
 logger = structlog.get_logger(__name__)
 
+_FIBONACCI = (1, 2, 3, 5, 8, 13, 21)
+_VALID_POINTS = frozenset(_FIBONACCI)
+
+# At most two Zulip requests are overlapped: a reply or results post plus a message edit
+_MAX_ZULIP_CALL_WORKERS = 2
+
+# Sections of the batch message shared by every phase of a batch
+_BATCH_PREAMBLE = Template("""**Stories**:
+$issue_list
+
+**Deadline**: $deadline $hours_text
+**Facilitator**: @**$facilitator**
+
+**How to estimate**:
+1. Review issues in GitHub
+2. Consider complexity, unknowns, dependencies for each
+3. DM @**Refinement Bot** your story point estimates in this format:
+   `$example_format`
+4. Use scale: 1, 2, 3, 5, 8, 13, 21
+
+""")
+_BATCH_MESSAGE = Template("""$header
+$preamble**Voters needed**: $voter_mentions
+
+**Status**: $status
+
+*$footer*""")
+
+# Posted in the topic when the batch message is past Zulip's edit window
+_FALLBACK_STATUS = Template("""📊 **Voting Progress Update**
+
+**Status**: ⏳ Collecting estimates ($vote_count/$total_voters received)
+
+$vote_count/$total_voters team members have submitted their estimates. \
+Still waiting for votes from remaining members.
+
+*This update was posted because the original message could no longer be edited.*""")
+
+_ADD_VOTER_HELP = (
+    "❌ Please specify voter name(s). Format:\n"
+    "• `add John Doe`\n"
+    "• `add @**username**`\n"
+    "• `add John Doe, Jane Smith, @**bob**`\n"
+    "• `add Alice and Bob`"
+)
+_REMOVE_VOTER_HELP = (
+    "❌ Please specify voter name(s). Format:\n"
+    "• `remove John Doe`\n"
+    "• `remove @**username**`\n"
+    "• `remove John Doe, Jane Smith, @**bob**`\n"
+    "• `remove Alice and Bob`"
+)
+
+# Possessive quantifiers never backtrack into a consumed run of digits or spaces,
+# so searching a long message stays linear in its length
+_VOTE_PATTERN = re.compile(r"#\d++:\s*+\d")
+
+_PROXY_VOTE_PREFIX = re.compile(r"vote\s+for\s+", re.IGNORECASE)
+_PROXY_VOTE = re.compile(r"vote\s+for\s+(.+?)\s+`?(#\d+:\s*\d+.*?)`?$", re.IGNORECASE)
+
+# Voters in add/remove commands are separated by commas or "and"
+_VOTER_SEPARATOR = re.compile(r",|\s+and\s+", re.IGNORECASE)
+
+
+def _skip_digits(text: str, pos: int) -> int:
+    """Return the index of the first non-digit character at or after pos."""
+    while pos < len(text) and text[pos].isdigit():
+        pos += 1
+    return pos
+
 
 class MessageHandler(MessageHandlerInterface):
     """Handles incoming Zulip messages and routes them to appropriate services."""
@@ -30,6 +110,9 @@ class MessageHandler(MessageHandlerInterface):
         voting_service: VotingService,
         results_service: ResultsService,
         github_api: GitHubAPIInterface,
+        edit_debounce_seconds: float = 0.0,
+        background_replies: bool = False,
+        background_results: bool = False,
     ) -> None:
         """Initialize message handler.
 
@@ -40,6 +123,9 @@ class MessageHandler(MessageHandlerInterface):
             voting_service: Voting service
             results_service: Results service
             github_api: GitHub API interface
+            edit_debounce_seconds: Delay used to coalesce batch message edits (0 edits inline)
+            background_replies: Deliver private replies from a background sender thread
+            background_results: Post batch results from the background sender thread
         """
         self.config = config
         self.zulip_client = zulip_client
@@ -48,29 +134,79 @@ class MessageHandler(MessageHandlerInterface):
         self.results_service = results_service
         self.github_api = github_api
         self.business_hours_calc = BusinessHoursCalculator(config)
+        self.edit_debounce_seconds = edit_debounce_seconds
+        # Guards pending edits and the per-batch caches below; never held over a request
+        self._edit_lock = threading.Lock()
+        # Held while a progress edit renders and sends, so ending vote collection can wait
+        self._progress_edit_lock = threading.Lock()
+        self._pending_edits: dict[int, threading.Timer] = {}
+        self._pending_state: dict[int, BatchData] = {}
+        self._batch_content_prefix: dict[int, str] = {}
+        self._last_rendered: dict[int, str] = {}
+        self._status_preamble_cache: dict[int, str] = {}
+        self._issue_list_cache: dict[int, str] = {}
+        self.background_replies = background_replies
+        self.background_results = background_results
+        self._send_queue: queue.Queue[Callable[[], None] | None] | None = None
+        self._sender_thread: threading.Thread | None = None
+        self._zulip_executor: ThreadPoolExecutor | None = ThreadPoolExecutor(
+            max_workers=_MAX_ZULIP_CALL_WORKERS, thread_name_prefix="zulip-call"
+        )
+        if background_replies or background_results:
+            self._send_queue = queue.Queue(maxsize=1024)
+            self._sender_thread = threading.Thread(
+                target=self._run_sender,
+                args=(self._send_queue,),
+                name="zulip-reply-sender",
+                daemon=True,
+            )
+            self._sender_thread.start()
 
-    def _format_issue_list(self, issues: list[IssueData]) -> str:
+    def _format_issue_list(self, issues: list[IssueData], batch_id: int | None = None) -> str:
         """Format issue list with on-demand title fetching.
 
+        A batch's issues don't change after creation, so when a batch ID is given the
+        formatted list (and the title lookups behind it) is reused for that batch.
+
         Args:
             issues: List of issues to format
+            batch_id: ID of the batch the issues belong to, if any
 
         Returns:
             Formatted issue list string
         """
-        formatted_issues = []
-        for issue in issues:
-            title = self.github_api.fetch_issue_title_by_url(issue.url)
-            if title and issue.url:
-                formatted_issues.append(f"• #{issue.issue_number} - [{title}]({issue.url})")
-            elif title:
-                formatted_issues.append(f"• #{issue.issue_number} - {title}")
-            else:
-                formatted_issues.append(
-                    f"• #{issue.issue_number} - [Issue {issue.issue_number}]({issue.url})"
-                )
+        if batch_id is not None:
+            with self._edit_lock:
+                cached = self._issue_list_cache.get(batch_id)
+            if cached is not None:
+                return cached
+
+        titles = fetch_issue_titles(self.github_api, (issue.url for issue in issues))
+        issue_list = "\n".join(map(self._format_issue_line, issues, titles))
+        if batch_id is not None:
+            with self._edit_lock:
+                self._issue_list_cache[batch_id] = issue_list
+        return issue_list
+
+    @staticmethod
+    def _format_issue_line(issue: IssueData, title: str | None) -> str:
+        """Format a single issue as a bullet.
+
+        Args:
+            issue: Issue to format
+            title: The issue's GitHub title, or None if it could not be fetched
 
-        return "\n".join(formatted_issues)
+        Returns:
+            Formatted issue line
+        """
+        number, url = issue.issue_number, issue.url
+        if not title:
+            label = f"[Issue {number}]({url})"
+        elif url:
+            label = f"[{title}]({url})"
+        else:
+            label = title
+        return f"• #{number} - {label}"
 
     def handle_start_batch(self, message: dict[str, Any], content: str) -> None:
         """Handle batch creation request.
@@ -107,14 +243,12 @@ class MessageHandler(MessageHandlerInterface):
                 self._send_reply(message, "✅ No active batch currently running.")
                 return
 
-            deadline = datetime.fromisoformat(active_batch.deadline)
-
-            issue_list = self._format_issue_list(active_batch.issues)
+            issue_list = self._format_issue_list(active_batch.issues, active_batch.id)
 
             status_msg = f"""**📊 Active Batch Status**
 **Date**: {active_batch.date}
 **Facilitator**: {active_batch.facilitator}
-**Deadline**: {self.business_hours_calc.format_business_deadline(deadline)}
+**Deadline**: {self.business_hours_calc.format_business_deadline(active_batch.deadline_dt)}
 **Issues** ({len(active_batch.issues)}):
 {issue_list}
 
@@ -141,6 +275,7 @@ class MessageHandler(MessageHandlerInterface):
 
             requester = message["sender_full_name"]
             self.batch_service.cancel_batch(active_batch.id, requester)
+            self._forget_batch(active_batch.id)
             self._send_reply(message, "✅ Batch cancelled successfully.")
 
         except (BatchError, AuthorizationError) as e:
@@ -196,36 +331,36 @@ class MessageHandler(MessageHandlerInterface):
             )
 
             # Send success message
-            parts = []
-            if estimates:
-                vote_summary = ", ".join(
-                    [f"#{issue}: {points}" for issue, points in estimates.items()]
-                )
-                parts.append(f"Estimates: {vote_summary}")
-
-            if abstentions:
-                abstention_summary = ", ".join([f"#{issue}: abstain" for issue in abstentions])
-                parts.append(f"Abstentions: {abstention_summary}")
+            vote_summary = self._format_vote_summary(estimates, abstentions)
 
             if has_updates:
                 action_msg = "**Votes updated successfully!**"
             else:
                 action_msg = "**Votes recorded successfully!**"
 
-            self._send_reply(
+            confirmation = partial(
+                self._send_reply,
                 message,
                 f"✅ {action_msg}\n\n"
                 f"Your estimates: {vote_summary}\n\n"
                 f"Thank you for participating in the refinement process.",
             )
 
-            # Update batch message with current vote count
-            if active_batch.id:
-                self._update_batch_message(active_batch.id, active_batch)
-
-                # Check if all voters have completed
-                if all_voters_complete:
-                    self._process_batch_completion(active_batch, auto_completed=True)
+            if not active_batch.id:
+                confirmation()
+            elif all_voters_complete:
+                # The completion status replaces the progress line, so skip that edit
+                confirmation()
+                self._process_batch_completion(active_batch, auto_completed=True)
+            else:
+                update = partial(self._update_batch_message, active_batch.id, active_batch)
+                if self.background_replies or self.edit_debounce_seconds > 0:
+                    # Neither call waits on the network, so there is nothing to overlap
+                    confirmation()
+                    update()
+                else:
+                    # The reply and the batch message edit are independent round trips
+                    self._run_zulip_calls([confirmation, update])
 
         except (AuthorizationError, ValidationError, VotingError) as e:
             self._send_reply(message, f"❌ {e.message}")
@@ -273,19 +408,13 @@ class MessageHandler(MessageHandlerInterface):
         Returns:
             List of clean usernames without Zulip mention formatting
         """
-        import re
-
-        # Replace "and" with commas for consistent parsing
-        text = re.sub(r"\s+and\s+", ", ", text, flags=re.IGNORECASE)
-
-        # Split by commas and clean up each name
-        voter_names = []
-        for name_part in text.split(","):
-            name_part = name_part.strip()
-            if name_part:
-                clean_name = self._parse_voter_name(name_part)
-                if clean_name and clean_name not in voter_names:
-                    voter_names.append(clean_name)
+        voter_names: list[str] = []
+        seen: set[str] = set()
+        for token in _VOTER_SEPARATOR.split(text):
+            clean_name = self._parse_voter_name(token)
+            if clean_name and clean_name not in seen:
+                seen.add(clean_name)
+                voter_names.append(clean_name)
 
         return voter_names
 
@@ -298,13 +427,8 @@ class MessageHandler(MessageHandlerInterface):
         Returns:
             Comma-separated string of voter mentions for voters who haven't voted yet
         """
-        batch_voters = self.batch_service.database.get_batch_voters(batch_id)
-        remaining_voters = [
-            voter
-            for voter in batch_voters
-            if not self.batch_service.database.has_voter_voted(batch_id, voter)
-        ]
-        return ", ".join([f"@**{voter}**" for voter in remaining_voters])
+        _, remaining_voters, _ = self.batch_service.database.get_batch_voters_and_counts(batch_id)
+        return ", ".join(f"@**{voter}**" for voter in remaining_voters)
 
     def handle_list_voters(self, message: dict[str, Any]) -> None:
         """Handle list voters command."""
@@ -320,7 +444,7 @@ class MessageHandler(MessageHandlerInterface):
                 self._send_reply(message, f"📋 No voters found for batch {active_batch.id}")
                 return
 
-            voter_list = "\n".join([f"• {voter}" for voter in voters])
+            voter_list = "\n".join(f"• {voter}" for voter in voters)
             response = f"""📋 **Voters for Active Batch {active_batch.id}**
 
 {voter_list}
@@ -338,14 +462,7 @@ class MessageHandler(MessageHandlerInterface):
         try:
             parts = content.split(maxsplit=1)
             if len(parts) < 2:
-                self._send_reply(
-                    message,
-                    "❌ Please specify voter name(s). Format:\n"
-                    "• `add John Doe`\n"
-                    "• `add @**username**`\n"
-                    "• `add John Doe, Jane Smith, @**bob**`\n"
-                    "• `add Alice and Bob`",
-                )
+                self._send_reply(message, _ADD_VOTER_HELP)
                 return
 
             voter_names = self._parse_voter_names(parts[1])
@@ -358,27 +475,26 @@ class MessageHandler(MessageHandlerInterface):
                 self._send_reply(message, "❌ No active batch found.")
                 return
 
-            # Process each voter with validation
-            added_voters = []
-            already_present = []
+            # Validate each voter, then add the valid ones in one transaction
+            clean_voters = []
             invalid_voters = []
 
             for voter_name in voter_names:
                 try:
-                    clean_voter = VoterValidationService.validate_voter_name(voter_name)
-                    was_added = self.batch_service.database.add_voter_to_batch(
-                        active_batch.id, clean_voter
-                    )
-                    if was_added:
-                        added_voters.append(clean_voter)
-                    else:
-                        already_present.append(clean_voter)
+                    clean_voters.append(VoterValidationService.validate_voter_name(voter_name))
                 except ValidationError as e:
                     invalid_voters.append((voter_name, str(e)))
                     logger.warning(
                         "Invalid voter name in add command", voter=voter_name, error=str(e)
                     )
 
+            added_voters: list[str] = []
+            already_present: list[str] = []
+            if clean_voters:
+                added_voters, already_present = self.batch_service.database.add_voters_to_batch(
+                    active_batch.id, clean_voters
+                )
+
             # Build response message
             response_parts = []
 
@@ -418,14 +534,7 @@ class MessageHandler(MessageHandlerInterface):
         try:
             parts = content.split(maxsplit=1)
             if len(parts) < 2:
-                self._send_reply(
-                    message,
-                    "❌ Please specify voter name(s). Format:\n"
-                    "• `remove John Doe`\n"
-                    "• `remove @**username**`\n"
-                    "• `remove John Doe, Jane Smith, @**bob**`\n"
-                    "• `remove Alice and Bob`",
-                )
+                self._send_reply(message, _REMOVE_VOTER_HELP)
                 return
 
             voter_names = self._parse_voter_names(parts[1])
@@ -438,18 +547,9 @@ class MessageHandler(MessageHandlerInterface):
                 self._send_reply(message, "❌ No active batch found.")
                 return
 
-            # Process each voter
-            removed_voters = []
-            not_present = []
-
-            for voter_name in voter_names:
-                was_removed = self.batch_service.database.remove_voter_from_batch(
-                    active_batch.id, voter_name
-                )
-                if was_removed:
-                    removed_voters.append(voter_name)
-                else:
-                    not_present.append(voter_name)
+            removed_voters, not_present = self.batch_service.database.remove_voters_from_batch(
+                active_batch.id, voter_names
+            )
 
             # Build response message
             response_parts = []
@@ -521,10 +621,13 @@ class MessageHandler(MessageHandlerInterface):
                 return
 
             # Store the final estimates for these items
-            for issue_number, (final_points, rationale) in final_estimates.items():
-                self.batch_service.database.store_final_estimate(
-                    active_batch.id, issue_number, final_points, rationale
-                )
+            self.batch_service.database.store_final_estimates(
+                active_batch.id,
+                (
+                    (issue_number, final_points, rationale)
+                    for issue_number, (final_points, rationale) in final_estimates.items()
+                ),
+            )
 
             # Check if all discussion items are now complete
             all_complete = self._check_discussion_complete(active_batch)
@@ -546,7 +649,10 @@ class MessageHandler(MessageHandlerInterface):
                     est.issue_number: (est.final_points, est.rationale)
                     for est in all_final_estimates
                 }
-                self._post_finish_results(completed_batch, final_estimates_dict)
+                self._post_batch_results(
+                    [partial(self._post_finish_results, completed_batch, final_estimates_dict)]
+                )
+                self._forget_batch(active_batch.id)
 
                 self._send_reply(
                     message,
@@ -584,26 +690,48 @@ class MessageHandler(MessageHandlerInterface):
         Returns:
             Dict of issue_number -> (points, rationale)
         """
-        import re
-
         content = content.replace("finish", "").strip()
+        length = len(content)
 
-        # Pattern to match #issue: points rationale
-        pattern = r"#(\d+):\s*(\d+)\s*([^,#]*?)(?=,\s*#|\s*$)"
-        matches = re.findall(pattern, content)
+        final_estimates: dict[str, tuple[int, str]] = {}
 
-        final_estimates = {}
-        valid_points = {1, 2, 3, 5, 8, 13, 21}
+        # Single left-to-right scan over "#issue: points rationale" items
+        start = content.find("#")
+        while start != -1:
+            pos = _skip_digits(content, start + 1)
+            issue_num = content[start + 1 : pos]
+            if not issue_num or pos >= length or content[pos] != ":":
+                start = content.find("#", pos)
+                continue
 
-        for issue_num, points_str, rationale in matches:
-            try:
-                points = int(points_str)
-                if points in valid_points:
-                    final_estimates[issue_num] = (points, rationale.strip())
-                else:
-                    logger.warning(f"Invalid story points: {points} for issue {issue_num}")
-            except ValueError:
-                logger.warning(f"Could not parse points for issue {issue_num}: {points_str}")
+            points_start = pos + 1
+            while points_start < length and content[points_start].isspace():
+                points_start += 1
+            points_end = _skip_digits(content, points_start)
+            points_str = content[points_start:points_end]
+
+            # The rationale runs up to the next "#issue:" token, minus any separating comma
+            next_start = content.find("#", points_end)
+            while next_start != -1:
+                pos = _skip_digits(content, next_start + 1)
+                if pos > next_start + 1 and pos < length and content[pos] == ":":
+                    break
+                next_start = content.find("#", pos)
+            rationale_end = length if next_start == -1 else next_start
+
+            if points_str:
+                try:
+                    points = int(points_str)
+                    if points in _VALID_POINTS:
+                        rationale = content[points_end:rationale_end].strip().removesuffix(",")
+                        rationale = rationale.rstrip()
+                        final_estimates[issue_num] = (points, rationale)
+                    else:
+                        logger.warning("Invalid story points", points=points, issue=issue_num)
+                except ValueError:
+                    logger.warning("Could not parse points", issue=issue_num, points=points_str)
+
+            start = next_start
 
         return final_estimates
 
@@ -646,9 +774,9 @@ class MessageHandler(MessageHandlerInterface):
         """
         try:
             if batch.id is not None:
-                votes = self.voting_service.get_batch_votes(batch.id)
-                vote_count, total_voters, _ = self.voting_service.check_completion_status(batch.id)
-                batch_voters = self.batch_service.database.get_batch_voters(batch.id)
+                votes, vote_count, total_voters, batch_voters = (
+                    self.voting_service.get_votes_and_status(batch.id)
+                )
             else:
                 votes = []
                 vote_count = total_voters = 0
@@ -661,12 +789,7 @@ class MessageHandler(MessageHandlerInterface):
 
             # Try to edit the original results message if we have the message ID
             if batch.results_message_id:
-                edit_response = self.zulip_client.update_message(
-                    {
-                        "message_id": batch.results_message_id,
-                        "content": results_content,
-                    }
-                )
+                edit_response = self._edit_message(batch.results_message_id, results_content)
 
                 if edit_response.get("result") == "success":
                     logger.info(
@@ -703,14 +826,7 @@ class MessageHandler(MessageHandlerInterface):
         """
         topic_name = f"Refinement: {batch.date} ({len(batch.issues)} issues)"
 
-        response = self.zulip_client.send_message(
-            {
-                "type": "stream",
-                "to": self.config.stream_name,
-                "topic": topic_name,
-                "content": results_content,
-            }
-        )
+        response = self._send_to_stream(topic_name, results_content)
 
         if response.get("result") == "success":
             logger.info(
@@ -725,6 +841,24 @@ class MessageHandler(MessageHandlerInterface):
                 response=response,
             )
 
+    @staticmethod
+    def _format_vote_summary(estimates: dict[str, int], abstentions: list[str]) -> str:
+        """Format submitted estimates and abstentions for a confirmation reply.
+
+        Args:
+            estimates: Submitted estimates by issue number
+            abstentions: Issue numbers abstained from
+
+        Returns:
+            Comma-separated summary, e.g. "#1234: 5, #1235: abstain"
+        """
+        return ", ".join(
+            chain(
+                (f"#{issue}: {points}" for issue, points in estimates.items()),
+                (f"#{issue}: abstain" for issue in abstentions),
+            )
+        )
+
     def is_vote_format(self, content: str) -> bool:
         """Check if content looks like a vote submission.
 
@@ -734,6 +868,10 @@ class MessageHandler(MessageHandlerInterface):
         Returns:
             True if content appears to be in vote format
         """
+        # Every vote is "#<issue>: <points>", so most chat messages are rejected here
+        if "#" not in content or ":" not in content:
+            return False
+
         if self.is_proxy_vote_format(content):
             return False
 
@@ -748,8 +886,7 @@ class MessageHandler(MessageHandlerInterface):
         elif "`" in processed_content:
             return False
 
-        vote_pattern = re.compile(r"#\d+:\s*\d+")
-        return bool(vote_pattern.search(processed_content))
+        return _VOTE_PATTERN.search(processed_content) is not None
 
     def is_proxy_vote_format(self, content: str) -> bool:
         """Check if content looks like a proxy vote submission.
@@ -760,8 +897,7 @@ class MessageHandler(MessageHandlerInterface):
         Returns:
             True if content appears to be in proxy vote format
         """
-        proxy_vote_pattern = re.compile(r"vote\s+for\s+", re.IGNORECASE)
-        return bool(proxy_vote_pattern.search(content))
+        return _PROXY_VOTE_PREFIX.search(content) is not None
 
     def handle_proxy_vote(self, message: dict[str, Any], content: str) -> None:
         """Handle proxy vote submission from facilitator.
@@ -800,16 +936,7 @@ class MessageHandler(MessageHandlerInterface):
                 self.voting_service.submit_votes(vote_content, target_voter, active_batch)
             )
 
-            parts = []
-            if estimates:
-                vote_summary = ", ".join(
-                    [f"#{issue}: {points}" for issue, points in estimates.items()]
-                )
-                parts.append(f"Estimates: {vote_summary}")
-
-            if abstentions:
-                abstention_summary = ", ".join([f"#{issue}: abstain" for issue in abstentions])
-                parts.append(f"Abstentions: {abstention_summary}")
+            vote_summary = self._format_vote_summary(estimates, abstentions)
 
             if has_updates:
                 action_msg = f"**Proxy votes updated successfully for {target_voter}!**"
@@ -850,10 +977,7 @@ class MessageHandler(MessageHandlerInterface):
         Returns:
             Tuple of (target_voter, vote_content) or (None, None) if invalid
         """
-        import re
-
-        proxy_pattern = re.compile(r"vote\s+for\s+(.+?)\s+`?(#\d+:\s*\d+.*?)`?$", re.IGNORECASE)
-        match = proxy_pattern.match(content.strip())
+        match = _PROXY_VOTE.match(content.strip())
 
         if not match:
             return None, None
@@ -868,6 +992,55 @@ class MessageHandler(MessageHandlerInterface):
     def _send_reply(self, message: dict[str, Any], content: str) -> None:
         """Send a reply to a message.
 
+        With background replies enabled the reply is queued for the sender thread; it is
+        delivered inline if the queue is full.
+
+        Args:
+            message: Original message to reply to
+            content: Reply content
+        """
+        deliver = partial(self._deliver_reply, message, content)
+        if self.background_replies:
+            self._run_in_background(deliver)
+        else:
+            deliver()
+
+    def _run_in_background(self, call: Callable[[], None]) -> None:
+        """Queue a Zulip call for the sender thread, running it inline if that's not possible.
+
+        Calls are delivered in the order they were queued.
+
+        Args:
+            call: Zero-argument callable that performs the request and handles its errors
+        """
+        if self._send_queue is not None:
+            try:
+                self._send_queue.put_nowait(call)
+                return
+            except queue.Full:
+                logger.warning("Send queue full, sending inline")
+        call()
+
+    def _run_sender(self, send_queue: queue.Queue[Callable[[], None] | None]) -> None:
+        """Run queued Zulip calls until a stop sentinel is received.
+
+        Args:
+            send_queue: Queue of zero-argument calls
+        """
+        while True:
+            item = send_queue.get()
+            try:
+                if item is None:
+                    return
+                item()
+            except Exception as e:
+                logger.error("Background Zulip call failed", error=str(e))
+            finally:
+                send_queue.task_done()
+
+    def _deliver_reply(self, message: dict[str, Any], content: str) -> None:
+        """Send a private reply to the sender of a message.
+
         Args:
             message: Original message to reply to
             content: Reply content
@@ -892,6 +1065,37 @@ class MessageHandler(MessageHandlerInterface):
         except Exception as e:
             logger.error("Failed to send reply", error=str(e))
 
+    def _send_to_stream(self, topic: str, content: str) -> dict[str, Any]:
+        """Post a message to a topic in the refinement stream.
+
+        Args:
+            topic: Topic name
+            content: Message content
+
+        Returns:
+            The Zulip API response
+        """
+        return self.zulip_client.send_message(
+            {
+                "type": "stream",
+                "to": self.config.stream_name,
+                "topic": topic,
+                "content": content,
+            }
+        )
+
+    def _edit_message(self, message_id: int | None, content: str) -> dict[str, Any]:
+        """Replace the content of a previously posted message.
+
+        Args:
+            message_id: Zulip message ID to edit
+            content: New message content
+
+        Returns:
+            The Zulip API response
+        """
+        return self.zulip_client.update_message({"message_id": message_id, "content": content})
+
     def _send_batch_confirmation(
         self, message: dict[str, Any], issues: list[IssueData], deadline: datetime, batch_id: int
     ) -> None:
@@ -903,12 +1107,13 @@ class MessageHandler(MessageHandlerInterface):
             deadline: Batch deadline
             batch_id: Database batch ID
         """
-        issue_list = self._format_issue_list(issues)
+        issue_list = self._format_issue_list(issues, batch_id)
+        issue_count = len(issues)
 
         current_date = datetime.now(UTC).strftime("%Y-%m-%d")
-        confirmation = f"""✅ **Batch created: {len(issues)} issues**
+        confirmation = f"""✅ **Batch created: {issue_count} issues**
 📅 **Deadline**: {self.business_hours_calc.format_business_deadline(deadline)}
-🎯 **Topic**: Refinement: {current_date} ({len(issues)} issues)
+🎯 **Topic**: Refinement: {current_date} ({issue_count} issues)
 
 **Issues:**
 {issue_list}
@@ -932,60 +1137,32 @@ Posting to #{self.config.stream_name} now..."""
             deadline: Batch deadline
             facilitator: Facilitator name
         """
-        issue_list = self._format_issue_list(issues)
-
         batch_voters = self.batch_service.database.get_batch_voters(batch_id)
-        voter_mentions = ", ".join([f"@**{voter}**" for voter in batch_voters])
-
-        fibonacci_numbers = [1, 2, 3, 5, 8, 13, 21]
-        example_parts = []
-        for issue in issues:
-            random_fib = random.choice(fibonacci_numbers)  # nosec B311
-            example_parts.append(f"#{issue.issue_number}: {random_fib}")
-        example_format = ", ".join(example_parts)
-
-        deadline_str = self.business_hours_calc.format_business_deadline(deadline)
-        hours_text = (
-            f"({self.config.default_deadline_hours} hours from now excluding weekends/holidays)"
+        voter_mentions = ", ".join(f"@**{voter}**" for voter in batch_voters)
+
+        topic_content = self._render_batch_content(
+            batch_id,
+            issues,
+            deadline,
+            facilitator,
+            voter_mentions,
+            0,
+            len(batch_voters),
+            randomize_example=True,
         )
 
-        topic_content = f"""**📦 BATCH REFINEMENT**
-**Stories**:
-{issue_list}
-
-**Deadline**: {deadline_str} {hours_text}
-**Facilitator**: @**{facilitator}**
-
-**How to estimate**:
-1. Review issues in GitHub
-2. Consider complexity, unknowns, dependencies for each
-3. DM @**Refinement Bot** your story point estimates in this format:
-   `{example_format}`
-4. Use scale: 1, 2, 3, 5, 8, 13, 21
-
-**Voters needed**: {voter_mentions}
-
-**Status**: ⏳ Collecting estimates (0/{len(batch_voters)} received)
-
-*Will reveal results here once all votes are in*"""
-
         # Use current date for topic name (when refinement starts, not deadline)
         current_date = datetime.now(UTC).strftime("%Y-%m-%d")
         topic_name = f"Refinement: {current_date} ({len(issues)} issues)"
 
         try:
-            response = self.zulip_client.send_message(
-                {
-                    "type": "stream",
-                    "to": self.config.stream_name,
-                    "topic": topic_name,
-                    "content": topic_content,
-                }
-            )
+            response = self._send_to_stream(topic_name, topic_content)
 
             if response.get("result") == "success" and "id" in response:
                 message_id = response["id"]
                 self.batch_service.database.update_batch_message_id(batch_id, message_id)
+                with self._edit_lock:
+                    self._last_rendered[batch_id] = topic_content
                 logger.info(
                     "Created batch topic",
                     batch_id=batch_id,
@@ -1002,64 +1179,236 @@ Posting to #{self.config.stream_name} now..."""
         except Exception as e:
             logger.error("Failed to create batch topic", batch_id=batch_id, error=str(e))
 
+    def _render_batch_content(
+        self,
+        batch_id: int,
+        issues: list[IssueData],
+        deadline: datetime,
+        facilitator: str,
+        voter_mentions: str,
+        vote_count: int,
+        total_voters: int,
+        randomize_example: bool = False,
+    ) -> str:
+        """Render the batch refinement message body.
+
+        The stories, deadline and instructions don't change while votes are collected, so
+        they are rendered once per batch and reused; only the voter and status lines are
+        rendered on every call.
+
+        Args:
+            batch_id: Database batch ID
+            issues: List of issues
+            deadline: Batch deadline
+            facilitator: Facilitator name
+            voter_mentions: Formatted mentions of voters still expected to vote
+            vote_count: Number of voters who have voted
+            total_voters: Total number of voters expected
+            randomize_example: Use random points in the example vote format
+
+        Returns:
+            Batch message content
+        """
+        with self._edit_lock:
+            preamble = self._batch_content_prefix.get(batch_id)
+        if preamble is None:
+            if randomize_example:
+                points = random.choices(_FIBONACCI, k=len(issues))  # nosec B311
+            else:
+                points = [_FIBONACCI[i % len(_FIBONACCI)] for i in range(len(issues))]
+            example_format = ", ".join(
+                f"#{issue.issue_number}: {point}"
+                for issue, point in zip(issues, points, strict=True)
+            )
+
+            preamble = self._render_preamble(
+                batch_id, issues, deadline, facilitator, example_format
+            )
+            with self._edit_lock:
+                self._batch_content_prefix[batch_id] = preamble
+
+        return _BATCH_MESSAGE.substitute(
+            header="**📦 BATCH REFINEMENT**",
+            preamble=preamble,
+            voter_mentions=voter_mentions,
+            status=f"⏳ Collecting estimates ({vote_count}/{total_voters} received)",
+            footer="Will reveal results here once all votes are in",
+        )
+
+    def _render_preamble(
+        self,
+        batch_id: int,
+        issues: list[IssueData],
+        deadline: datetime,
+        facilitator: str,
+        example_format: str,
+    ) -> str:
+        """Render the stories, deadline and instructions shared by every batch message.
+
+        Args:
+            batch_id: Database batch ID
+            issues: List of issues
+            deadline: Batch deadline
+            facilitator: Facilitator name
+            example_format: Example vote line shown in the instructions
+
+        Returns:
+            Preamble content, ending with a blank line
+        """
+        hours_text = (
+            f"({self.config.default_deadline_hours} hours from now excluding weekends/holidays)"
+        )
+        return _BATCH_PREAMBLE.substitute(
+            issue_list=self._format_issue_list(issues, batch_id),
+            deadline=self.business_hours_calc.format_business_deadline(deadline),
+            hours_text=hours_text,
+            facilitator=facilitator,
+            example_format=example_format,
+        )
+
     def _update_batch_message(self, batch_id: int, active_batch: BatchData) -> None:
         """Update the batch refinement message with current vote count.
 
+        With a non-zero edit debounce, updates arriving within the debounce window are
+        coalesced into a single edit that renders the latest state.
+
         Args:
             batch_id: ID of the batch to update
             active_batch: Batch data
         """
-        try:
-            if not active_batch.message_id:
-                logger.warning("Cannot update batch message: no message ID", batch_id=batch_id)
+        if self.edit_debounce_seconds <= 0:
+            self._edit_batch_message(batch_id, active_batch)
+            return
+
+        with self._edit_lock:
+            self._pending_state[batch_id] = active_batch
+            if batch_id in self._pending_edits:
                 return
+            timer = threading.Timer(
+                self.edit_debounce_seconds, self._flush_batch_message, args=(batch_id,)
+            )
+            timer.daemon = True
+            self._pending_edits[batch_id] = timer
+        timer.start()
 
-            vote_count, total_voters, _ = self.voting_service.check_completion_status(batch_id)
+    def _flush_batch_message(self, batch_id: int) -> None:
+        """Apply the pending edit for a batch, if any.
 
-            deadline = datetime.fromisoformat(active_batch.deadline)
-            issue_list = self._format_issue_list(active_batch.issues)
-            voter_mentions = self._format_voter_mentions(batch_id)
+        Args:
+            batch_id: ID of the batch to update
+        """
+        with self._edit_lock:
+            timer = self._pending_edits.pop(batch_id, None)
+            active_batch = self._pending_state.pop(batch_id, None)
+        if timer is not None:
+            timer.cancel()
+        if active_batch is not None:
+            self._edit_batch_message(batch_id, active_batch)
 
-            fibonacci_numbers = [1, 2, 3, 5, 8, 13, 21]
-            example_parts = []
-            for i, issue in enumerate(active_batch.issues):
-                random_fib = fibonacci_numbers[i % len(fibonacci_numbers)]
-                example_parts.append(f"#{issue.issue_number}: {random_fib}")
-            example_format = ", ".join(example_parts)
+    def _cancel_pending_edit(self, batch_id: int) -> None:
+        """Drop a pending edit so it cannot overwrite a newer batch status.
 
-            deadline_str = self.business_hours_calc.format_business_deadline(deadline)
-            hours_text = (
-                f"({self.config.default_deadline_hours} hours from now excluding weekends/holidays)"
-            )
+        Args:
+            batch_id: ID of the batch
+        """
+        with self._edit_lock:
+            timer = self._pending_edits.pop(batch_id, None)
+            self._pending_state.pop(batch_id, None)
+        if timer is not None:
+            timer.cancel()
 
-            topic_content = f"""**📦 BATCH REFINEMENT**
-**Stories**:
-{issue_list}
+    def _end_vote_collection(self, batch_id: int) -> None:
+        """Drop pending edits and cached renders for a batch that stopped collecting votes.
 
-**Deadline**: {deadline_str} {hours_text}
-**Facilitator**: @**{active_batch.facilitator}**
+        A progress edit that is already running is waited for, so it can't re-add the
+        cached renders or land after the batch's new status.
 
-**How to estimate**:
-1. Review issues in GitHub
-2. Consider complexity, unknowns, dependencies for each
-3. DM @**Refinement Bot** your story point estimates in this format:
-   `{example_format}`
-4. Use scale: 1, 2, 3, 5, 8, 13, 21
+        Args:
+            batch_id: ID of the batch
+        """
+        self._cancel_pending_edit(batch_id)
+        with self._progress_edit_lock, self._edit_lock:
+            self._batch_content_prefix.pop(batch_id, None)
+            self._last_rendered.pop(batch_id, None)
 
-**Voters needed**: {voter_mentions}
+    def _forget_batch(self, batch_id: int) -> None:
+        """Drop all per-batch state once the batch message won't be rendered again.
 
-**Status**: ⏳ Collecting estimates ({vote_count}/{total_voters} received)
+        Args:
+            batch_id: ID of the batch
+        """
+        self._end_vote_collection(batch_id)
+        with self._edit_lock:
+            self._status_preamble_cache.pop(batch_id, None)
+            self._issue_list_cache.pop(batch_id, None)
+
+    def flush_pending_edits(self) -> None:
+        """Apply all pending batch message edits immediately."""
+        with self._edit_lock:
+            batch_ids = list(self._pending_edits)
+        for batch_id in batch_ids:
+            self._flush_batch_message(batch_id)
+
+    def close(self) -> None:
+        """Apply pending edits, deliver queued replies and results, and stop the call pool."""
+        self.flush_pending_edits()
+        if self._send_queue is not None and self._sender_thread is not None:
+            self._send_queue.put(None)
+            self._sender_thread.join()
+            self._send_queue = None
+            self._sender_thread = None
+        if self._zulip_executor is not None:
+            self._zulip_executor.shutdown()
+            self._zulip_executor = None
+
+    def _edit_batch_message(self, batch_id: int, active_batch: BatchData) -> None:
+        """Edit the batch refinement message to show the current vote count.
 
-*Will reveal results here once all votes are in*"""
+        Args:
+            batch_id: ID of the batch to update
+            active_batch: Batch data
+        """
+        with self._progress_edit_lock:
+            self._apply_progress_edit(batch_id, active_batch)
 
-            edit_response = self.zulip_client.update_message(
-                {
-                    "message_id": active_batch.message_id,
-                    "content": topic_content,
-                }
+    def _apply_progress_edit(self, batch_id: int, active_batch: BatchData) -> None:
+        """Render and send a progress edit; called with the progress edit lock held.
+
+        Args:
+            batch_id: ID of the batch to update
+            active_batch: Batch data
+        """
+        try:
+            if not active_batch.message_id:
+                logger.warning("Cannot update batch message: no message ID", batch_id=batch_id)
+                return
+
+            vote_count, total_voters, remaining_voters = self.voting_service.get_voting_progress(
+                batch_id
+            )
+
+            voter_mentions = ", ".join(f"@**{voter}**" for voter in remaining_voters)
+            topic_content = self._render_batch_content(
+                batch_id,
+                active_batch.issues,
+                active_batch.deadline_dt,
+                active_batch.facilitator,
+                voter_mentions,
+                vote_count,
+                total_voters,
             )
 
+            with self._edit_lock:
+                unchanged = self._last_rendered.get(batch_id) == topic_content
+            if unchanged:
+                logger.debug("Batch message unchanged, skipping edit", batch_id=batch_id)
+                return
+
+            edit_response = self._edit_message(active_batch.message_id, topic_content)
+
             if edit_response.get("result") == "success":
+                with self._edit_lock:
+                    self._last_rendered[batch_id] = topic_content
                 logger.info(
                     "Batch message updated successfully",
                     batch_id=batch_id,
@@ -1094,23 +1443,12 @@ Posting to #{self.config.stream_name} now..."""
         try:
             topic_name = f"Refinement: {active_batch.date} ({len(active_batch.issues)} issues)"
 
-            status_content = f"""📊 **Voting Progress Update**
-
-**Status**: ⏳ Collecting estimates ({vote_count}/{total_voters} received)
-
-{vote_count}/{total_voters} team members have submitted their estimates. Still waiting for votes from remaining members.
-
-*This update was posted because the original message could no longer be edited.*"""
-
-            response = self.zulip_client.send_message(
-                {
-                    "type": "stream",
-                    "to": self.config.stream_name,
-                    "topic": topic_name,
-                    "content": status_content,
-                }
+            status_content = _FALLBACK_STATUS.substitute(
+                vote_count=vote_count, total_voters=total_voters
             )
 
+            response = self._send_to_stream(topic_name, status_content)
+
             if response.get("result") == "success":
                 logger.info(
                     "Posted fallback status update",
@@ -1169,21 +1507,24 @@ Posting to #{self.config.stream_name} now..."""
             logger.error("Cannot process batch completion: batch ID is None after retrieval")
             return
 
+        # A queued progress edit must not overwrite the completion/discussion status
+        self._end_vote_collection(batch.id)
+
         try:
-            votes = self.voting_service.get_batch_votes(batch.id)
-            vote_count, total_voters, _ = self.voting_service.check_completion_status(batch.id)
+            votes, vote_count, total_voters, batch_voters = (
+                self.voting_service.get_votes_and_status(batch.id)
+            )
 
             # Generate and post initial results
-            results_content = self.results_service.generate_results_content(
-                batch,
-                votes,
-                vote_count,
-                total_voters,
-                self.batch_service.database.get_batch_voters(batch.id),
+            results_content, has_discussion_issues = self.results_service.generate_results(
+                batch, votes, vote_count, total_voters, batch_voters
             )
 
-            # Check if there are discussion issues
-            has_discussion_issues = "⚠️ **DISCUSSION NEEDED**" in results_content
+            # Voters without any votes, from the snapshot instead of another query
+            voted = {vote.voter for vote in votes}
+            voter_mentions = ", ".join(
+                f"@**{voter}**" for voter in batch_voters if voter not in voted
+            )
 
             if has_discussion_issues:
                 # Move to discussion phase instead of completing
@@ -1202,11 +1543,28 @@ Posting to #{self.config.stream_name} now..."""
                         raise
 
                 # Update original message to show discussion phase (only if we started it)
+                # while posting initial results with discussion items (always post results)
+                calls = [
+                    partial(
+                        self._post_estimation_results,
+                        batch,
+                        votes,
+                        vote_count,
+                        total_voters,
+                        results_content,
+                    )
+                ]
                 if not batch_already_processed:
-                    self._update_batch_discussion_status(batch, vote_count, total_voters)
-
-                # Post initial results with discussion items (always post results)
-                self._post_estimation_results(batch, votes, vote_count, total_voters)
+                    calls.append(
+                        partial(
+                            self._update_batch_discussion_status,
+                            batch,
+                            vote_count,
+                            total_voters,
+                            voter_mentions=voter_mentions,
+                        )
+                    )
+                self._post_batch_results(calls)
 
                 logger.info(
                     "Batch moved to discussion phase",
@@ -1216,38 +1574,50 @@ Posting to #{self.config.stream_name} now..."""
                 )
             else:
                 consensus_estimates = self._extract_consensus_estimates(batch, votes)
+                final_estimates = {
+                    issue_number: (points, "Consensus reached during initial voting")
+                    for issue_number, points in consensus_estimates.items()
+                }
 
-                for issue_number, points in consensus_estimates.items():
-                    self.batch_service.database.store_final_estimate(
-                        batch.id, issue_number, points, "Consensus reached during initial voting"
-                    )
+                self.batch_service.database.store_final_estimates(
+                    batch.id,
+                    (
+                        (issue_number, points, rationale)
+                        for issue_number, (points, rationale) in final_estimates.items()
+                    ),
+                )
 
+                # A manual "complete" has already made the transition before calling here
                 batch_already_completed = False
-                try:
-                    self.batch_service.complete_batch(batch.id, batch.facilitator)
-                except BatchError as e:
-                    if "No active batch found" in str(e):
+                if batch.status != "completed":
+                    try:
+                        batch = self.batch_service.complete_batch(batch.id, batch.facilitator)
+                    except BatchError as e:
+                        if "No active batch" not in str(e):
+                            raise
                         logger.warning(
                             "Batch already completed by another request, will still post results",
                             batch_id=batch.id,
                             error=str(e),
                         )
                         batch_already_completed = True
-                    else:
-                        raise
 
+                calls = [
+                    partial(self._post_finish_results, batch, final_estimates, consensus_estimates)
+                ]
                 if not batch_already_completed:
-                    self._update_batch_completion_status(
-                        batch, vote_count, total_voters, auto_completed
+                    calls.append(
+                        partial(
+                            self._update_batch_completion_status,
+                            batch,
+                            vote_count,
+                            total_voters,
+                            auto_completed,
+                            voter_mentions=voter_mentions,
+                        )
                     )
 
-                final_estimates = {
-                    issue_number: (points, "Consensus reached during initial voting")
-                    for issue_number, points in consensus_estimates.items()
-                }
-
-                batch.status = "completed"
-                self._post_finish_results(batch, final_estimates)
+                self._post_batch_results(calls)
 
                 logger.info(
                     "Batch auto-completed with full consensus",
@@ -1261,8 +1631,88 @@ Posting to #{self.config.stream_name} now..."""
         except Exception as e:
             logger.error("Error processing batch completion", batch_id=batch.id, error=str(e))
 
+    def _post_batch_results(self, calls: list[Callable[[], None]]) -> None:
+        """Post a batch's results and status edit, in the background if enabled.
+
+        Both requests go through the handler's shared Zulip call pool.
+
+        Args:
+            calls: Zero-argument callables that each perform one Zulip request
+        """
+        post = partial(self._run_zulip_calls, calls)
+        if self.background_results:
+            self._run_in_background(post)
+        else:
+            post()
+
+    def _run_zulip_calls(self, calls: list[Callable[[], None]]) -> None:
+        """Run independent Zulip round-trips concurrently on the handler's executor.
+
+        The results post and the batch message edit touch different messages, so
+        their request latencies can overlap. Each call handles its own errors.
+
+        Args:
+            calls: Zero-argument callables that each perform one Zulip request
+        """
+        executor = self._zulip_executor
+        if len(calls) < 2 or executor is None:
+            for call in calls:
+                call()
+            return
+
+        for future in [executor.submit(call) for call in calls]:
+            future.result()
+
+    def _render_batch_status_message(
+        self,
+        batch: BatchData,
+        header: str,
+        status: str,
+        footer: str,
+        voter_mentions: str | None = None,
+    ) -> str:
+        """Render the batch message for a phase after vote collection.
+
+        The stories, deadline and instructions are shared by the completion and
+        discussion variants and are rendered once per batch.
+
+        Args:
+            batch: The batch data (must have an ID)
+            header: Heading line naming the phase
+            status: Text of the status line
+            footer: Closing italic note
+            voter_mentions: Mentions of voters who haven't voted, looked up if not given
+
+        Returns:
+            Batch message content
+        """
+        batch_id = cast(int, batch.id)
+        with self._edit_lock:
+            preamble = self._status_preamble_cache.get(batch_id)
+        if preamble is None:
+            preamble = self._render_preamble(
+                batch_id, batch.issues, batch.deadline_dt, batch.facilitator, batch.example_format
+            )
+            with self._edit_lock:
+                self._status_preamble_cache[batch_id] = preamble
+
+        return _BATCH_MESSAGE.substitute(
+            header=header,
+            preamble=preamble,
+            voter_mentions=(
+                self._format_voter_mentions(batch_id) if voter_mentions is None else voter_mentions
+            ),
+            status=status,
+            footer=footer,
+        )
+
     def _update_batch_completion_status(
-        self, batch: BatchData, vote_count: int, total_voters: int, auto_completed: bool = False
+        self,
+        batch: BatchData,
+        vote_count: int,
+        total_voters: int,
+        auto_completed: bool = False,
+        voter_mentions: str | None = None,
     ) -> None:
         """Update the original batch message to show completion status.
 
@@ -1271,72 +1721,31 @@ Posting to #{self.config.stream_name} now..."""
             vote_count: Number of voters who submitted votes
             total_voters: Total number of expected voters
             auto_completed: True if completed automatically due to all votes received
+            voter_mentions: Mentions of voters who haven't voted, if already known
         """
         if not batch.message_id:
             logger.warning("Cannot update completion status: no message ID", batch_id=batch.id)
             return
 
         try:
-            deadline = datetime.fromisoformat(batch.deadline)
-            issue_list = self._format_issue_list(batch.issues)
-
             if batch.id is None:
                 logger.error("Cannot get batch voters: batch ID is None")
                 return
-            voter_mentions = self._format_voter_mentions(batch.id)
 
             # Determine completion reason
             completion_reason = "All votes received" if auto_completed else "Deadline reached"
 
-            # Create example format string
-            example_issues = [
-                batch.issues[0].issue_number,
-                (
-                    batch.issues[1].issue_number
-                    if len(batch.issues) > 1
-                    else batch.issues[0].issue_number
-                ),
-                (
-                    batch.issues[2].issue_number
-                    if len(batch.issues) > 2
-                    else batch.issues[0].issue_number
-                ),
-            ]
-            example_format = (
-                f"#{example_issues[0]}: 5, #{example_issues[1]}: 8, #{example_issues[2]}: 3"
-            )
-
-            deadline_str = self.business_hours_calc.format_business_deadline(deadline)
-            hours_text = (
-                f"({self.config.default_deadline_hours} hours from now excluding weekends/holidays)"
+            completed_content = self._render_batch_status_message(
+                batch,
+                header=f"**📦 BATCH REFINEMENT - COMPLETED** ({completion_reason})",
+                status=f"✅ Vote complete ({vote_count}/{total_voters} received)",
+                footer="Results posted below",
+                voter_mentions=voter_mentions,
             )
+            # Completion is the batch message's final state
+            self._forget_batch(batch.id)
 
-            completed_content = f"""**📦 BATCH REFINEMENT - COMPLETED** ({completion_reason})
-**Stories**:
-{issue_list}
-
-**Deadline**: {deadline_str} {hours_text}
-**Facilitator**: @**{batch.facilitator}**
-
-**How to estimate**:
-1. Review issues in GitHub
-2. Consider complexity, unknowns, dependencies for each
-3. DM @**Refinement Bot** your story point estimates in this format:
-   `{example_format}`
-4. Use scale: 1, 2, 3, 5, 8, 13, 21
-
-**Voters needed**: {voter_mentions}
-
-**Status**: ✅ Vote complete ({vote_count}/{total_voters} received)
-
-*Results posted below*"""
-
-            edit_response = self.zulip_client.update_message(
-                {
-                    "message_id": batch.message_id,
-                    "content": completed_content,
-                }
-            )
+            edit_response = self._edit_message(batch.message_id, completed_content)
 
             if edit_response.get("result") == "success":
                 logger.info(
@@ -1355,7 +1764,11 @@ Posting to #{self.config.stream_name} now..."""
             logger.error("Error updating batch completion status", batch_id=batch.id, error=str(e))
 
     def _update_batch_discussion_status(
-        self, batch: BatchData, vote_count: int, total_voters: int
+        self,
+        batch: BatchData,
+        vote_count: int,
+        total_voters: int,
+        voter_mentions: str | None = None,
     ) -> None:
         """Update the original batch message to show discussion phase status.
 
@@ -1363,69 +1776,29 @@ Posting to #{self.config.stream_name} now..."""
             batch: The batch data
             vote_count: Number of voters who submitted votes
             total_voters: Total number of expected voters
+            voter_mentions: Mentions of voters who haven't voted, if already known
         """
         if not batch.message_id:
             logger.warning("Cannot update discussion status: no message ID", batch_id=batch.id)
             return
 
         try:
-            deadline = datetime.fromisoformat(batch.deadline)
-            issue_list = self._format_issue_list(batch.issues)
-
             if batch.id is None:
                 logger.error("Cannot get batch voters: batch ID is None")
                 return
-            voter_mentions = self._format_voter_mentions(batch.id)
 
-            # Create example format string
-            example_issues = [
-                batch.issues[0].issue_number,
-                (
-                    batch.issues[1].issue_number
-                    if len(batch.issues) > 1
-                    else batch.issues[0].issue_number
-                ),
-                (
-                    batch.issues[2].issue_number
-                    if len(batch.issues) > 2
-                    else batch.issues[0].issue_number
+            discussion_content = self._render_batch_status_message(
+                batch,
+                header="**📦 BATCH REFINEMENT - DISCUSSION PHASE** 🗣️",
+                status=(
+                    "🗣️ Discussion phase - some issues need clarification "
+                    f"({vote_count}/{total_voters} votes received)"
                 ),
-            ]
-            example_format = (
-                f"#{example_issues[0]}: 5, #{example_issues[1]}: 8, #{example_issues[2]}: 3"
-            )
-
-            deadline_str = self.business_hours_calc.format_business_deadline(deadline)
-            hours_text = (
-                f"({self.config.default_deadline_hours} hours from now excluding weekends/holidays)"
+                footer="Initial results posted below - discussion needed for some items",
+                voter_mentions=voter_mentions,
             )
 
-            discussion_content = f"""**📦 BATCH REFINEMENT - DISCUSSION PHASE** 🗣️
-**Stories**:
-{issue_list}
-
-**Deadline**: {deadline_str} {hours_text}
-**Facilitator**: @**{batch.facilitator}**
-
-**How to estimate**:
-1. Review issues in GitHub
-2. Consider complexity, unknowns, dependencies for each
-3. DM @**Refinement Bot** your story point estimates in this format:
-   `{example_format}`
-4. Use scale: 1, 2, 3, 5, 8, 13, 21
-
-**Voters needed**: {voter_mentions}
-
-**Status**: 🗣️ Discussion phase - some issues need clarification ({vote_count}/{total_voters} votes received)
-
-*Initial results posted below - discussion needed for some items*"""
-
-            edit_response = self.zulip_client.update_message(
-                {
-                    "message_id": batch.message_id,
-                    "content": discussion_content,
-                }
-            )
+            edit_response = self._edit_message(batch.message_id, discussion_content)
 
             if edit_response.get("result") == "success":
                 logger.info(
@@ -1444,28 +1817,37 @@ Posting to #{self.config.stream_name} now..."""
             logger.error("Error updating batch discussion status", batch_id=batch.id, error=str(e))
 
     def _post_finish_results(
-        self, batch: BatchData, final_estimates_input: dict[str, tuple[int, str]]
+        self,
+        batch: BatchData,
+        final_estimates_input: dict[str, tuple[int, str]],
+        consensus_estimates: dict[str, int] | None = None,
     ) -> None:
         """Post final results after discussion is complete.
 
         Args:
             batch: Batch data
             final_estimates_input: Dict of issue_number -> (points, rationale)
+            consensus_estimates: Consensus from the original votes, if already known
         """
         try:
             if not batch.id:
                 logger.error("Cannot post discussion results: batch ID is None")
                 return
 
-            # Get consensus estimates from original voting
-            votes = self.voting_service.get_batch_votes(batch.id)
-
-            # Analyze original votes to get consensus items
-            consensus_estimates = self._extract_consensus_estimates(batch, votes)
+            if consensus_estimates is None:
+                # Analyze original votes to get consensus items
+                votes = self.voting_service.get_batch_votes(batch.id)
+                consensus_estimates = self._extract_consensus_estimates(batch, votes)
 
-            # Convert final estimates input to FinalEstimate objects
+            # Convert final estimates input to FinalEstimate objects, all finalized now
+            finalized_at = datetime.now(UTC)
             final_estimates = [
-                FinalEstimate(issue_number=issue_num, final_points=points, rationale=rationale)
+                FinalEstimate(
+                    issue_number=issue_num,
+                    final_points=points,
+                    rationale=rationale,
+                    timestamp=finalized_at,
+                )
                 for issue_num, (points, rationale) in final_estimates_input.items()
             ]
 
@@ -1477,14 +1859,7 @@ Posting to #{self.config.stream_name} now..."""
             # Post to the same topic
             topic_name = f"Refinement: {batch.date} ({len(batch.issues)} issues)"
 
-            response = self.zulip_client.send_message(
-                {
-                    "type": "stream",
-                    "to": self.config.stream_name,
-                    "topic": topic_name,
-                    "content": results_content,
-                }
-            )
+            response = self._send_to_stream(topic_name, results_content)
 
             if response.get("result") == "success":
                 logger.info(
@@ -1514,38 +1889,41 @@ Posting to #{self.config.stream_name} now..."""
         Returns:
             Dict of issue_number -> consensus_points for issues that had consensus
         """
-        from collections import Counter
+        if not votes:
+            # e.g. a deadline expiry where nobody voted
+            return {}
 
-        # Group votes by issue
-        votes_by_issue: dict[str, list] = {}
+        # Tally points per issue in a single pass over the votes
+        points_by_issue: defaultdict[str, Counter[int]] = defaultdict(Counter)
         for vote in votes:
-            if vote.issue_number not in votes_by_issue:
-                votes_by_issue[vote.issue_number] = []
-            votes_by_issue[vote.issue_number].append(vote)
+            points_by_issue[vote.issue_number][vote.points] += 1
 
         consensus_estimates = {}
 
         # Process each issue to find consensus
         for issue in batch.issues:
-            issue_votes = votes_by_issue.get(issue.issue_number, [])
-            if not issue_votes:
+            if issue.issue_number not in points_by_issue:
                 continue
+            estimate_counts = points_by_issue[issue.issue_number]
 
-            estimates = [vote.points for vote in issue_votes]
-            estimates.sort()
-
-            # Analyze consensus
-            estimate_counts = Counter(estimates)
-            most_common_value, most_common_count = estimate_counts.most_common(1)[0]
-            total_votes = len(estimates)
+            if len(estimate_counts) == 1:
+                # Unanimous
+                consensus_estimates[issue.issue_number] = next(iter(estimate_counts))
+                continue
 
-            if most_common_count > total_votes * 0.5:
-                consensus_estimates[issue.issue_number] = most_common_value
+            top_value, top_count = max(estimate_counts.items(), key=itemgetter(1))
+            if top_count > estimate_counts.total() * 0.5:
+                consensus_estimates[issue.issue_number] = top_value
 
         return consensus_estimates
 
     def _post_estimation_results(
-        self, batch: BatchData, votes: list, vote_count: int, total_voters: int
+        self,
+        batch: BatchData,
+        votes: list,
+        vote_count: int,
+        total_voters: int,
+        results_content: str | None = None,
     ) -> None:
         """Post detailed estimation results to the stream.
 
@@ -1554,26 +1932,21 @@ Posting to #{self.config.stream_name} now..."""
             votes: All votes for the batch
             vote_count: Number of voters who submitted votes
             total_voters: Total number of expected voters
+            results_content: Already generated results, if available
         """
         try:
-            batch_voters = (
-                self.batch_service.database.get_batch_voters(batch.id) if batch.id else []
-            )
-            results_content = self.results_service.generate_results_content(
-                batch, votes, vote_count, total_voters, batch_voters
-            )
+            if results_content is None:
+                batch_voters = (
+                    self.batch_service.database.get_batch_voters(batch.id) if batch.id else []
+                )
+                results_content = self.results_service.generate_results_content(
+                    batch, votes, vote_count, total_voters, batch_voters
+                )
 
             # Post to the same topic
             topic_name = f"Refinement: {batch.date} ({len(batch.issues)} issues)"
 
-            response = self.zulip_client.send_message(
-                {
-                    "type": "stream",
-                    "to": self.config.stream_name,
-                    "topic": topic_name,
-                    "content": results_content,
-                }
-            )
+            response = self._send_to_stream(topic_name, results_content)
 
             if response.get("result") == "success":
                 # Store the results message ID for future updates
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
 from typing import Any
 
 from .models import BatchData, EstimationVote, FinalEstimate, IssueData, ParseResult
@@ -21,6 +23,9 @@ class GitHubAPIInterface(ABC):
 class DatabaseInterface(ABC):
     """Interface for database operations."""
 
+    @abstractmethod
+    def transaction(self) -> AbstractContextManager[None]: ...
+
     @abstractmethod
     def get_active_batch(self) -> BatchData | None: ...
 
@@ -41,6 +46,11 @@ class DatabaseInterface(ABC):
         self, batch_id: int, voter: str, issue_number: str, points: int
     ) -> tuple[bool, bool]: ...
 
+    @abstractmethod
+    def bulk_upsert_votes(
+        self, batch_id: int, voter: str, estimates: dict[str, int]
+    ) -> tuple[int, int]: ...
+
     @abstractmethod
     def get_batch_votes(self, batch_id: int) -> list[EstimationVote]: ...
 
@@ -50,6 +60,14 @@ class DatabaseInterface(ABC):
     @abstractmethod
     def get_completed_voters_count(self, batch_id: int) -> int: ...
 
+    @abstractmethod
+    def get_batch_voters_and_counts(self, batch_id: int) -> tuple[list[str], list[str], int]: ...
+
+    @abstractmethod
+    def get_batch_votes_and_voters(
+        self, batch_id: int
+    ) -> tuple[list[EstimationVote], list[str], int]: ...
+
     @abstractmethod
     def has_voter_voted(self, batch_id: int, voter: str) -> bool: ...
 
@@ -71,6 +89,16 @@ class DatabaseInterface(ABC):
     @abstractmethod
     def remove_voter_from_batch(self, batch_id: int, voter: str) -> bool: ...
 
+    @abstractmethod
+    def add_voters_to_batch(
+        self, batch_id: int, voters: list[str]
+    ) -> tuple[list[str], list[str]]: ...
+
+    @abstractmethod
+    def remove_voters_from_batch(
+        self, batch_id: int, voters: list[str]
+    ) -> tuple[list[str], list[str]]: ...
+
     @abstractmethod
     def set_batch_discussing(self, batch_id: int) -> None: ...
 
@@ -79,6 +107,11 @@ class DatabaseInterface(ABC):
         self, batch_id: int, issue_number: str, final_points: int, rationale: str
     ) -> None: ...
 
+    @abstractmethod
+    def store_final_estimates(
+        self, batch_id: int, estimates: Iterable[tuple[str, int, str]]
+    ) -> None: ...
+
     @abstractmethod
     def get_final_estimates(self, batch_id: int) -> list[FinalEstimate]: ...
 
@@ -1,20 +1,47 @@
 from __future__ import annotations
 
+import re
 import sqlite3
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import datetime
+from functools import cached_property
 from typing import Any
 
 import structlog
 
 logger = structlog.get_logger(__name__)
 
+# ALTER TABLE ... DROP COLUMN arrived in SQLite 3.35; older builds need a table rebuild
+SUPPORTS_DROP_COLUMN = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+_SCHEMA_CHANGE_RE = re.compile(r"\b(?:ALTER|CREATE|DROP)\s+TABLE\b", re.IGNORECASE)
+
 
 class MigrationError(Exception):
     pass
 
 
+def _split_statements(script: str) -> Iterator[str]:
+    pieces = script.split(";")
+    statement = ""
+    for piece in pieces[:-1]:
+        statement += piece + ";"
+        if sqlite3.complete_statement(statement):
+            yield statement
+            statement = ""
+    statement += pieces[-1]
+    if statement.strip():
+        yield statement
+
+
 class Migration(ABC):
+    _can_rollback = False
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._can_rollback = cls.down is not Migration.down
+
     def __init__(self) -> None:
         self.applied_at: datetime | None = None
 
@@ -28,7 +55,7 @@ class Migration(ABC):
     def description(self) -> str:
         pass
 
-    @property
+    @cached_property
     def dependencies(self) -> list[str]:
         if self.version == "001":
             return []
@@ -45,10 +72,7 @@ class Migration(ABC):
         return True
 
     def can_rollback(self) -> bool:
-        try:
-            return self.__class__.down is not Migration.down
-        except AttributeError:
-            return False
+        return self._can_rollback
 
     def __str__(self) -> str:
         return f"Migration {self.version}: {self.description}"
@@ -59,18 +83,16 @@ class Migration(ABC):
 
 class SchemaValidationMixin:
     def table_exists(self, conn: sqlite3.Connection, table_name: str) -> bool:
-        cursor = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name=?", (table_name,)
-        )
-        return cursor.fetchone() is not None
+        # Goes through the cached table_info so a following get_table_schema or
+        # column_exists on the same table needs no further query
+        return bool(self.get_table_schema(conn, table_name))
 
     def column_exists(self, conn: sqlite3.Connection, table_name: str, column_name: str) -> bool:
         try:
-            cursor = conn.execute(f"PRAGMA table_info({table_name})")
-            columns = [row[1] for row in cursor.fetchall()]
-            return column_name in columns
+            schema = self.get_table_schema(conn, table_name)
         except sqlite3.OperationalError:
             return False
+        return any(column["name"] == column_name for column in schema)
 
     def index_exists(self, conn: sqlite3.Connection, index_name: str) -> bool:
         cursor = conn.execute(
@@ -79,8 +101,11 @@ class SchemaValidationMixin:
         return cursor.fetchone() is not None
 
     def get_table_schema(self, conn: sqlite3.Connection, table_name: str) -> list[dict[str, Any]]:
+        cache = self._schema_cache_for(conn)
+        if table_name in cache:
+            return cache[table_name]
         cursor = conn.execute(f"PRAGMA table_info({table_name})")
-        return [
+        schema = [
             {
                 "cid": row[0],
                 "name": row[1],
@@ -89,13 +114,46 @@ class SchemaValidationMixin:
                 "default_value": row[4],
                 "pk": bool(row[5]),
             }
-            for row in cursor.fetchall()
+            for row in cursor
         ]
+        if schema:
+            cache[table_name] = schema
+        return schema
+
+    def _schema_cache_for(self, conn: sqlite3.Connection) -> dict[str, list[dict[str, Any]]]:
+        # Connections can't be weakly referenced, so the cache holds the connection it
+        # belongs to; that also keeps its id from being reused by a later connection
+        if getattr(self, "_schema_conn", None) is not conn:
+            self._schema_conn: sqlite3.Connection | None = conn
+            self._schema_cache: dict[str, list[dict[str, Any]]] = {}
+        return self._schema_cache
+
+    def clear_schema_cache(self) -> None:
+        self._schema_conn = None
+        self._schema_cache = {}
 
     def execute_sql(self, conn: sqlite3.Connection, sql: str, params: tuple = ()) -> None:
         try:
             logger.debug("Executing SQL", sql=sql, params=params)
             conn.execute(sql, params)
+            if _SCHEMA_CHANGE_RE.search(sql):
+                self.clear_schema_cache()
         except sqlite3.Error as e:
             logger.error("SQL execution failed", sql=sql, params=params, error=str(e))
             raise MigrationError(f"SQL execution failed: {e}") from e
+
+    def execute_script(self, conn: sqlite3.Connection, script: str) -> None:
+        try:
+            logger.debug("Executing SQL script", script=script)
+            if conn.in_transaction:
+                # executescript() would COMMIT the open transaction first, so run
+                # the statements one at a time to keep them inside it
+                for statement in _split_statements(script):
+                    conn.execute(statement)
+            else:
+                conn.executescript(script)
+            if _SCHEMA_CHANGE_RE.search(script):
+                self.clear_schema_cache()
+        except sqlite3.Error as e:
+            logger.error("SQL script execution failed", script=script, error=str(e))
+            raise MigrationError(f"SQL script execution failed: {e}") from e
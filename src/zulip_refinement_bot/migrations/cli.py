@@ -4,16 +4,40 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import structlog
 import typer
+from pydantic import ValidationError
 from rich.console import Console
 from rich.table import Table
 
+from ..config import Config
 from .runner import MigrationRunner
 from .versions import ALL_MIGRATIONS
 
 console = Console()
 app = typer.Typer(name="migrate", help="Database migration commands")
 
+_ROLLBACK_YES = "[green]✓[/green]"
+_ROLLBACK_NO = "[red]✗[/red]"
+
+
+@app.callback()
+def main() -> None:
+    """Database migration commands."""
+    if structlog.is_configured():
+        return
+
+    from ..cli import setup_logging
+
+    try:
+        config = Config()
+        log_level, log_format = config.log_level, config.log_format
+    except ValidationError:
+        # Migrations don't need Zulip credentials, so fall back to the default settings
+        log_level = Config.model_fields["log_level"].default
+        log_format = Config.model_fields["log_format"].default
+    setup_logging(log_level, log_format)
+
 
 def get_migration_runner(db_path: Path | None = None) -> MigrationRunner:
     if db_path is None:
@@ -43,15 +67,12 @@ def status(
     table.add_column("Rollback", style="magenta")
 
     for version, info in status_info.items():
-        rollback_text = "✓" if info["can_rollback"] else "✗"
-        rollback_style = "green" if info["can_rollback"] else "red"
-
         table.add_row(
             version,
             info["status"],
             info["description"],
             info.get("applied_at", ""),
-            f"[{rollback_style}]{rollback_text}[/{rollback_style}]",
+            _ROLLBACK_YES if info["can_rollback"] else _ROLLBACK_NO,
         )
 
     console.print(table)
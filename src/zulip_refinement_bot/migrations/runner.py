@@ -1,20 +1,63 @@
 from __future__ import annotations
 
+import bisect
+import heapq
 import sqlite3
+import time
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
+from typing import Any, Literal
 
 import structlog
 
-from .base import Migration, MigrationError
+from .base import Migration, MigrationError, SchemaValidationMixin
 
 logger = structlog.get_logger(__name__)
 
+# WAL lets readers run alongside a writer and, with synchronous=NORMAL, only
+# syncs at checkpoints rather than on every commit
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode = WAL;
+    PRAGMA synchronous = NORMAL;
+    PRAGMA busy_timeout = 5000;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+"""
+
+_INSERT_SCHEMA_MIGRATION_SQL = """
+    INSERT INTO schema_migrations (version, description, applied_at, execution_time_ms)
+    VALUES (?, ?, ?, ?)
+"""
+
+
+class _ClosingConnection(sqlite3.Connection):
+    """Connection whose ``with`` block commits (or rolls back) and then closes it.
+
+    Closing promptly lets SQLite checkpoint and remove the WAL files instead of
+    leaving that to whenever the connection is garbage collected.
+    """
+
+    def __exit__(self, *exc_info: Any) -> Literal[False]:
+        try:
+            super().__exit__(*exc_info)
+        finally:
+            self.close()
+        return False
+
+
+def connect(db_path: Path) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, factory=_ClosingConnection)
+    conn.executescript(_CONNECTION_PRAGMAS)
+    return conn
+
 
 class MigrationRunner:
     def __init__(self, db_path: Path) -> None:
         self.db_path = Path(db_path)
         self._migrations: dict[str, Migration] = {}
+        self._sorted_versions: list[str] = []
+        self._conn: sqlite3.Connection | None = None
         self._ensure_migration_table()
 
     def register_migration(self, migration_class: type[Migration]) -> None:
@@ -25,14 +68,27 @@ class MigrationRunner:
             raise MigrationError(f"Migration {version} is already registered")
 
         self._migrations[version] = migration
+        bisect.insort(self._sorted_versions, version)
         logger.debug("Registered migration", version=version, description=migration.description)
 
     def register_migrations(self, migration_classes: list[type[Migration]]) -> None:
         for migration_class in migration_classes:
             self.register_migration(migration_class)
 
+    def _connect(self) -> sqlite3.Connection:
+        # One connection for the runner's lifetime; its with-blocks commit but don't close
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.executescript(_CONNECTION_PRAGMAS)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
     def _ensure_migration_table(self) -> None:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS schema_migrations (
                     version TEXT PRIMARY KEY,
@@ -44,35 +100,51 @@ class MigrationRunner:
             conn.commit()
 
     def get_applied_migrations(self) -> set[str]:
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
             cursor = conn.execute("SELECT version FROM schema_migrations ORDER BY version")
-            return {row[0] for row in cursor.fetchall()}
+            return {row[0] for row in cursor}
 
     def get_pending_migrations(self) -> list[Migration]:
         applied = self.get_applied_migrations()
-        pending: list[Migration] = []
-
-        sorted_migrations = sorted(self._migrations.items())
-
-        for version, migration in sorted_migrations:
-            if version not in applied:
-                for dep_version in migration.dependencies:
-                    if dep_version not in applied and dep_version not in [
-                        m.version for m in pending
-                    ]:
-                        if dep_version in self._migrations:
-                            dep_migration = self._migrations[dep_version]
-                            if dep_migration not in pending:
-                                pending.append(dep_migration)
-                        else:
-                            raise MigrationError(
-                                f"Migration {version} depends on {dep_version} "
-                                f"which is not registered"
-                            )
-
-                pending.append(migration)
-
-        return pending
+        pending = {
+            version: migration
+            for version, migration in self._migrations.items()
+            if version not in applied
+        }
+
+        # Kahn's algorithm over the unapplied migrations, taking the lowest ready
+        # version first so independent migrations still run in version order
+        dependents: defaultdict[str, list[str]] = defaultdict(list)
+        waiting_on: dict[str, int] = {}
+        for version, migration in pending.items():
+            unmet = 0
+            for dep_version in migration.dependencies:
+                if dep_version in applied:
+                    continue
+                if dep_version not in pending:
+                    raise MigrationError(
+                        f"Migration {version} depends on {dep_version} which is not registered"
+                    )
+                dependents[dep_version].append(version)
+                unmet += 1
+            waiting_on[version] = unmet
+
+        ready = [version for version, unmet in waiting_on.items() if unmet == 0]
+        heapq.heapify(ready)
+        ordered: list[Migration] = []
+        while ready:
+            version = heapq.heappop(ready)
+            ordered.append(pending[version])
+            for dependent in dependents[version]:
+                waiting_on[dependent] -= 1
+                if waiting_on[dependent] == 0:
+                    heapq.heappush(ready, dependent)
+
+        if len(ordered) != len(pending):
+            blocked = sorted(set(pending) - {m.version for m in ordered})
+            raise MigrationError(f"Circular migration dependencies among {', '.join(blocked)}")
+
+        return ordered
 
     def run_migrations(self, target_version: str | None = None, dry_run: bool = False) -> list[str]:
         pending = self.get_pending_migrations()
@@ -86,64 +158,62 @@ class MigrationRunner:
 
         applied_versions = []
 
-        for migration in pending:
-            if dry_run:
+        if dry_run:
+            for migration in pending:
                 logger.info(
                     "Would apply migration",
                     version=migration.version,
                     description=migration.description,
                 )
                 applied_versions.append(migration.version)
-            else:
-                applied_versions.append(self._apply_migration(migration))
+        else:
+            try:
+                with self._connect() as conn:
+                    conn.execute("PRAGMA foreign_keys = ON")
+                    # One transaction for the whole run, so a failing migration leaves
+                    # the database exactly as it was before the run started
+                    conn.execute("BEGIN")
+                    for migration in pending:
+                        applied_versions.append(self._apply_migration(conn, migration))
+            finally:
+                self._clear_schema_caches(pending)
+            # Refresh planner statistics for tables that need it now that indexes
+            # may have changed; cheap and a no-op when nothing is stale
+            conn.execute("PRAGMA optimize")
 
         logger.info("Migrations completed", migrations_count=len(applied_versions))
         return applied_versions
 
-    def _apply_migration(self, migration: Migration) -> str:
-        start_time = datetime.now()
+    def _apply_migration(self, conn: sqlite3.Connection, migration: Migration) -> str:
+        start_ns = time.monotonic_ns()
+        log = logger.bind(version=migration.version)
 
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                conn.execute("PRAGMA foreign_keys = ON")
-                logger.info(
-                    "Applying migration",
-                    version=migration.version,
-                    description=migration.description,
-                )
+            log.info("Applying migration", description=migration.description)
 
-                migration.up(conn)
-
-                if not migration.validate(conn):
-                    raise MigrationError(f"Migration {migration.version} validation failed")
-
-                execution_time = int((datetime.now() - start_time).total_seconds() * 1000)
-                migration.applied_at = datetime.now()
-
-                conn.execute(
-                    """
-                    INSERT INTO schema_migrations
-                    (version, description, applied_at, execution_time_ms)
-                    VALUES (?, ?, ?, ?)
-                """,
-                    (
-                        migration.version,
-                        migration.description,
-                        migration.applied_at.isoformat(),
-                        execution_time,
-                    ),
-                )
+            migration.up(conn)
 
-                conn.commit()
-                logger.info(
-                    "Migration applied successfully",
-                    version=migration.version,
-                    execution_time_ms=execution_time,
-                )
-                return migration.version
+            if not migration.validate(conn):
+                raise MigrationError(f"Migration {migration.version} validation failed")
+
+            execution_time = (time.monotonic_ns() - start_ns) // 1_000_000
+            migration.applied_at = datetime.now()
+
+            conn.execute(
+                _INSERT_SCHEMA_MIGRATION_SQL,
+                (
+                    migration.version,
+                    migration.description,
+                    migration.applied_at.isoformat(),
+                    execution_time,
+                ),
+            )
+
+            log.info("Migration applied successfully", execution_time_ms=execution_time)
+            return migration.version
 
         except Exception as e:
-            logger.error("Migration failed", version=migration.version, error=str(e))
+            log.error("Migration failed", error=str(e))
             raise MigrationError(f"Migration {migration.version} failed: {e}") from e
 
     def rollback_migration(self, version: str) -> None:
@@ -159,42 +229,57 @@ class MigrationRunner:
         if version not in applied:
             raise MigrationError(f"Migration {version} is not applied")
 
+        log = logger.bind(version=version)
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connect() as conn:
                 conn.execute("PRAGMA foreign_keys = ON")
-                logger.info("Rolling back migration", version=version)
+                log.info("Rolling back migration")
 
+                conn.execute("BEGIN")
                 migration.down(conn)
                 conn.execute("DELETE FROM schema_migrations WHERE version = ?", (version,))
-                conn.commit()
-
-                logger.info("Migration rolled back successfully", version=version)
+            log.info("Migration rolled back successfully")
 
         except Exception as e:
-            logger.error("Migration rollback failed", version=version, error=str(e))
+            log.error("Migration rollback failed", error=str(e))
             raise MigrationError(f"Rollback of migration {version} failed: {e}") from e
+        finally:
+            self._clear_schema_caches([migration])
+
+    @staticmethod
+    def _clear_schema_caches(migrations: list[Migration]) -> None:
+        # Schema lookups cached during a run must not outlive its connection
+        for migration in migrations:
+            if isinstance(migration, SchemaValidationMixin):
+                migration.clear_schema_cache()
+
+    def _load_applied(self, conn: sqlite3.Connection) -> dict[str, sqlite3.Row]:
+        cursor = conn.cursor()
+        cursor.row_factory = sqlite3.Row
+        cursor.execute("""
+            SELECT version, description, applied_at, execution_time_ms
+            FROM schema_migrations
+            ORDER BY version
+        """)
+        return {row["version"]: row for row in cursor}
 
     def get_migration_status(self) -> dict[str, dict]:
-        applied = self.get_applied_migrations()
-        status = {}
-
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute("""
-                SELECT version, description, applied_at, execution_time_ms
-                FROM schema_migrations
-                ORDER BY version
-            """)
-            applied_details = {row["version"]: dict(row) for row in cursor.fetchall()}
+        status: dict[str, dict] = {}
+        if not self._migrations:
+            return status
+
+        with self._connect() as conn:
+            applied_details = self._load_applied(conn)
 
-        for version, migration in sorted(self._migrations.items()):
-            if version in applied:
-                details = applied_details.get(version, {})
+        for version in self._sorted_versions:
+            migration = self._migrations[version]
+            details = applied_details.get(version)
+            if details is not None:
                 status[version] = {
                     "status": "applied",
                     "description": migration.description,
-                    "applied_at": details.get("applied_at"),
-                    "execution_time_ms": details.get("execution_time_ms"),
+                    "applied_at": details["applied_at"],
+                    "execution_time_ms": details["execution_time_ms"],
                     "can_rollback": migration.can_rollback(),
                 }
             else:
@@ -208,13 +293,14 @@ class MigrationRunner:
         return status
 
     def validate_migrations(self) -> bool:
-        applied = self.get_applied_migrations()
         all_valid = True
 
-        with sqlite3.connect(self.db_path) as conn:
-            for version in applied:
+        with self._connect() as conn:
+            for version in self._load_applied(conn):
                 if version in self._migrations:
                     migration = self._migrations[version]
+                    if isinstance(migration, SchemaValidationMixin):
+                        migration.clear_schema_cache()
                     try:
                         if not migration.validate(conn):
                             logger.error("Migration validation failed", version=version)
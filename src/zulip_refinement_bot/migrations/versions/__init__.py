@@ -8,6 +8,10 @@ from .m005_remove_title_column import RemoveTitleColumnMigration
 from .m006_add_abstentions import AddAbstentionsMigration
 from .m007_add_reminders import AddRemindersMigration
 from .m008_add_results_message_id import AddResultsMessageIdMigration
+from .m009_drop_redundant_final_estimates_indexes import (
+    DropRedundantFinalEstimatesIndexesMigration,
+)
+from .m010_drop_redundant_voter_indexes import DropRedundantVoterIndexesMigration
 
 # All migrations in order
 ALL_MIGRATIONS = [
@@ -19,6 +23,8 @@ ALL_MIGRATIONS = [
     AddAbstentionsMigration,
     AddRemindersMigration,
     AddResultsMessageIdMigration,
+    DropRedundantFinalEstimatesIndexesMigration,
+    DropRedundantVoterIndexesMigration,
 ]
 
 __all__ = [
@@ -30,5 +36,7 @@ __all__ = [
     "AddAbstentionsMigration",
     "AddRemindersMigration",
     "AddResultsMessageIdMigration",
+    "DropRedundantFinalEstimatesIndexesMigration",
+    "DropRedundantVoterIndexesMigration",
     "ALL_MIGRATIONS",
 ]
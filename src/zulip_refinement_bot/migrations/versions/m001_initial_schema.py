@@ -13,7 +13,7 @@ class InitialSchemaMigration(Migration, SchemaValidationMixin):
         return "Create initial schema with batches, issues, and votes tables"
 
     def up(self, conn: sqlite3.Connection) -> None:
-        self.execute_sql(
+        self.execute_script(
             conn,
             """
             CREATE TABLE IF NOT EXISTS batches (
@@ -23,13 +23,8 @@ class InitialSchemaMigration(Migration, SchemaValidationMixin):
                 facilitator TEXT NOT NULL,
                 status TEXT DEFAULT 'active',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """,
-        )
+            );
 
-        self.execute_sql(
-            conn,
-            """
             CREATE TABLE IF NOT EXISTS issues (
                 id INTEGER PRIMARY KEY,
                 batch_id INTEGER,
@@ -37,13 +32,8 @@ class InitialSchemaMigration(Migration, SchemaValidationMixin):
                 title TEXT NOT NULL,
                 url TEXT DEFAULT '',
                 FOREIGN KEY (batch_id) REFERENCES batches (id)
-            )
-        """,
-        )
+            );
 
-        self.execute_sql(
-            conn,
-            """
             CREATE TABLE IF NOT EXISTS votes (
                 id INTEGER PRIMARY KEY,
                 batch_id INTEGER,
@@ -53,19 +43,24 @@ class InitialSchemaMigration(Migration, SchemaValidationMixin):
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (batch_id) REFERENCES batches (id),
                 UNIQUE(batch_id, issue_number, voter)
-            )
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_batches_status ON batches(status);
+            CREATE INDEX IF NOT EXISTS idx_issues_batch_id ON issues(batch_id);
+            CREATE INDEX IF NOT EXISTS idx_votes_batch_id ON votes(batch_id);
+            CREATE INDEX IF NOT EXISTS idx_votes_voter ON votes(voter);
         """,
         )
 
-        self.execute_sql(conn, "CREATE INDEX IF NOT EXISTS idx_batches_status ON batches(status)")
-        self.execute_sql(conn, "CREATE INDEX IF NOT EXISTS idx_issues_batch_id ON issues(batch_id)")
-        self.execute_sql(conn, "CREATE INDEX IF NOT EXISTS idx_votes_batch_id ON votes(batch_id)")
-        self.execute_sql(conn, "CREATE INDEX IF NOT EXISTS idx_votes_voter ON votes(voter)")
-
     def down(self, conn: sqlite3.Connection) -> None:
-        self.execute_sql(conn, "DROP TABLE IF EXISTS votes")
-        self.execute_sql(conn, "DROP TABLE IF EXISTS issues")
-        self.execute_sql(conn, "DROP TABLE IF EXISTS batches")
+        self.execute_script(
+            conn,
+            """
+            DROP TABLE IF EXISTS votes;
+            DROP TABLE IF EXISTS issues;
+            DROP TABLE IF EXISTS batches;
+        """,
+        )
 
     def validate(self, conn: sqlite3.Connection) -> bool:
         required_tables = ["batches", "issues", "votes"]
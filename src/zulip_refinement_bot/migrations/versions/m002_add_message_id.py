@@ -2,7 +2,7 @@
 
 import sqlite3
 
-from ..base import Migration, SchemaValidationMixin
+from ..base import SUPPORTS_DROP_COLUMN, Migration, SchemaValidationMixin
 
 
 class AddMessageIdMigration(Migration, SchemaValidationMixin):
@@ -25,10 +25,14 @@ class AddMessageIdMigration(Migration, SchemaValidationMixin):
     def down(self, conn: sqlite3.Connection) -> None:
         """Remove message_id column from batches table.
 
-        Note: SQLite doesn't support DROP COLUMN directly, so we need to recreate the table.
+        SQLite only supports DROP COLUMN from 3.35, so older builds recreate the table.
         """
-        # Create new table without message_id column
-        self.execute_sql(
+        if SUPPORTS_DROP_COLUMN:
+            self.execute_sql(conn, "ALTER TABLE batches DROP COLUMN message_id")
+            return
+
+        # Recreate the table without message_id; the index is built after the copy
+        self.execute_script(
             conn,
             """
             CREATE TABLE batches_new (
@@ -38,26 +42,18 @@ class AddMessageIdMigration(Migration, SchemaValidationMixin):
                 facilitator TEXT NOT NULL,
                 status TEXT DEFAULT 'active',
                 created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        """,
-        )
+            );
 
-        # Copy data from old table (excluding message_id)
-        self.execute_sql(
-            conn,
-            """
             INSERT INTO batches_new (id, date, deadline, facilitator, status, created_at)
             SELECT id, date, deadline, facilitator, status, created_at
-            FROM batches
-        """,
-        )
+            FROM batches;
 
-        # Drop old table and rename new one
-        self.execute_sql(conn, "DROP TABLE batches")
-        self.execute_sql(conn, "ALTER TABLE batches_new RENAME TO batches")
+            DROP TABLE batches;
+            ALTER TABLE batches_new RENAME TO batches;
 
-        # Recreate index
-        self.execute_sql(conn, "CREATE INDEX IF NOT EXISTS idx_batches_status ON batches(status)")
+            CREATE INDEX IF NOT EXISTS idx_batches_status ON batches(status);
+        """,
+        )
 
     def validate(self, conn: sqlite3.Connection) -> bool:
         """Validate that message_id column was added."""
@@ -4,6 +4,19 @@ import sqlite3
 
 from ..base import Migration, SchemaValidationMixin
 
+# Roster at the time of this migration, frozen so replaying it never changes
+_DEFAULT_VOTERS = (
+    "Dan Yeaw",
+    "Daniel Holth",
+    "Jannis Leidel",
+    "Ken Odegard",
+    "Mahe Iram Khan",
+    "Ryan Keith",
+    "Sophia Castellarin",
+    "Travis Hathaway",
+    "jaimergp",
+)
+
 
 class BatchVotersMigration(Migration, SchemaValidationMixin):
     """Create batch_voters table and migrate existing batches to have default voters."""
@@ -58,29 +71,20 @@ class BatchVotersMigration(Migration, SchemaValidationMixin):
 
     def _migrate_existing_batches(self, conn: sqlite3.Connection) -> None:
         """Migrate existing batches to have default voters if they don't have any."""
+        placeholders = ", ".join("(?)" for _ in _DEFAULT_VOTERS)
         try:
-            # Find batches without voters
-            cursor = conn.execute("""
-                SELECT b.id FROM batches b
-                LEFT JOIN batch_voters bv ON b.id = bv.batch_id
-                WHERE bv.batch_id IS NULL
-            """)
-            batches_without_voters = [row[0] for row in cursor.fetchall()]
-
-            if batches_without_voters:
-                # Default voters (these should match your Config._default_voters)
-                # In a real migration, you might want to make this configurable
-                default_voters = ["alice@example.com", "bob@example.com", "charlie@example.com"]
-
-                # Add default voters to batches that don't have any
-                for batch_id in batches_without_voters:
-                    for voter in default_voters:
-                        self.execute_sql(
-                            conn,
-                            "INSERT OR IGNORE INTO batch_voters "
-                            "(batch_id, voter_name) VALUES (?, ?)",
-                            (batch_id, voter),
-                        )
+            # Give every batch that has no voters the whole roster in one statement
+            self.execute_sql(
+                conn,
+                f"""
+                WITH default_voters(name) AS (VALUES {placeholders})
+                INSERT OR IGNORE INTO batch_voters (batch_id, voter_name)
+                SELECT b.id, v.name
+                FROM batches b CROSS JOIN default_voters v
+                WHERE NOT EXISTS (SELECT 1 FROM batch_voters bv WHERE bv.batch_id = b.id)
+            """,  # nosec B608 - only "(?)" placeholders are interpolated
+                _DEFAULT_VOTERS,
+            )
 
         except Exception:  # nosec B110
             # Log warning but don't fail the migration
@@ -0,0 +1,43 @@
+"""Drop final_estimates indexes already covered by its unique constraint."""
+
+import sqlite3
+
+from ..base import Migration, SchemaValidationMixin
+
+
+class DropRedundantFinalEstimatesIndexesMigration(Migration, SchemaValidationMixin):
+    """Drop the single-column final_estimates indexes created by migration 004.
+
+    UNIQUE(batch_id, issue_number) already gives SQLite an index that answers
+    ``WHERE batch_id = ? ORDER BY issue_number`` without a sort, and nothing
+    looks final estimates up by issue number alone, so both extra indexes only
+    add work to every write.
+    """
+
+    @property
+    def version(self) -> str:
+        return "009"
+
+    @property
+    def description(self) -> str:
+        return "Drop final_estimates indexes covered by its unique constraint"
+
+    def up(self, conn: sqlite3.Connection) -> None:
+        """Drop the redundant indexes."""
+        self.execute_sql(conn, "DROP INDEX IF EXISTS idx_final_estimates_batch_id")
+        self.execute_sql(conn, "DROP INDEX IF EXISTS idx_final_estimates_issue")
+
+    def down(self, conn: sqlite3.Connection) -> None:
+        """Recreate the indexes from migration 004."""
+        self.execute_sql(
+            conn,
+            "CREATE INDEX IF NOT EXISTS idx_final_estimates_batch_id ON final_estimates(batch_id)",
+        )
+        self.execute_sql(
+            conn,
+            "CREATE INDEX IF NOT EXISTS idx_final_estimates_issue ON final_estimates(issue_number)",
+        )
+
+    def validate(self, conn: sqlite3.Connection) -> bool:
+        """Validate that final_estimates is still in place."""
+        return self.table_exists(conn, "final_estimates")
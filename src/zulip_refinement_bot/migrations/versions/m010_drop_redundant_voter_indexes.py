@@ -0,0 +1,40 @@
+"""Drop batch_voters and abstentions indexes covered by their unique constraints."""
+
+import sqlite3
+
+from ..base import Migration, SchemaValidationMixin
+
+
+class DropRedundantVoterIndexesMigration(Migration, SchemaValidationMixin):
+    """Drop the batch_id indexes created by migrations 003 and 006.
+
+    UNIQUE(batch_id, voter_name) and UNIQUE(batch_id, issue_number, voter) both
+    lead with batch_id, so their automatic indexes already serve every
+    ``WHERE batch_id = ?`` lookup. idx_abstentions_voter stays for voter lookups.
+    """
+
+    @property
+    def version(self) -> str:
+        return "010"
+
+    @property
+    def description(self) -> str:
+        return "Drop batch_voters and abstentions indexes covered by unique constraints"
+
+    def up(self, conn: sqlite3.Connection) -> None:
+        """Drop the redundant indexes."""
+        self.execute_sql(conn, "DROP INDEX IF EXISTS idx_batch_voters_batch_id")
+        self.execute_sql(conn, "DROP INDEX IF EXISTS idx_abstentions_batch_id")
+
+    def down(self, conn: sqlite3.Connection) -> None:
+        """Recreate the indexes from migrations 003 and 006."""
+        self.execute_sql(
+            conn, "CREATE INDEX IF NOT EXISTS idx_batch_voters_batch_id ON batch_voters(batch_id)"
+        )
+        self.execute_sql(
+            conn, "CREATE INDEX IF NOT EXISTS idx_abstentions_batch_id ON abstentions(batch_id)"
+        )
+
+    def validate(self, conn: sqlite3.Connection) -> bool:
+        """Validate that batch_voters and abstentions are still in place."""
+        return self.table_exists(conn, "batch_voters") and self.table_exists(conn, "abstentions")
@@ -3,13 +3,16 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from functools import cached_property
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class IssueData(BaseModel):
     """Represents a GitHub issue."""
 
+    model_config = ConfigDict(frozen=True)
+
     issue_number: str = Field(..., description="GitHub issue number")
     url: str = Field(..., description="GitHub issue URL")
 
@@ -31,6 +34,18 @@ class BatchData(BaseModel):
     created_at: datetime | None = Field(None, description="Creation timestamp")
     issues: list[IssueData] = Field(default_factory=list, description="Issues in batch")
 
+    @cached_property
+    def deadline_dt(self) -> datetime:
+        """Deadline parsed from its ISO string, computed once per instance."""
+        return datetime.fromisoformat(self.deadline)
+
+    @cached_property
+    def example_format(self) -> str:
+        """Sample estimate line for the first three issues, padded with the first."""
+        example_issues = [issue.issue_number for issue in self.issues[:3]]
+        example_issues += example_issues[:1] * (3 - len(example_issues))
+        return f"#{example_issues[0]}: 5, #{example_issues[1]}: 8, #{example_issues[2]}: 3"
+
 
 class MessageData(BaseModel):
     """Represents a Zulip message."""
@@ -53,6 +68,8 @@ class ParseResult(BaseModel):
 class EstimationVote(BaseModel):
     """Represents a story point estimation vote."""
 
+    model_config = ConfigDict(frozen=True)
+
     voter: str = Field(..., description="Voter name")
     issue_number: str = Field(..., description="Issue number")
     points: int = Field(..., description="Story points estimate")
@@ -64,6 +81,8 @@ class EstimationVote(BaseModel):
 class Abstention(BaseModel):
     """Represents an abstention from voting on an issue."""
 
+    model_config = ConfigDict(frozen=True)
+
     voter: str = Field(..., description="Voter name")
     issue_number: str = Field(..., description="Issue number")
     timestamp: datetime = Field(
@@ -74,6 +93,8 @@ class Abstention(BaseModel):
 class FinalEstimate(BaseModel):
     """Represents a final estimate for an issue after discussion."""
 
+    model_config = ConfigDict(frozen=True)
+
     issue_number: str = Field(..., description="Issue number")
     final_points: int = Field(..., description="Final agreed story points")
     rationale: str = Field(default="", description="Brief rationale for the estimate")
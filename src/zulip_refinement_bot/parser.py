@@ -18,6 +18,8 @@ class InputParser(ParserInterface):
     """Handles parsing and validation of user input."""
 
     GITHUB_URL_PATTERN = re.compile(r"https://github\.com/([^/]+)/([^/]+)/issues/(\d+)")
+    ESTIMATION_PATTERN = re.compile(r"#(\d+):\s*((?:\d+)|(?:abstain))", re.IGNORECASE)
+    VALID_STORY_POINTS = (1, 2, 3, 5, 8, 13, 21)
 
     def __init__(self, config: Config, github_api: GitHubAPI):
         """Initialize input parser.
@@ -110,7 +112,7 @@ class InputParser(ParserInterface):
         estimates = {}
         abstentions = []
         validation_errors = []
-        valid_fibonacci = [1, 2, 3, 5, 8, 13, 21]
+        valid_fibonacci = self.VALID_STORY_POINTS
 
         processed_content = content.strip()
         if (
@@ -120,9 +122,7 @@ class InputParser(ParserInterface):
         ):
             processed_content = processed_content[1:-1].strip()
 
-        pattern = re.compile(r"#(\d+):\s*((?:\d+)|(?:abstain))", re.IGNORECASE)
-
-        for match in pattern.finditer(processed_content):
+        for match in self.ESTIMATION_PATTERN.finditer(processed_content):
             issue_number = match.group(1)
             value = match.group(2).lower()
 
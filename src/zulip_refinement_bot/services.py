@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from collections import Counter
+from collections import Counter, defaultdict
+from collections.abc import Iterable
 from datetime import UTC, datetime
 
 import structlog
@@ -10,6 +11,7 @@ import structlog
 from .business_hours import BusinessHoursCalculator
 from .config import Config
 from .exceptions import AuthorizationError, BatchError, ValidationError, VotingError
+from .github_api import fetch_issue_titles
 from .interfaces import DatabaseInterface, GitHubAPIInterface, ParserInterface
 from .models import BatchData, EstimationVote, FinalEstimate, IssueData
 
@@ -51,13 +53,14 @@ class BatchService:
         deadline_str = deadline.isoformat()
 
         try:
-            batch_id = self.database.create_batch(date_str, deadline_str, facilitator)
-            self.database.add_issues_to_batch(batch_id, parse_result.issues)
             from .config import Config
 
             # Validate default voters before adding to database
             clean_voters = VoterValidationService.validate_voter_names(Config._default_voters)
-            self.database.add_batch_voters(batch_id, clean_voters)
+            with self.database.transaction():
+                batch_id = self.database.create_batch(date_str, deadline_str, facilitator)
+                self.database.add_issues_to_batch(batch_id, parse_result.issues)
+                self.database.add_batch_voters(batch_id, clean_voters)
 
             logger.info(
                 "Batch created successfully",
@@ -115,7 +118,7 @@ class BatchService:
             requester: Name of the person requesting completion
 
         Returns:
-            The completed batch data
+            The batch data with its status set to completed
 
         Raises:
             BatchError: If no active batch exists
@@ -134,6 +137,7 @@ class BatchService:
             raise BatchError("Batch ID mismatch.")
 
         self.database.complete_batch(batch_id)
+        active_batch.status = "completed"
         logger.info("Batch completed", batch_id=batch_id, requester=requester)
 
         return active_batch
@@ -207,8 +211,13 @@ class BatchService:
         if active_batch.status != "discussing":
             raise BatchError(f"Batch is not in discussion phase (current: {active_batch.status}).")
 
-        for issue_number, (final_points, rationale) in final_estimates.items():
-            self.database.store_final_estimate(batch_id, issue_number, final_points, rationale)
+        self.database.store_final_estimates(
+            batch_id,
+            (
+                (issue_number, final_points, rationale)
+                for issue_number, (final_points, rationale) in final_estimates.items()
+            ),
+        )
 
         self.database.complete_batch(batch_id)
 
@@ -292,9 +301,10 @@ class VotingService:
 
         self._validate_vote_completeness(estimates, abstentions, batch)
 
-        stored_count, updated_count, new_count = self._store_votes_and_abstentions(
-            batch.id, voter, estimates, abstentions
-        )
+        with self.database.transaction():
+            stored_count, updated_count, new_count = self._store_votes_and_abstentions(
+                batch.id, voter, estimates, abstentions
+            )
 
         expected_count = len(estimates) + len(abstentions)
         if stored_count != expected_count:
@@ -339,7 +349,7 @@ class VotingService:
         # Check for duplicates between votes and abstentions
         overlap = vote_issue_numbers & abstention_issue_numbers
         if overlap:
-            overlap_list = ", ".join([f"#{issue}" for issue in sorted(overlap)])
+            overlap_list = ", ".join(f"#{issue}" for issue in sorted(overlap))
             raise ValidationError(
                 f"Cannot both vote and abstain on the same issues: {overlap_list}\n"
                 "Please choose either a vote or abstention for each issue."
@@ -374,20 +384,8 @@ class VotingService:
         Returns:
             Tuple of (stored_count, updated_count, new_count)
         """
-        stored_count = 0
-        updated_count = 0
-        new_count = 0
-
-        for issue_number, points in estimates.items():
-            success, was_update = self.database.upsert_vote(batch_id, voter, issue_number, points)
-            if success:
-                stored_count += 1
-                if was_update:
-                    updated_count += 1
-                else:
-                    new_count += 1
-
-        return stored_count, updated_count, new_count
+        new_count, updated_count = self.database.bulk_upsert_votes(batch_id, voter, estimates)
+        return new_count + updated_count, updated_count, new_count
 
     def _store_votes_and_abstentions(
         self, batch_id: int, voter: str, estimates: dict[str, int], abstentions: list[str]
@@ -403,21 +401,8 @@ class VotingService:
         Returns:
             Tuple of (stored_count, updated_count, new_count)
         """
-        stored_count = 0
-        updated_count = 0
-        new_count = 0
-
-        # Store votes
-        for issue_number, points in estimates.items():
-            self.database.remove_abstention_if_exists(batch_id, voter, issue_number)
-
-            success, was_update = self.database.upsert_vote(batch_id, voter, issue_number, points)
-            if success:
-                stored_count += 1
-                if was_update:
-                    updated_count += 1
-                else:
-                    new_count += 1
+        # Store votes (clears any abstentions on the same issues)
+        stored_count, updated_count, new_count = self._store_votes(batch_id, voter, estimates)
 
         # Store abstentions
         for issue_number in abstentions:
@@ -460,6 +445,34 @@ class VotingService:
 
         return completed_count, total_voters, is_complete
 
+    def get_votes_and_status(
+        self, batch_id: int
+    ) -> tuple[list[EstimationVote], int, int, list[str]]:
+        """Get all votes together with the batch's completion status and voters.
+
+        Args:
+            batch_id: Batch ID
+
+        Returns:
+            Tuple of (votes, completed_count, total_voters, batch voters)
+        """
+        votes, batch_voters, completed_count = self.database.get_batch_votes_and_voters(batch_id)
+        return votes, completed_count, len(batch_voters), batch_voters
+
+    def get_voting_progress(self, batch_id: int) -> tuple[int, int, list[str]]:
+        """Get vote progress and the voters still expected to vote.
+
+        Args:
+            batch_id: Batch ID
+
+        Returns:
+            Tuple of (completed_count, total_voters, voters without votes)
+        """
+        voters, remaining_voters, completed_count = self.database.get_batch_voters_and_counts(
+            batch_id
+        )
+        return completed_count, len(voters), remaining_voters
+
 
 class ResultsService:
     """Service for generating and analyzing estimation results."""
@@ -478,6 +491,45 @@ class ResultsService:
         self.github_api = github_api
         self.batch_service = batch_service
 
+    def _issue_titles(self, issues: Iterable[IssueData]) -> dict[str, str]:
+        """Get the titles of the issues a results message shows, fetched concurrently.
+
+        Args:
+            issues: Issues to look up
+
+        Returns:
+            Dict of issue_number -> GitHub title, or "Issue <number>" when it
+            cannot be fetched
+        """
+        issues = list(issues)
+        fetched = fetch_issue_titles(self.github_api, (issue.url for issue in issues))
+        return {
+            issue.issue_number: title or f"Issue {issue.issue_number}"
+            for issue, title in zip(issues, fetched, strict=True)
+        }
+
+    @staticmethod
+    def _aggregate_votes(
+        votes: list[EstimationVote],
+    ) -> dict[str, tuple[list[EstimationVote], list[int], Counter[int]]]:
+        """Group votes by issue with their points sorted once and tallied alongside.
+
+        Args:
+            votes: All votes for the batch
+
+        Returns:
+            Dict of issue_number -> (votes, sorted points, count per point value)
+        """
+        votes_by_issue: defaultdict[str, list[EstimationVote]] = defaultdict(list)
+        for vote in votes:
+            votes_by_issue[vote.issue_number].append(vote)
+
+        aggregated = {}
+        for issue_number, issue_votes in votes_by_issue.items():
+            points = sorted(vote.points for vote in issue_votes)
+            aggregated[issue_number] = (issue_votes, points, Counter(points))
+        return aggregated
+
     def generate_results_content(
         self,
         batch: BatchData,
@@ -498,11 +550,32 @@ class ResultsService:
         Returns:
             Formatted results content
         """
-        votes_by_issue: dict[str, list[EstimationVote]] = {}
-        for vote in votes:
-            if vote.issue_number not in votes_by_issue:
-                votes_by_issue[vote.issue_number] = []
-            votes_by_issue[vote.issue_number].append(vote)
+        results_content, _ = self.generate_results(
+            batch, votes, vote_count, total_voters, batch_voters
+        )
+        return results_content
+
+    def generate_results(
+        self,
+        batch: BatchData,
+        votes: list[EstimationVote],
+        vote_count: int,
+        total_voters: int,
+        batch_voters: list[str],
+    ) -> tuple[str, bool]:
+        """Generate estimation results and report whether any issue needs discussion.
+
+        Args:
+            batch: Batch data
+            votes: All votes for the batch
+            vote_count: Number of voters who submitted votes
+            total_voters: Total number of expected voters
+            batch_voters: List of voters for this specific batch
+
+        Returns:
+            Tuple of (formatted results content, True if any issue needs discussion)
+        """
+        votes_by_issue = self._aggregate_votes(votes)
 
         all_voters = set(batch_voters)
         voted_voters = {vote.voter for vote in votes}
@@ -518,15 +591,11 @@ class ResultsService:
         discussion_issues = []
 
         for issue in batch.issues:
-            issue_votes = votes_by_issue.get(issue.issue_number, [])
-            if not issue_votes:
+            if issue.issue_number not in votes_by_issue:
                 continue
-
-            estimates = [vote.points for vote in issue_votes]
-            estimates.sort()
+            _, estimates, estimate_counts = votes_by_issue[issue.issue_number]
 
             # Analyze consensus using simple majority rule
-            estimate_counts = Counter(estimates)
             most_common_value, most_common_count = estimate_counts.most_common(1)[0]
             total_votes = len(estimates)
             consensus_percentage = (most_common_count / total_votes) * 100
@@ -551,6 +620,8 @@ class ResultsService:
                 # Needs discussion - no clear majority
                 discussion_issues.append((issue, estimates, average, consensus_percentage))
 
+        titles = self._issue_titles(entry[0] for entry in consensus_issues + discussion_issues)
+
         if consensus_issues:
             results_content += "✅ **CONSENSUS REACHED**\n"
             for (
@@ -568,10 +639,7 @@ class ResultsService:
                     else "perfect consensus"
                 )
 
-                title = (
-                    self.github_api.fetch_issue_title_by_url(issue.url)
-                    or f"Issue {issue.issue_number}"
-                )
+                title = titles[issue.issue_number]
                 results_content += f"Issue {issue.issue_number} - {title}\n"
                 results_content += f"Estimates: {estimates_str}\n"
                 results_content += f"Consensus: {consensus_info} | Average: {average} | Final: **{final_estimate} points**\n\n"
@@ -580,10 +648,7 @@ class ResultsService:
             results_content += "⚠️ **DISCUSSION NEEDED**\n"
             for issue, estimates, average, consensus_percentage in discussion_issues:
                 estimates_str = ", ".join(map(str, estimates))
-                title = (
-                    self.github_api.fetch_issue_title_by_url(issue.url)
-                    or f"Issue {issue.issue_number}"
-                )
+                title = titles[issue.issue_number]
                 results_content += f"Issue {issue.issue_number} - {title}\n"
                 results_content += f"Estimates: {estimates_str}\n"
                 results_content += (
@@ -592,20 +657,14 @@ class ResultsService:
 
                 # Add questions for voters with outlying estimates
                 if estimates:
-                    min_est, max_est = min(estimates), max(estimates)
+                    # Points are sorted, so the range sits at the ends
+                    min_est, max_est = estimates[0], estimates[-1]
                     # Lower threshold for discussion questions - any spread >= 3
                     should_ask_questions = max_est - min_est >= 3
                     if should_ask_questions:
-                        high_voters = [
-                            v.voter
-                            for v in votes_by_issue[issue.issue_number]
-                            if v.points == max_est
-                        ]
-                        low_voters = [
-                            v.voter
-                            for v in votes_by_issue[issue.issue_number]
-                            if v.points == min_est
-                        ]
+                        issue_votes = votes_by_issue[issue.issue_number][0]
+                        high_voters = [v.voter for v in issue_votes if v.points == max_est]
+                        low_voters = [v.voter for v in issue_votes if v.points == min_est]
 
                         if high_voters:
                             high_mentions = " @**".join(high_voters)
@@ -631,7 +690,7 @@ class ResultsService:
                 "Example: `finish #15116: 5 After discussion we agreed it's medium complexity, #15907: 3 Simple bug fix confirmed`\n"
             )
 
-        return results_content
+        return results_content, bool(discussion_issues)
 
     def generate_updated_results_content(
         self,
@@ -653,11 +712,7 @@ class ResultsService:
         Returns:
             Formatted updated results content
         """
-        votes_by_issue: dict[str, list[EstimationVote]] = {}
-        for vote in votes:
-            if vote.issue_number not in votes_by_issue:
-                votes_by_issue[vote.issue_number] = []
-            votes_by_issue[vote.issue_number].append(vote)
+        votes_by_issue = self._aggregate_votes(votes)
 
         all_voters = set(batch_voters)
         voted_voters = {vote.voter for vote in votes}
@@ -680,19 +735,15 @@ class ResultsService:
             final_estimates = {est.issue_number: est for est in final_estimate_objs}
 
         for issue in batch.issues:
-            issue_votes = votes_by_issue.get(issue.issue_number, [])
-
             if issue.issue_number in final_estimates:
                 # Issue has been completed
                 completed_issues.append(issue)
-            elif not issue_votes:
+            elif issue.issue_number not in votes_by_issue:
                 continue
             else:
-                estimates = [vote.points for vote in issue_votes]
-                estimates.sort()
+                _, estimates, estimate_counts = votes_by_issue[issue.issue_number]
 
                 # Analyze consensus
-                estimate_counts = Counter(estimates)
                 most_common_value, most_common_count = estimate_counts.most_common(1)[0]
                 total_votes = len(estimates)
 
@@ -701,15 +752,20 @@ class ResultsService:
                 else:
                     discussion_issues.append((issue, estimates))
 
+        titles = self._issue_titles(
+            [
+                *completed_issues,
+                *(entry[0] for entry in consensus_issues),
+                *(entry[0] for entry in discussion_issues),
+            ]
+        )
+
         # Show completed issues first
         if completed_issues:
             results_content += "**✅ COMPLETED**\n\n"
             for issue in completed_issues:
                 final_est = final_estimates[issue.issue_number]
-                title = (
-                    self.github_api.fetch_issue_title_by_url(issue.url)
-                    or f"Issue {issue.issue_number}"
-                )
+                title = titles[issue.issue_number]
                 results_content += (
                     f"**Issue {issue.issue_number}** - {title}: **{final_est.final_points} points**"
                 )
@@ -722,10 +778,7 @@ class ResultsService:
         if consensus_issues:
             results_content += "**✅ CONSENSUS REACHED**\n\n"
             for issue, consensus_points, _estimates in consensus_issues:
-                title = (
-                    self.github_api.fetch_issue_title_by_url(issue.url)
-                    or f"Issue {issue.issue_number}"
-                )
+                title = titles[issue.issue_number]
                 results_content += (
                     f"**Issue {issue.issue_number}** - {title}: **{consensus_points} points**\n"
                 )
@@ -736,13 +789,11 @@ class ResultsService:
         if discussion_issues:
             results_content += "**⚠️ DISCUSSION NEEDED**\n\n"
             for issue, estimates in discussion_issues:
-                title = (
-                    self.github_api.fetch_issue_title_by_url(issue.url)
-                    or f"Issue {issue.issue_number}"
-                )
+                title = titles[issue.issue_number]
 
                 avg_estimate = self._calculate_average(estimates)
-                min_est, max_est = min(estimates), max(estimates)
+                # Points are sorted, so the range sits at the ends
+                min_est, max_est = estimates[0], estimates[-1]
 
                 results_content += (
                     f"**Issue {issue.issue_number}** - {title}\n"
@@ -755,16 +806,9 @@ class ResultsService:
                     # Lower threshold for discussion questions - any spread >= 3
                     should_ask_questions = max_est - min_est >= 3
                     if should_ask_questions:
-                        high_voters = [
-                            v.voter
-                            for v in votes_by_issue[issue.issue_number]
-                            if v.points == max_est
-                        ]
-                        low_voters = [
-                            v.voter
-                            for v in votes_by_issue[issue.issue_number]
-                            if v.points == min_est
-                        ]
+                        issue_votes = votes_by_issue[issue.issue_number][0]
+                        high_voters = [v.voter for v in issue_votes if v.points == max_est]
+                        low_voters = [v.voter for v in issue_votes if v.points == min_est]
 
                         if high_voters:
                             high_mentions = " @**".join(high_voters)
@@ -813,26 +857,27 @@ class ResultsService:
         )
         results_content += "**✅ FINAL ESTIMATES**\n\n"
 
+        final_estimates_dict = {est.issue_number: est for est in final_estimates}
+        titles = self._issue_titles(
+            issue
+            for issue in batch.issues
+            if issue.issue_number in consensus_estimates
+            or issue.issue_number in final_estimates_dict
+        )
+
         for issue in batch.issues:
             issue_num = issue.issue_number
             if issue_num in consensus_estimates:
                 points = consensus_estimates[issue_num]
-                title = (
-                    self.github_api.fetch_issue_title_by_url(issue.url)
-                    or f"Issue {issue.issue_number}"
-                )
+                title = titles[issue_num]
                 results_content += f"**Issue {issue_num}** - {title}: **{points} points**\n"
 
         # Show discussed issues with rationale
-        final_estimates_dict = {est.issue_number: est for est in final_estimates}
         for issue in batch.issues:
             issue_num = issue.issue_number
             if issue_num in final_estimates_dict:
                 est = final_estimates_dict[issue_num]
-                title = (
-                    self.github_api.fetch_issue_title_by_url(issue.url)
-                    or f"Issue {issue.issue_number}"
-                )
+                title = titles[issue.issue_number]
                 results_content += (
                     f"**Issue {issue_num}** - {title}: **{est.final_points} points** "
                 )
@@ -906,6 +951,7 @@ class VoterValidationService:
             ValidationError: If any voter name is invalid
         """
         clean_voters = []
+        seen: set[str] = set()
 
         for voter in voters:
             if not voter or not voter.strip():
@@ -913,7 +959,8 @@ class VoterValidationService:
 
             try:
                 clean_voter = VoterValidationService.validate_voter_name(voter)
-                if clean_voter not in clean_voters:
+                if clean_voter not in seen:
+                    seen.add(clean_voter)
                     clean_voters.append(clean_voter)
             except ValidationError as e:
                 logger.warning("Skipping invalid voter name", voter=voter, error=str(e))
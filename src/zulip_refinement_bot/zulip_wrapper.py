@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Callable
 from typing import Any, TypedDict, cast
 
 import structlog
@@ -52,11 +53,11 @@ class ZulipClientWrapper(ZulipClientInterface):
         Returns:
             The API response
         """
-        response = self._send_message_with_retry(message_data)
+        response = self._call_with_retry(self.client.send_message, message_data)
         return dict(response)
 
     def update_message(self, message_data: dict[str, Any]) -> dict[str, Any]:
-        """Update a message via Zulip API.
+        """Update a message via Zulip API with retry logic.
 
         Args:
             message_data: The message data to update
@@ -64,7 +65,7 @@ class ZulipClientWrapper(ZulipClientInterface):
         Returns:
             The API response
         """
-        response = self.client.update_message(message_data)
+        response = self._call_with_retry(self.client.update_message, message_data)
         return dict(response) if response else {}
 
     def call_on_each_message(self, handler: Any) -> None:
@@ -75,13 +76,20 @@ class ZulipClientWrapper(ZulipClientInterface):
         """
         self.client.call_on_each_message(handler)
 
-    def _send_message_with_retry(
-        self, message_data: dict[str, Any], max_retries: int = 3
+    def _call_with_retry(
+        self,
+        api_call: Callable[[dict[str, Any]], dict[str, Any]],
+        message_data: dict[str, Any],
+        max_retries: int = 3,
     ) -> ZulipResponse:
-        """Send a message with automatic retry on rate limits.
+        """Make a Zulip API call with automatic retry on rate limits.
+
+        Waits for the server's retry-after interval when one is given and backs
+        off exponentially otherwise.
 
         Args:
-            message_data: The message data to send
+            api_call: Client method to call, e.g. send_message or update_message
+            message_data: The message data to pass to the call
             max_retries: Maximum number of retry attempts
 
         Returns:
@@ -92,11 +100,11 @@ class ZulipClientWrapper(ZulipClientInterface):
         """
         for attempt in range(max_retries + 1):
             try:
-                response = self.client.send_message(message_data)
+                response = api_call(message_data)
 
                 # Check if we hit a rate limit
                 if response.get("result") == "error" and response.get("code") == "RATE_LIMIT_HIT":
-                    retry_after = response.get("retry-after", 1.0)
+                    retry_after = response.get("retry-after", float(2**attempt))
 
                     if attempt < max_retries:
                         logger.warning(
@@ -120,7 +128,7 @@ class ZulipClientWrapper(ZulipClientInterface):
             except Exception as e:
                 if attempt < max_retries and "rate limit" in str(e).lower():
                     logger.warning(
-                        "Exception during message send, retrying",
+                        "Exception during Zulip API call, retrying",
                         attempt=attempt + 1,
                         error=str(e),
                     )
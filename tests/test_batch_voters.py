@@ -69,6 +69,30 @@ def test_batch_voters_add_duplicate_voter_to_batch(db_manager: DatabaseManager):
     assert len(voters) == 2
 
 
+def test_batch_voters_add_voters_to_batch(db_manager: DatabaseManager):
+    """Test adding several voters to a batch at once."""
+    batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+    db_manager.add_batch_voters(batch_id, ["Alice", "Bob"])
+
+    added, already_present = db_manager.add_voters_to_batch(batch_id, ["Charlie", "Alice", "David"])
+
+    assert added == ["Charlie", "David"]
+    assert already_present == ["Alice"]
+    assert db_manager.get_batch_voters(batch_id) == ["Alice", "Bob", "Charlie", "David"]
+
+
+def test_batch_voters_remove_voters_from_batch(db_manager: DatabaseManager):
+    """Test removing several voters from a batch at once."""
+    batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+    db_manager.add_batch_voters(batch_id, ["Alice", "Bob", "Charlie"])
+
+    removed, not_present = db_manager.remove_voters_from_batch(batch_id, ["Bob", "Eve", "Alice"])
+
+    assert removed == ["Bob", "Alice"]
+    assert not_present == ["Eve"]
+    assert db_manager.get_batch_voters(batch_id) == ["Charlie"]
+
+
 def test_batch_voters_isolated_between_batches(db_manager: DatabaseManager):
     """Test that voters are isolated between different batches."""
     # Create first batch
@@ -303,7 +327,7 @@ def test_add_voter_updates_batch_message():
     mock_active_batch = MagicMock()
     mock_active_batch.id = 1
     mock_batch_service.get_active_batch.return_value = mock_active_batch
-    mock_batch_service.database.add_voter_to_batch.return_value = True
+    mock_batch_service.database.add_voters_to_batch.return_value = (["newuser"], [])
 
     handler = MessageHandler(
         mock_config,
@@ -327,7 +351,7 @@ def test_add_voter_updates_batch_message():
         handler.handle_add_voter(message, content)
 
         # Verify voter was added
-        mock_batch_service.database.add_voter_to_batch.assert_called_once_with(1, "newuser")
+        mock_batch_service.database.add_voters_to_batch.assert_called_once_with(1, ["newuser"])
 
         # Verify batch message was updated
         mock_update.assert_called_once_with(1, mock_active_batch)
@@ -353,7 +377,7 @@ def test_remove_voter_updates_batch_message():
     mock_active_batch = MagicMock()
     mock_active_batch.id = 1
     mock_batch_service.get_active_batch.return_value = mock_active_batch
-    mock_batch_service.database.remove_voter_from_batch.return_value = True
+    mock_batch_service.database.remove_voters_from_batch.return_value = (["olduser"], [])
 
     handler = MessageHandler(
         mock_config,
@@ -377,7 +401,7 @@ def test_remove_voter_updates_batch_message():
         handler.handle_remove_voter(message, content)
 
         # Verify voter was removed
-        mock_batch_service.database.remove_voter_from_batch.assert_called_once_with(1, "olduser")
+        mock_batch_service.database.remove_voters_from_batch.assert_called_once_with(1, ["olduser"])
 
         # Verify batch message was updated
         mock_update.assert_called_once_with(1, mock_active_batch)
@@ -403,7 +427,10 @@ def test_no_update_when_voter_already_exists():
     mock_active_batch = MagicMock()
     mock_active_batch.id = 1
     mock_batch_service.get_active_batch.return_value = mock_active_batch
-    mock_batch_service.database.add_voter_to_batch.return_value = False  # Already exists
+    mock_batch_service.database.add_voters_to_batch.return_value = (
+        [],
+        ["existing_user"],
+    )  # Already exists
 
     handler = MessageHandler(
         mock_config,
@@ -427,7 +454,9 @@ def test_no_update_when_voter_already_exists():
         handler.handle_add_voter(message, content)
 
         # Verify voter addition was attempted
-        mock_batch_service.database.add_voter_to_batch.assert_called_once_with(1, "existing_user")
+        mock_batch_service.database.add_voters_to_batch.assert_called_once_with(
+            1, ["existing_user"]
+        )
 
         # Verify batch message was NOT updated (since no change occurred)
         mock_update.assert_not_called()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 import pytest
 
@@ -150,6 +151,19 @@ def test_business_hours_format_business_deadline_basic(calculator: BusinessHours
     assert "2024-01-08 14:00" in result
 
 
+def test_business_hours_format_business_deadline_is_memoized(
+    calculator: BusinessHoursCalculator,
+) -> None:
+    """Test repeated formatting of a deadline looks up holidays only once."""
+    deadline = datetime(2024, 1, 8, 14, 0, tzinfo=UTC)
+    with patch.object(calculator, "get_holiday_info", return_value=None) as get_holiday_info:
+        first = calculator.format_business_deadline(deadline)
+        second = calculator.format_business_deadline(deadline)
+
+    assert first == second
+    get_holiday_info.assert_called_once_with(deadline)
+
+
 def test_business_hours_format_business_deadline_with_holiday(
     calculator: BusinessHoursCalculator,
 ) -> None:
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pytest
+
 from zulip_refinement_bot.database import DatabaseManager
 from zulip_refinement_bot.models import IssueData
 
@@ -70,6 +72,18 @@ def test_database_manager_get_active_batch_with_issues(
         assert retrieved.url == original.url
 
 
+def test_database_manager_get_active_batch_without_issues(db_manager: DatabaseManager):
+    """Test a batch with no issues yet still loads from the joined query."""
+    batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+
+    active_batch = db_manager.get_active_batch()
+
+    assert active_batch is not None
+    assert active_batch.id == batch_id
+    assert active_batch.facilitator == "Test User"
+    assert active_batch.issues == []
+
+
 def test_database_manager_cancel_batch(db_manager: DatabaseManager):
     """Test batch cancellation."""
     # Create a batch
@@ -177,6 +191,60 @@ def test_database_manager_has_voter_voted(db_manager: DatabaseManager):
     assert db_manager.has_voter_voted(batch_id, "Voter 2") is False
 
 
+def test_database_manager_get_batch_voters_and_counts(db_manager: DatabaseManager):
+    """Test fetching voters, remaining voters and completed count together."""
+    batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+    db_manager.add_issues_to_batch(
+        batch_id,
+        [
+            IssueData(issue_number="1234", title="Issue 1", url=""),
+            IssueData(issue_number="1235", title="Issue 2", url=""),
+        ],
+    )
+    db_manager.add_batch_voters(batch_id, ["Alice", "Bob", "Charlie"])
+
+    db_manager.upsert_vote(batch_id, "Alice", "1234", 5)
+    db_manager.upsert_vote(batch_id, "Alice", "1235", 8)
+    db_manager.upsert_vote(batch_id, "Bob", "1234", 3)
+
+    voters, remaining_voters, completed_count = db_manager.get_batch_voters_and_counts(batch_id)
+
+    assert voters == ["Alice", "Bob", "Charlie"]
+    assert remaining_voters == ["Charlie"]
+    assert completed_count == 1
+
+
+def test_database_manager_get_batch_votes_and_voters(db_manager: DatabaseManager):
+    """Test fetching votes, voters and completed count in one call."""
+    batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+    db_manager.add_issues_to_batch(batch_id, [IssueData(issue_number="1234", title="", url="")])
+    db_manager.add_batch_voters(batch_id, ["Bob", "Alice"])
+    db_manager.upsert_vote(batch_id, "Bob", "1234", 3)
+
+    votes, voters, completed_count = db_manager.get_batch_votes_and_voters(batch_id)
+
+    assert [(v.voter, v.issue_number, v.points) for v in votes] == [("Bob", "1234", 3)]
+    assert votes == db_manager.get_batch_votes(batch_id)
+    assert voters == ["Alice", "Bob"]
+    assert completed_count == 1
+
+
+def test_database_manager_bulk_upsert_votes(db_manager: DatabaseManager):
+    """Test storing a voter's estimates in one call, replacing earlier votes and abstentions."""
+    batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+    db_manager.upsert_vote(batch_id, "Alice", "1234", 5)
+    db_manager.upsert_abstention(batch_id, "Alice", "1235")
+
+    new_count, updated_count = db_manager.bulk_upsert_votes(
+        batch_id, "Alice", {"1234": 8, "1235": 3, "1236": 13}
+    )
+
+    assert (new_count, updated_count) == (2, 1)
+    votes = {v.issue_number: v.points for v in db_manager.get_batch_votes(batch_id)}
+    assert votes == {"1234": 8, "1235": 3, "1236": 13}
+    assert db_manager.get_voter_abstentions(batch_id, "Alice") == []
+
+
 def test_database_manager_update_batch_message_id(db_manager: DatabaseManager):
     """Test updating batch message ID."""
     # Create a batch
@@ -239,3 +307,33 @@ def test_database_manager_auto_completion_detection(db_manager: DatabaseManager)
     active_batch = db_manager.get_active_batch()
     assert active_batch is not None
     assert active_batch.status == "active"
+
+
+def test_database_manager_transaction_commits_together(db_manager: DatabaseManager):
+    """Test writes inside a transaction are visible together and roll back together."""
+    with db_manager.transaction():
+        batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+        db_manager.add_issues_to_batch(batch_id, [IssueData(issue_number="1234", url="")])
+        # Reads on the same thread see the uncommitted writes
+        assert db_manager.get_batch_issues(batch_id)[0].issue_number == "1234"
+
+    active_batch = db_manager.get_active_batch()
+    assert active_batch is not None
+    assert [issue.issue_number for issue in active_batch.issues] == ["1234"]
+
+    with pytest.raises(RuntimeError), db_manager.transaction():
+        db_manager.add_batch_voters(batch_id, ["Alice"])
+        raise RuntimeError("abort")
+
+    assert db_manager.get_batch_voters(batch_id) == []
+
+
+def test_database_manager_transaction_resets_row_factory(db_manager: DatabaseManager):
+    """Test a method's row_factory doesn't carry over to the next call in a transaction."""
+    db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+
+    with db_manager.transaction():
+        assert db_manager.get_active_batch() is not None
+        conn = db_manager._connect()
+        assert conn.row_factory is None
+        assert type(conn.execute("SELECT 1").fetchone()) is tuple
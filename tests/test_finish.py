@@ -165,8 +165,13 @@ def test_batch_service_complete_discussion_phase_success(test_config: Config) ->
 
     # Assertions
     assert result_batch.status == "completed"
-    mock_database.store_final_estimate.assert_any_call(1, "1234", 5, "After discussion")
-    mock_database.store_final_estimate.assert_any_call(1, "1235", 8, "Agreed complexity")
+    mock_database.store_final_estimates.assert_called_once()
+    stored_batch_id, stored_estimates = mock_database.store_final_estimates.call_args.args
+    assert stored_batch_id == 1
+    assert list(stored_estimates) == [
+        ("1234", 5, "After discussion"),
+        ("1235", 8, "Agreed complexity"),
+    ]
     mock_database.complete_batch.assert_called_once_with(1)
 
 
@@ -223,6 +228,32 @@ def test_message_handler_parse_finish_input_invalid_points(
     assert result == expected
 
 
+def test_message_handler_parse_finish_input_rationale_with_commas(
+    message_handler: MessageHandler,
+) -> None:
+    """Test that only a comma followed by an issue reference separates items."""
+    content = "finish #1234: 5 Small, well understood,#1235:8, #1236: 3"
+
+    result = message_handler._parse_finish_input(content)
+
+    assert result == {
+        "1234": (5, "Small, well understood"),
+        "1235": (8, ""),
+        "1236": (3, ""),
+    }
+
+
+def test_message_handler_parse_finish_input_item_without_comma(
+    message_handler: MessageHandler,
+) -> None:
+    """Test that an issue token ends the previous rationale even without a comma."""
+    content = "finish #1: 3 dup of #2: 5"
+
+    result = message_handler._parse_finish_input(content)
+
+    assert result == {"1": (3, "dup of"), "2": (5, "")}
+
+
 def test_message_handler_parse_finish_input_empty(
     message_handler: MessageHandler,
 ) -> None:
@@ -392,6 +423,46 @@ def test_results_service_generate_results_content_with_discussion_needed(
     assert "Example:" in results
 
 
+def test_results_service_generate_results_reports_discussion_flag(
+    results_service: ResultsService,
+    mock_github_api: MagicMock,
+) -> None:
+    """Test that generate_results flags discussion without inspecting the text."""
+    mock_github_api.fetch_issue_title_by_url.return_value = "Test Issue 1"
+    batch = BatchData(
+        id=1,
+        date="2024-03-25",
+        deadline="2024-03-27T14:00:00+00:00",
+        facilitator="Test User",
+        issues=[
+            IssueData(issue_number="1234", url="https://github.com/test/repo/issues/1234"),
+        ],
+    )
+    batch_voters = ["Alice", "Bob", "Charlie"]
+
+    consensus_votes = [
+        EstimationVote(voter="Alice", issue_number="1234", points=5),
+        EstimationVote(voter="Bob", issue_number="1234", points=5),
+        EstimationVote(voter="Charlie", issue_number="1234", points=8),
+    ]
+    content, needs_discussion = results_service.generate_results(
+        batch, consensus_votes, 3, 3, batch_voters
+    )
+    assert needs_discussion is False
+    assert "✅ **CONSENSUS REACHED**" in content
+
+    split_votes = [
+        EstimationVote(voter="Alice", issue_number="1234", points=1),
+        EstimationVote(voter="Bob", issue_number="1234", points=13),
+        EstimationVote(voter="Charlie", issue_number="1234", points=21),
+    ]
+    content, needs_discussion = results_service.generate_results(
+        batch, split_votes, 3, 3, batch_voters
+    )
+    assert needs_discussion is True
+    assert "⚠️ **DISCUSSION NEEDED**" in content
+
+
 def test_database_set_batch_discussing(db_manager: DatabaseManager) -> None:
     """Test setting batch to discussing status."""
     # Create batch
@@ -427,6 +498,19 @@ def test_database_store_and_get_final_estimates(db_manager: DatabaseManager) ->
     assert estimates_dict["1235"].rationale == "More complex than expected"
 
 
+def test_database_store_final_estimates_bulk(db_manager: DatabaseManager) -> None:
+    """Test storing several final estimates in one call."""
+    batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+
+    db_manager.store_final_estimates(
+        batch_id, iter([("1234", 5, "Consensus"), ("1235", 8, "Consensus")])
+    )
+    db_manager.store_final_estimates(batch_id, [])
+
+    estimates = {e.issue_number: e.final_points for e in db_manager.get_final_estimates(batch_id)}
+    assert estimates == {"1234": 5, "1235": 8}
+
+
 def test_database_store_final_estimate_update(db_manager: DatabaseManager) -> None:
     """Test updating a final estimate."""
     # Create batch
@@ -467,8 +551,8 @@ def test_discussion_complete_integration_batch_completion_triggers_discussion_ph
     assert batch is not None
 
     # Mock the results service to return discussion needed content
-    with patch.object(message_handler.results_service, "generate_results_content") as mock_generate:
-        mock_generate.return_value = "⚠️ **DISCUSSION NEEDED** Some content here"
+    with patch.object(message_handler.results_service, "generate_results") as mock_generate:
+        mock_generate.return_value = ("⚠️ **DISCUSSION NEEDED** Some content here", True)
 
         # Process batch completion
         message_handler._process_batch_completion(batch, auto_completed=True)
@@ -616,3 +700,128 @@ def test_no_auto_finish_when_discussion_needed(
 
         final_estimates = db_manager.get_final_estimates(batch_id)
         assert len(final_estimates) == 0
+
+
+def test_batch_status_messages_share_rendered_preamble(
+    message_handler: MessageHandler,
+    active_batch_discussing: BatchData,
+    db_manager: DatabaseManager,
+) -> None:
+    """Test that discussion and completion status edits reuse one rendered preamble."""
+    batch_id = active_batch_discussing.id
+    assert batch_id is not None
+    db_manager.update_batch_message_id(batch_id, 42)
+    batch = db_manager.get_active_batch()
+    assert batch is not None
+    update_message = message_handler.zulip_client.update_message
+    update_message.return_value = {"result": "success"}
+    fetch_title = message_handler.github_api.fetch_issue_title_by_url
+
+    message_handler._update_batch_discussion_status(batch, 3, 3)
+    fetches_after_discussion = fetch_title.call_count
+    message_handler._update_batch_completion_status(batch, 3, 3, auto_completed=True)
+
+    assert fetch_title.call_count == fetches_after_discussion
+    discussion_content = update_message.call_args_list[0][0][0]["content"]
+    completed_content = update_message.call_args_list[1][0][0]["content"]
+    assert discussion_content.startswith("**📦 BATCH REFINEMENT - DISCUSSION PHASE** 🗣️\n")
+    assert completed_content.startswith(
+        "**📦 BATCH REFINEMENT - COMPLETED** (All votes received)\n**Stories**:"
+    )
+    assert "`#1234: 5, #1235: 8, #1234: 3`" in completed_content
+    assert "**Status**: ✅ Vote complete (3/3 received)" in completed_content
+    assert completed_content.endswith("*Results posted below*")
+    assert batch_id not in message_handler._status_preamble_cache
+
+
+def test_consensus_completion_reads_votes_once(
+    message_handler: MessageHandler,
+    db_manager: DatabaseManager,
+) -> None:
+    """Test that full-consensus completion reuses its vote analysis for the results post."""
+    batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+    db_manager.add_issues_to_batch(
+        batch_id, [IssueData(issue_number="1234", title="Test Issue", url="")]
+    )
+    db_manager.add_batch_voters(batch_id, ["Alice", "Bob"])
+    db_manager.upsert_vote(batch_id, "Alice", "1234", 5)
+    db_manager.upsert_vote(batch_id, "Bob", "1234", 5)
+    db_manager.update_batch_message_id(batch_id, 42)
+    message_handler.zulip_client.send_message.return_value = {"result": "success"}
+    message_handler.zulip_client.update_message.return_value = {"result": "success"}
+
+    batch = db_manager.get_active_batch()
+    assert batch is not None
+
+    with (
+        patch.object(
+            db_manager, "get_batch_votes_and_voters", wraps=db_manager.get_batch_votes_and_voters
+        ) as get_snapshot,
+        patch.object(db_manager, "get_batch_votes", wraps=db_manager.get_batch_votes) as get_votes,
+        patch.object(db_manager, "get_batch_voters_and_counts") as get_voter_progress,
+    ):
+        message_handler._process_batch_completion(batch, auto_completed=True)
+
+    get_snapshot.assert_called_once_with(batch_id)
+    get_votes.assert_not_called()
+    get_voter_progress.assert_not_called()
+    message_handler.zulip_client.update_message.assert_called_once()
+    estimates = db_manager.get_final_estimates(batch_id)
+    assert [(e.issue_number, e.final_points) for e in estimates] == [("1234", 5)]
+    message_handler.zulip_client.send_message.assert_called_once()
+
+
+def test_extract_consensus_estimates(message_handler: MessageHandler) -> None:
+    """Test consensus extraction keeps only majority estimates."""
+    batch = BatchData(
+        id=1,
+        date="2024-01-01",
+        deadline="2024-01-02T00:00:00",
+        facilitator="facilitator",
+        issues=[
+            IssueData(issue_number="1234", title="Majority", url=""),
+            IssueData(issue_number="1235", title="Split", url=""),
+            IssueData(issue_number="1236", title="Unvoted", url=""),
+        ],
+    )
+    votes = [
+        EstimationVote(voter="Alice", issue_number="1234", points=5),
+        EstimationVote(voter="Bob", issue_number="1234", points=5),
+        EstimationVote(voter="Charlie", issue_number="1234", points=8),
+        EstimationVote(voter="Alice", issue_number="1235", points=3),
+        EstimationVote(voter="Bob", issue_number="1235", points=8),
+    ]
+
+    assert message_handler._extract_consensus_estimates(batch, votes) == {"1234": 5}
+    assert message_handler._extract_consensus_estimates(batch, []) == {}
+
+
+def test_manual_completion_updates_message_and_posts_results(
+    message_handler: MessageHandler,
+    db_manager: DatabaseManager,
+) -> None:
+    """Test that a facilitator's complete command transitions once and still posts results."""
+    batch_id = db_manager.create_batch("2024-03-25", "2024-03-27T14:00:00+00:00", "Test User")
+    db_manager.add_issues_to_batch(
+        batch_id, [IssueData(issue_number="1234", title="Test Issue", url="")]
+    )
+    db_manager.add_batch_voters(batch_id, ["Alice", "Bob"])
+    db_manager.upsert_vote(batch_id, "Alice", "1234", 5)
+    db_manager.upsert_vote(batch_id, "Bob", "1234", 5)
+    db_manager.update_batch_message_id(batch_id, 42)
+    message_handler.zulip_client.send_message.return_value = {"result": "success"}
+    message_handler.zulip_client.update_message.return_value = {"result": "success"}
+
+    message_handler.handle_complete(
+        {"sender_full_name": "Test User", "sender_email": "test@example.com"}
+    )
+
+    assert db_manager.get_active_batch() is None
+    edited = message_handler.zulip_client.update_message.call_args[0][0]["content"]
+    assert edited.startswith("**📦 BATCH REFINEMENT - COMPLETED** (Deadline reached)")
+    stream_posts = [
+        call[0][0]
+        for call in message_handler.zulip_client.send_message.call_args_list
+        if call[0][0]["type"] == "stream"
+    ]
+    assert len(stream_posts) == 1
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import httpx
 
-from zulip_refinement_bot.github_api import GitHubAPI
+from zulip_refinement_bot.github_api import GitHubAPI, fetch_issue_titles
 
 
 def test_github_api_init():
@@ -149,3 +150,38 @@ def test_github_api_fetch_issue_title_custom_timeout(mock_client_class: MagicMoc
     mock_client.get.assert_called_once_with(
         "https://api.github.com/repos/conda/conda/issues/15169", timeout=5.0
     )
+
+
+def test_fetch_issue_titles_overlaps_requests_and_keeps_order():
+    """Test titles are fetched concurrently and returned in URL order."""
+    urls = [f"https://github.com/conda/conda/issues/{number}" for number in (1, 2, 3)]
+    # Every lookup waits for all the others, so this only passes if they overlap
+    barrier = threading.Barrier(len(urls), timeout=5)
+
+    def fetch_title(url: str) -> str | None:
+        barrier.wait()
+        return None if url.endswith("/2") else f"Title {url.rsplit('/', 1)[1]}"
+
+    github_api = MagicMock()
+    github_api.fetch_issue_title_by_url.side_effect = fetch_title
+
+    assert fetch_issue_titles(github_api, urls) == ["Title 1", None, "Title 3"]
+
+
+def test_fetch_issue_titles_reuses_worker_threads():
+    """Test repeated lookups run on the same long-lived pool threads."""
+    threads: set[threading.Thread] = set()
+
+    def fetch_title(url: str) -> str:
+        threads.add(threading.current_thread())
+        return "Title"
+
+    github_api = MagicMock()
+    github_api.fetch_issue_title_by_url.side_effect = fetch_title
+    urls = [f"https://github.com/conda/conda/issues/{number}" for number in range(4)]
+
+    for _ in range(10):
+        assert fetch_issue_titles(github_api, urls) == ["Title"] * len(urls)
+
+    assert all(thread.name.startswith("github-title") for thread in threads)
+    assert len(threads) <= 8
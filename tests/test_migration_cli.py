@@ -8,6 +8,7 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+import structlog
 from typer.testing import CliRunner
 
 from src.zulip_refinement_bot.migrations.cli import app
@@ -273,3 +274,38 @@ def test_migration_cli_cli_output_formatting(runner: CliRunner, temp_db: Path):
 
     # Should show rollback capability indicators
     assert "✓" in result.stdout or "✗" in result.stdout
+
+
+def test_migration_cli_configures_logging(runner: CliRunner, temp_db: Path):
+    """Test migrate commands install the structlog configuration when none is set."""
+    structlog.reset_defaults()
+    try:
+        result = runner.invoke(app, ["status", "--db-path", str(temp_db)])
+        assert result.exit_code == 0
+        assert structlog.is_configured()
+    finally:
+        structlog.reset_defaults()
+
+
+def test_migration_cli_logging_follows_config(
+    runner: CliRunner, temp_db: Path, monkeypatch: pytest.MonkeyPatch
+):
+    """Test migrate commands use the configured log level and format."""
+    for name, value in {
+        "ZULIP_EMAIL": "bot@example.com",
+        "ZULIP_API_KEY": "key",
+        "ZULIP_SITE": "https://example.zulipchat.com",
+        "ZULIP_TOKEN": "token",
+        "DATABASE_PATH": str(temp_db),
+        "LOG_LEVEL": "DEBUG",
+        "LOG_FORMAT": "console",
+    }.items():
+        monkeypatch.setenv(name, value)
+    structlog.reset_defaults()
+    try:
+        with patch("src.zulip_refinement_bot.cli.setup_logging") as mock_setup:
+            result = runner.invoke(app, ["status", "--db-path", str(temp_db)])
+        assert result.exit_code == 0
+        mock_setup.assert_called_once_with("DEBUG", "console")
+    finally:
+        structlog.reset_defaults()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 import sqlite3
 import tempfile
 from collections.abc import Generator
@@ -16,6 +17,9 @@ from src.zulip_refinement_bot.migrations.versions import (
     BatchVotersMigration,
     FinalEstimatesMigration,
     InitialSchemaMigration,
+    m002_add_message_id,
+    m003_batch_voters,
+    m008_add_results_message_id,
 )
 
 
@@ -213,6 +217,55 @@ def test_migration_versions_add_message_id_down_migration(temp_db: Path):
         assert "message_id" not in columns
 
 
+@pytest.mark.parametrize("native_drop", [True, False])
+def test_migration_versions_add_message_id_down_keeps_rows(
+    temp_db: Path, monkeypatch: pytest.MonkeyPatch, native_drop: bool
+):
+    """Test both the DROP COLUMN and the table-rebuild rollback paths keep batch rows."""
+    monkeypatch.setattr(m002_add_message_id, "SUPPORTS_DROP_COLUMN", native_drop)
+    initial_migration = InitialSchemaMigration()
+    migration = AddMessageIdMigration()
+
+    with sqlite3.connect(temp_db) as conn:
+        initial_migration.up(conn)
+        migration.up(conn)
+        conn.execute(
+            "INSERT INTO batches (date, deadline, facilitator, message_id) "
+            "VALUES ('2024-01-01', '2024-01-02T10:00:00', 'facilitator', 42)"
+        )
+
+        migration.down(conn)
+
+        assert not migration.column_exists(conn, "batches", "message_id")
+        assert conn.execute("SELECT facilitator FROM batches").fetchall() == [("facilitator",)]
+
+
+def test_migration_versions_table_rebuilds_index_after_copy(
+    migration_runner: MigrationRunner, monkeypatch: pytest.MonkeyPatch
+):
+    """Test table rebuilds copy rows into an unindexed table and index afterwards."""
+    for module in (m002_add_message_id, m008_add_results_message_id):
+        monkeypatch.setattr(module, "SUPPORTS_DROP_COLUMN", False)
+    statements: list[str] = []
+    migration_runner._connect().set_trace_callback(statements.append)
+
+    migration_runner.run_migrations()
+    for version in ["010", "009", "008", "007", "006", "005", "004", "003", "002"]:
+        migration_runner.rollback_migration(version)
+
+    rebuilding = None
+    rebuilds = 0
+    for statement in (" ".join(s.split()) for s in statements):
+        if match := re.match(r"CREATE TABLE (?:IF NOT EXISTS )?(\w+_new)", statement):
+            rebuilding = match.group(1)
+        elif rebuilding and statement.startswith("CREATE INDEX"):
+            pytest.fail(f"index created on {rebuilding} before its rows were copied")
+        elif rebuilding and statement.startswith(f"INSERT INTO {rebuilding}"):
+            rebuilding = None
+            rebuilds += 1
+    assert rebuilds == 4
+
+
 def test_migration_versions_add_message_id_validation(temp_db: Path):
     """Test migration validation."""
     initial_migration = InitialSchemaMigration()
@@ -322,6 +375,9 @@ def test_migration_versions_data_migration(temp_db: Path):
         voter_count = cursor.fetchone()[0]
         assert voter_count > 0  # Should have some default voters
 
+        cursor = conn.execute("SELECT DISTINCT voter_name FROM batch_voters")
+        assert {row[0] for row in cursor.fetchall()} == set(m003_batch_voters._DEFAULT_VOTERS)
+
 
 def test_migration_versions_batch_voters_validation(temp_db: Path):
     """Test migration validation."""
@@ -454,13 +510,48 @@ def test_migration_versions_final_estimates_indexes_created(temp_db: Path):
         expected_indexes = {"idx_final_estimates_batch_id", "idx_final_estimates_issue"}
         assert expected_indexes.issubset(indexes)
 
+
+def test_migration_versions_final_estimates_lookups_use_unique_index(
+    migration_runner: MigrationRunner,
+):
+    """Test the redundant indexes are dropped and batch lookups use the unique index."""
+    migration_runner.run_migrations()
+
+    with sqlite3.connect(migration_runner.db_path) as conn:
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' "
+            "AND name LIKE 'idx_final_estimates_%'"
+        )
+        assert cursor.fetchall() == []
+
+        plan = conn.execute(
+            "EXPLAIN QUERY PLAN SELECT issue_number, final_points FROM final_estimates "
+            "WHERE batch_id = ? ORDER BY issue_number",
+            (1,),
+        ).fetchall()
+        details = " ".join(row[3] for row in plan)
+        assert "sqlite_autoindex_final_estimates_1" in details
+        assert "TEMP B-TREE" not in details
+
+
+def test_migration_versions_voter_indexes_keep_voter_lookup(migration_runner: MigrationRunner):
+    """Test only the batch_id indexes duplicated by unique constraints are dropped."""
+    migration_runner.run_migrations()
+
+    with sqlite3.connect(migration_runner.db_path) as conn:
+        cursor = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' "
+            "AND tbl_name IN ('batch_voters', 'abstentions') AND name LIKE 'idx_%'"
+        )
+        assert {row[0] for row in cursor.fetchall()} == {"idx_abstentions_voter"}
+
     """Integration tests for all migrations together."""
 
 
 def test_migration_versions_all_migrations_run_successfully(migration_runner: MigrationRunner):
     """Test that all migrations can be applied successfully."""
     applied = migration_runner.run_migrations()
-    expected_versions = ["001", "002", "003", "004", "005", "006", "007", "008"]
+    expected_versions = ["001", "002", "003", "004", "005", "006", "007", "008", "009", "010"]
     assert applied == expected_versions
 
 
@@ -477,7 +568,7 @@ def test_migration_versions_migration_order_dependency(migration_runner: Migrati
 
     # Verify they are in correct order
     versions = [m.version for m in pending]
-    assert versions == ["001", "002", "003", "004", "005", "006", "007", "008"]
+    assert versions == ["001", "002", "003", "004", "005", "006", "007", "008", "009", "010"]
 
 
 def test_migration_versions_complete_schema_after_all_migrations(temp_db: Path):
@@ -515,13 +606,32 @@ def test_migration_versions_complete_schema_after_all_migrations(temp_db: Path):
         assert expected_columns.issubset(columns)
 
 
+def test_migration_versions_issues_schema_after_all_migrations(temp_db: Path):
+    """Test the issues table drops title and keeps url NOT NULL."""
+    runner = MigrationRunner(temp_db)
+    runner.register_migrations(ALL_MIGRATIONS)
+    runner.run_migrations()
+
+    with sqlite3.connect(temp_db) as conn:
+        columns = {
+            row[1]: (row[2], row[3], row[4]) for row in conn.execute("PRAGMA table_info(issues)")
+        }
+
+    assert columns == {
+        "id": ("INTEGER", 0, None),
+        "batch_id": ("INTEGER", 0, None),
+        "issue_number": ("TEXT", 1, None),
+        "url": ("TEXT", 1, None),
+    }
+
+
 def test_migration_versions_rollback_all_migrations(migration_runner: MigrationRunner):
     """Test rolling back all migrations in reverse order."""
     # Apply all migrations
     migration_runner.run_migrations()
 
     # Rollback in reverse order
-    versions_to_rollback = ["008", "007", "006", "005", "004", "003", "002", "001"]
+    versions_to_rollback = ["010", "009", "008", "007", "006", "005", "004", "003", "002", "001"]
     for version in versions_to_rollback:
         migration_runner.rollback_migration(version)
 
@@ -550,7 +660,7 @@ def test_migration_versions_partial_rollback_and_reapply(migration_runner: Migra
 
     # Verify state
     applied = migration_runner.get_applied_migrations()
-    assert applied == {"001", "002", "005", "006", "007", "008"}
+    assert applied == {"001", "002", "005", "006", "007", "008", "009", "010"}
 
     # Reapply migrations
     reapplied = migration_runner.run_migrations()
@@ -558,4 +668,4 @@ def test_migration_versions_partial_rollback_and_reapply(migration_runner: Migra
 
     # Verify final state
     final_applied = migration_runner.get_applied_migrations()
-    assert final_applied == {"001", "002", "003", "004", "005", "006", "007", "008"}
+    assert final_applied == {"001", "002", "003", "004", "005", "006", "007", "008", "009", "010"}
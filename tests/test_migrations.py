@@ -14,7 +14,7 @@ from src.zulip_refinement_bot.migrations.base import (
     MigrationError,
     SchemaValidationMixin,
 )
-from src.zulip_refinement_bot.migrations.runner import MigrationRunner
+from src.zulip_refinement_bot.migrations.runner import MigrationRunner, connect
 
 
 class MockMigration(Migration, SchemaValidationMixin):
@@ -170,6 +170,68 @@ def test_migrations_execute_sql_error_handling(temp_db: Path):
             migration.execute_sql(conn, "INVALID SQL SYNTAX")
 
 
+def test_migrations_execute_script(temp_db: Path):
+    """Test multi-statement scripts run together and wrap SQL errors."""
+    migration = MockMigration("001", "Test migration")
+
+    with sqlite3.connect(temp_db) as conn:
+        migration.execute_script(conn, "CREATE TABLE a (id INTEGER); CREATE TABLE b (id INTEGER);")
+        assert migration.table_exists(conn, "a")
+        assert migration.table_exists(conn, "b")
+
+        with pytest.raises(MigrationError):
+            migration.execute_script(conn, "CREATE TABLE c (id INTEGER); INVALID SQL SYNTAX;")
+
+
+def test_migrations_table_schema_cache_invalidated_by_ddl(temp_db: Path):
+    """Test table_info is cached per table and refreshed after schema changes."""
+    migration = MockMigration("001", "Test migration")
+
+    with sqlite3.connect(temp_db) as conn:
+        migration.execute_sql(conn, "CREATE TABLE t (id INTEGER)")
+        first = migration.get_table_schema(conn, "t")
+        assert migration.get_table_schema(conn, "t") is first
+        assert not migration.column_exists(conn, "t", "name")
+
+        migration.execute_sql(conn, "ALTER TABLE t ADD COLUMN name TEXT")
+        assert migration.column_exists(conn, "t", "name")
+
+
+def test_migrations_table_schema_cache_bound_to_connection(temp_db: Path, tmp_path: Path):
+    """Test cached table_info never answers for a different connection."""
+    migration = MockMigration("001", "Test migration")
+
+    conn = sqlite3.connect(temp_db)
+    migration.execute_sql(conn, "CREATE TABLE t (id INTEGER)")
+    assert migration.table_exists(conn, "t")
+    conn.close()
+    del conn
+
+    other = sqlite3.connect(tmp_path / "other.db")
+    try:
+        assert not migration.table_exists(other, "t")
+    finally:
+        other.close()
+
+    migration.clear_schema_cache()
+    assert migration._schema_conn is None
+
+
+def test_migrations_validate_checks_share_one_table_info(temp_db: Path):
+    """Test table_exists, get_table_schema and column_exists share one lookup."""
+    migration = MockMigration("001", "Test migration")
+
+    with sqlite3.connect(temp_db) as conn:
+        conn.execute("CREATE TABLE t (id INTEGER)")
+        statements: list[str] = []
+        conn.set_trace_callback(statements.append)
+
+        assert migration.table_exists(conn, "t")
+        assert migration.get_table_schema(conn, "t")[0]["name"] == "id"
+        assert migration.column_exists(conn, "t", "id")
+        assert len(statements) == 1
+
+
 class MockMigrationRunner:
     """Test the MigrationRunner class."""
 
@@ -186,6 +248,32 @@ def test_migrations_runner_initialization(migration_runner: MigrationRunner):
         assert cursor.fetchone() is not None
 
 
+def test_migrations_connect_uses_wal_and_closes(temp_db: Path):
+    """Test connections run in WAL mode and close when their block exits."""
+    with connect(temp_db) as conn:
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        conn.execute("CREATE TABLE example (id INTEGER)")
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    # The last connection to close checkpoints and removes the WAL file
+    assert not temp_db.with_name(temp_db.name + "-wal").exists()
+
+
+def test_migrations_runner_reuses_connection(migration_runner: MigrationRunner):
+    """Test the runner keeps one connection open until it is closed."""
+    conn = migration_runner._connect()
+    migration_runner.get_applied_migrations()
+    migration_runner.get_migration_status()
+    assert migration_runner._connect() is conn
+
+    migration_runner.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    assert migration_runner.get_applied_migrations() == set()
+
+
 def test_migrations_register_migration(migration_runner: MigrationRunner):
     """Test migration registration."""
 
@@ -465,6 +553,54 @@ def test_migrations_validate_migrations_with_failure(migration_runner: Migration
         migration_runner.run_migrations()
 
 
+def test_migrations_run_is_all_or_nothing(migration_runner: MigrationRunner):
+    """Test a failing migration rolls back the ones applied earlier in the run."""
+
+    class Migration001(MockMigration):
+        def __init__(self):
+            super().__init__("001", "Creates a table")
+
+        def up(self, conn: sqlite3.Connection) -> None:
+            self.execute_script(conn, "CREATE TABLE t1 (id INTEGER); CREATE TABLE t2 (id INTEGER);")
+            super().up(conn)
+
+    class Migration002(MockMigration):
+        def __init__(self):
+            super().__init__("002", "Fails", should_fail=True)
+
+    migration_runner.register_migrations([Migration001, Migration002])
+
+    with pytest.raises(MigrationError):
+        migration_runner.run_migrations()
+
+    assert migration_runner.get_applied_migrations() == set()
+    with sqlite3.connect(migration_runner.db_path) as conn:
+        assert not MockMigration("000", "probe").table_exists(conn, "t1")
+        assert not MockMigration("000", "probe").table_exists(conn, "test_table_001")
+
+
+def test_migrations_failed_rollback_keeps_migration(migration_runner: MigrationRunner):
+    """Test a failing down() leaves the schema and bookkeeping untouched."""
+
+    class FailingDownMigration(MockMigration):
+        def __init__(self):
+            super().__init__("001", "Fails on rollback")
+
+        def down(self, conn: sqlite3.Connection) -> None:
+            super().down(conn)
+            raise MigrationError("Test rollback failure")
+
+    migration_runner.register_migration(FailingDownMigration)
+    migration_runner.run_migrations()
+
+    with pytest.raises(MigrationError, match="Rollback of migration 001 failed"):
+        migration_runner.rollback_migration("001")
+
+    assert migration_runner.get_applied_migrations() == {"001"}
+    with sqlite3.connect(migration_runner.db_path) as conn:
+        assert MockMigration("000", "probe").table_exists(conn, "test_table_001")
+
+
 def test_migrations_migration_dependencies(migration_runner: MigrationRunner):
     """Test migration dependency handling."""
 
@@ -488,6 +624,38 @@ def test_migrations_migration_dependencies(migration_runner: MigrationRunner):
         migration_runner.run_migrations()
 
 
+def test_migrations_pending_migrations_follow_dependencies(migration_runner: MigrationRunner):
+    """Test pending migrations are ordered by dependency, then by version."""
+
+    def mock_migration(version: str, deps: list[str]) -> type[MockMigration]:
+        class DependentMigration(MockMigration):
+            def __init__(self):
+                super().__init__(version, f"Migration {version}")
+
+            @property
+            def dependencies(self) -> list[str]:
+                return deps
+
+        return DependentMigration
+
+    migration_runner.register_migrations(
+        [
+            mock_migration("001", []),
+            mock_migration("002", ["003"]),
+            mock_migration("003", ["001"]),
+            mock_migration("004", []),
+        ]
+    )
+
+    pending = [m.version for m in migration_runner.get_pending_migrations()]
+    assert pending == ["001", "003", "002", "004"]
+
+    migration_runner.register_migration(mock_migration("005", ["006"]))
+    migration_runner.register_migration(mock_migration("006", ["005"]))
+    with pytest.raises(MigrationError, match="Circular migration dependencies among 005, 006"):
+        migration_runner.get_pending_migrations()
+
+
 def test_migrations_migration_execution_time_tracking(migration_runner: MigrationRunner):
     """Test that migration execution time is tracked."""
 
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import threading
+from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -126,6 +128,22 @@ def test_multi_voter_parse_voter_names_case_insensitive_and(
     result = message_handler._parse_voter_names("John Doe AND Jane Smith")
     assert result == ["John Doe", "Jane Smith"]
 
+
+def test_multi_voter_parse_voter_names_mention_with_spaces(
+    message_handler: MessageHandler,
+) -> None:
+    """Test parsing mentions containing spaces mixed with plain names."""
+    result = message_handler._parse_voter_names("@**Dan Yeaw** and Ken Odegard, @**Ryan Keith**")
+    assert result == ["Dan Yeaw", "Ken Odegard", "Ryan Keith"]
+
+
+def test_multi_voter_parse_voter_names_keeps_unparsed_text(
+    message_handler: MessageHandler,
+) -> None:
+    """Test tokens that aren't a bare mention are kept whole so validation reports them."""
+    result = message_handler._parse_voter_names("@**bob** extra, @**alice**")
+    assert result == ["@**bob** extra", "alice"]
+
     """Test multi-voter add functionality."""
 
 
@@ -478,7 +496,7 @@ def test_error_handling_in_multi_voter_operations(
     with (
         patch.object(
             message_handler.batch_service.database,
-            "add_voter_to_batch",
+            "add_voters_to_batch",
             side_effect=Exception("DB Error"),
         ),
         patch.object(message_handler, "_send_reply") as mock_reply,
@@ -488,3 +506,305 @@ def test_error_handling_in_multi_voter_operations(
         mock_reply.assert_called_once()
         response = mock_reply.call_args[0][1]
         assert "❌ Error adding voter(s)" in response
+
+
+def test_debounced_batch_message_edits_are_coalesced(
+    message_handler: MessageHandler, active_batch_with_voters: int
+) -> None:
+    """Test that rapid batch message updates collapse into a single edit."""
+    message_handler.edit_debounce_seconds = 60.0
+    active_batch = message_handler.batch_service.get_active_batch()
+    assert active_batch is not None
+
+    with patch.object(message_handler, "_edit_batch_message") as mock_edit:
+        for _ in range(5):
+            message_handler._update_batch_message(active_batch_with_voters, active_batch)
+
+        mock_edit.assert_not_called()
+        message_handler.flush_pending_edits()
+
+        mock_edit.assert_called_once_with(active_batch_with_voters, active_batch)
+        assert not message_handler._pending_edits
+
+
+def test_cancel_pending_batch_message_edit(
+    message_handler: MessageHandler, active_batch_with_voters: int
+) -> None:
+    """Test that a cancelled pending edit is never applied."""
+    message_handler.edit_debounce_seconds = 60.0
+    active_batch = message_handler.batch_service.get_active_batch()
+    assert active_batch is not None
+
+    with patch.object(message_handler, "_edit_batch_message") as mock_edit:
+        message_handler._update_batch_message(active_batch_with_voters, active_batch)
+        message_handler._cancel_pending_edit(active_batch_with_voters)
+        message_handler.flush_pending_edits()
+
+        mock_edit.assert_not_called()
+
+
+def test_end_vote_collection_waits_for_running_edit(
+    message_handler: MessageHandler, active_batch_with_voters: int
+) -> None:
+    """Test a progress edit already in flight can't re-add renders after collection ends."""
+    active_batch = message_handler.batch_service.get_active_batch()
+    assert active_batch is not None
+    started = threading.Event()
+    gate = threading.Event()
+
+    def slow_edit(batch_id: int, batch: object) -> None:
+        started.set()
+        gate.wait(timeout=5)
+        message_handler._last_rendered[batch_id] = "stale progress"
+
+    with patch.object(message_handler, "_apply_progress_edit", side_effect=slow_edit):
+        edit = threading.Thread(
+            target=message_handler._edit_batch_message,
+            args=(active_batch_with_voters, active_batch),
+        )
+        edit.start()
+        assert started.wait(timeout=5)
+
+        end = threading.Thread(
+            target=message_handler._end_vote_collection, args=(active_batch_with_voters,)
+        )
+        end.start()
+        end.join(timeout=0.1)
+        assert end.is_alive()
+
+        gate.set()
+        edit.join(timeout=5)
+        end.join(timeout=5)
+
+    assert active_batch_with_voters not in message_handler._last_rendered
+
+
+def test_render_batch_content_reuses_static_sections(
+    message_handler: MessageHandler, active_batch_with_voters: int
+) -> None:
+    """Test that stories and instructions are rendered once per batch."""
+    active_batch = message_handler.batch_service.get_active_batch()
+    assert active_batch is not None
+    deadline = datetime.fromisoformat(active_batch.deadline)
+    fetch_title = message_handler.github_api.fetch_issue_title_by_url
+
+    first = message_handler._render_batch_content(
+        active_batch_with_voters,
+        active_batch.issues,
+        deadline,
+        active_batch.facilitator,
+        "@**Alice**, @**Bob**",
+        0,
+        2,
+    )
+    calls_after_first = fetch_title.call_count
+    second = message_handler._render_batch_content(
+        active_batch_with_voters,
+        active_batch.issues,
+        deadline,
+        active_batch.facilitator,
+        "@**Bob**",
+        1,
+        2,
+    )
+
+    assert fetch_title.call_count == calls_after_first
+    assert "`#1234: 1, #1235: 2`" in second
+    assert "**Voters needed**: @**Bob**" in second
+    assert "(1/2 received)" in second
+    assert first.split("**Voters needed**")[0] == second.split("**Voters needed**")[0]
+
+
+def test_unchanged_batch_message_is_not_edited_again(
+    message_handler: MessageHandler,
+    active_batch_with_voters: int,
+    db_manager: DatabaseManager,
+) -> None:
+    """Test that re-rendering identical content skips the Zulip edit."""
+    db_manager.update_batch_message_id(active_batch_with_voters, 42)
+    active_batch = message_handler.batch_service.get_active_batch()
+    assert active_batch is not None
+    update_message = message_handler.zulip_client.update_message
+    update_message.return_value = {"result": "success"}
+
+    message_handler._update_batch_message(active_batch_with_voters, active_batch)
+    message_handler._update_batch_message(active_batch_with_voters, active_batch)
+    assert update_message.call_count == 1
+
+    db_manager.add_voter_to_batch(active_batch_with_voters, "Charlie")
+    message_handler._update_batch_message(active_batch_with_voters, active_batch)
+    assert update_message.call_count == 2
+
+
+def test_background_replies_are_delivered_on_close(
+    test_config: Config,
+    batch_service: BatchService,
+    voting_service: VotingService,
+    results_service: ResultsService,
+    mock_github_api: MagicMock,
+) -> None:
+    """Test that queued replies are sent by the sender thread, in order."""
+    mock_zulip_client = MagicMock()
+    mock_zulip_client.send_message.return_value = {"result": "success"}
+    handler = MessageHandler(
+        test_config,
+        mock_zulip_client,
+        batch_service,
+        voting_service,
+        results_service,
+        mock_github_api,
+        background_replies=True,
+    )
+    message = {"sender_full_name": "Test User", "sender_email": "test@example.com"}
+
+    handler._send_reply(message, "first")
+    handler._send_reply(message, "second")
+    handler.close()
+
+    contents = [call[0][0]["content"] for call in mock_zulip_client.send_message.call_args_list]
+    assert contents == ["first", "second"]
+    assert handler._sender_thread is None
+
+
+def test_issue_titles_fetched_once_per_batch(
+    message_handler: MessageHandler, active_batch_with_voters: int
+) -> None:
+    """Test that the confirmation and the batch topic share one formatted issue list."""
+    active_batch = message_handler.batch_service.get_active_batch()
+    assert active_batch is not None
+    message = {"sender_full_name": "Test User", "sender_email": "test@example.com"}
+    message_handler.zulip_client.send_message.return_value = {"result": "success", "id": 42}
+    fetch_title = message_handler.github_api.fetch_issue_title_by_url
+
+    message_handler._send_batch_confirmation(
+        message, active_batch.issues, active_batch.deadline_dt, active_batch_with_voters
+    )
+    message_handler._create_batch_topic(
+        active_batch_with_voters,
+        active_batch.issues,
+        active_batch.deadline_dt,
+        active_batch.facilitator,
+    )
+
+    assert fetch_title.call_count == len(active_batch.issues)
+
+    message_handler._forget_batch(active_batch_with_voters)
+    assert active_batch_with_voters not in message_handler._issue_list_cache
+
+
+def test_zulip_calls_overlap_on_shared_pool(message_handler: MessageHandler) -> None:
+    """Test independent Zulip requests overlap on one pool owned by the handler."""
+    barrier = threading.Barrier(2, timeout=5)
+    threads: list[str] = []
+
+    def call() -> None:
+        barrier.wait()
+        threads.append(threading.current_thread().name)
+
+    executor = message_handler._zulip_executor
+    message_handler._run_zulip_calls([call, call])
+    message_handler._run_zulip_calls([call, call])
+
+    assert len(threads) == 4
+    assert len(set(threads)) == 2
+    assert all(name.startswith("zulip-call") for name in threads)
+    assert message_handler._zulip_executor is executor
+
+    message_handler.close()
+    assert message_handler._zulip_executor is None
+
+
+def test_batch_results_post_on_shared_pool(message_handler: MessageHandler) -> None:
+    """Test the results post and status edit run on the handler's Zulip call pool."""
+    barrier = threading.Barrier(2, timeout=5)
+    threads: list[str] = []
+
+    def call() -> None:
+        barrier.wait()
+        threads.append(threading.current_thread().name)
+
+    message_handler._post_batch_results([call, call])
+    message_handler._post_batch_results([call, call])
+
+    assert len(set(threads)) == 2
+    assert all(name.startswith("zulip-call") for name in threads)
+    message_handler.close()
+
+
+def test_background_results_are_queued_behind_replies(
+    test_config: Config,
+    batch_service: BatchService,
+    voting_service: VotingService,
+    results_service: ResultsService,
+    mock_github_api: MagicMock,
+) -> None:
+    """Test that results posts share the sender thread and keep queue order."""
+    mock_zulip_client = MagicMock()
+    handler = MessageHandler(
+        test_config,
+        mock_zulip_client,
+        batch_service,
+        voting_service,
+        results_service,
+        mock_github_api,
+        background_results=True,
+    )
+    posted: list[str] = []
+    gate = threading.Event()
+
+    def post_results() -> None:
+        gate.wait(timeout=5)
+        posted.append("results")
+
+    handler._post_batch_results([post_results])
+    handler._run_in_background(lambda: posted.append("after"))
+    assert posted == []
+
+    gate.set()
+    handler.close()
+
+    assert posted == ["results", "after"]
+
+
+def test_final_vote_skips_progress_edit(
+    message_handler: MessageHandler, active_batch_with_voters: int, db_manager: DatabaseManager
+) -> None:
+    """Test the last vote goes straight to completion while earlier votes edit progress."""
+    db_manager.update_batch_message_id(active_batch_with_voters, 42)
+    message = {"sender_full_name": "alice", "sender_email": "alice@example.com"}
+    zulip_client = message_handler.zulip_client
+    zulip_client.update_message.return_value = {"result": "success"}
+
+    with (
+        patch.object(message_handler.voting_service, "submit_votes") as submit_votes,
+        patch.object(message_handler, "_process_batch_completion") as process_completion,
+    ):
+        submit_votes.return_value = ({"1234": 5}, [], False, False)
+        message_handler.handle_vote_submission(message, "#1234: 5")
+        assert zulip_client.update_message.call_count == 1
+        assert zulip_client.send_message.call_count == 1
+        process_completion.assert_not_called()
+
+        submit_votes.return_value = ({"1234": 5}, [], False, True)
+        message_handler.handle_vote_submission(message, "#1234: 5")
+        assert zulip_client.update_message.call_count == 1
+        assert zulip_client.send_message.call_count == 2
+        process_completion.assert_called_once()
+
+
+def test_abstain_only_vote_is_confirmed(
+    message_handler: MessageHandler, active_batch_with_voters: int
+) -> None:
+    """Test a submission made only of abstentions gets a normal confirmation."""
+    message = {"sender_full_name": "alice", "sender_email": "alice@example.com"}
+
+    with patch.object(message_handler.voting_service, "submit_votes") as submit_votes:
+        submit_votes.return_value = ({"1234": 5}, ["1235"], False, False)
+        message_handler.handle_vote_submission(message, "#1234: 5, #1235: abstain")
+        submit_votes.return_value = ({}, ["1234", "1235"], True, False)
+        message_handler.handle_vote_submission(message, "#1234: abstain, #1235: abstain")
+
+    send_message = message_handler.zulip_client.send_message
+    replies = [call[0][0]["content"] for call in send_message.call_args_list]
+    assert "Your estimates: #1234: 5, #1235: abstain" in replies[0]
+    assert "Your estimates: #1234: abstain, #1235: abstain" in replies[1]
@@ -312,6 +312,7 @@ def test_handle_proxy_vote_with_message_edit_timeout(
         False,  # all_voters_complete
     )
     mock_handler.voting_service.check_completion_status.return_value = (1, 3, False)
+    mock_handler.voting_service.get_voting_progress.return_value = (1, 3, ["carol", "dave"])
 
     # Mock Zulip API calls
     mock_handler.zulip_client.send_message.return_value = {"result": "success"}
@@ -5,11 +5,17 @@ from __future__ import annotations
 from unittest.mock import MagicMock
 
 import pytest
+from pydantic import ValidationError as PydanticValidationError
 
 from zulip_refinement_bot.config import Config
 from zulip_refinement_bot.exceptions import AuthorizationError, BatchError, ValidationError
-from zulip_refinement_bot.models import BatchData, IssueData
-from zulip_refinement_bot.services import BatchService, VotingService
+from zulip_refinement_bot.models import BatchData, EstimationVote, IssueData
+from zulip_refinement_bot.services import (
+    BatchService,
+    ResultsService,
+    VoterValidationService,
+    VotingService,
+)
 
 
 def test_batch_service_create_batch_success(test_config: Config) -> None:
@@ -109,7 +115,7 @@ def test_voting_service_submit_votes_auto_adds_new_voter(test_config: Config) ->
     mock_database.add_voter_to_batch.return_value = True  # Successfully added
     mock_database.get_completed_voters_count.return_value = 1
     mock_parser.parse_estimation_input.return_value = ({"1234": 5}, [], [])
-    mock_database.upsert_vote.return_value = (True, False)
+    mock_database.bulk_upsert_votes.return_value = (1, 0)
 
     # Create service
     service = VotingService(test_config, mock_database, mock_parser)
@@ -148,7 +154,7 @@ def test_voting_service_submit_votes_success(test_config: Config) -> None:
         "voter3",
     ]  # voter1 is authorized
     mock_parser.parse_estimation_input.return_value = ({"1234": 5}, [], [])
-    mock_database.upsert_vote.return_value = (True, False)
+    mock_database.bulk_upsert_votes.return_value = (1, 0)
     mock_database.get_completed_voters_count.return_value = 1
 
     # Create service
@@ -173,7 +179,7 @@ def test_voting_service_submit_votes_success(test_config: Config) -> None:
     assert abstentions == []
     assert has_updates  # Should be True since votes were stored
     assert not all_complete  # Only 1 out of 3 voters
-    mock_database.upsert_vote.assert_called_once_with(1, "voter1", "1234", 5)
+    mock_database.bulk_upsert_votes.assert_called_once_with(1, "voter1", {"1234": 5})
 
 
 def test_voting_service_submit_votes_validation_error(test_config: Config) -> None:
@@ -200,3 +206,70 @@ def test_voting_service_submit_votes_validation_error(test_config: Config) -> No
     # Test vote submission fails with validation error
     with pytest.raises(ValidationError, match="Invalid values found"):
         service.submit_votes("#1234: 4", "voter1", batch)
+
+
+def test_voter_validation_service_validate_voter_names_dedups() -> None:
+    """Test that duplicate and empty voter names are dropped, preserving order."""
+    result = VoterValidationService.validate_voter_names(
+        ["Bob", " Alice ", "", "Bob", "Alice", "Charlie"]
+    )
+
+    assert result == ["Bob", "Alice", "Charlie"]
+
+
+def test_batch_data_deadline_dt_is_parsed_once() -> None:
+    """Test that the parsed deadline is cached on the batch instance."""
+    batch = BatchData(
+        id=1, date="2024-01-01", deadline="2024-01-02T00:00:00+00:00", facilitator="facilitator"
+    )
+
+    assert batch.deadline_dt.isoformat() == "2024-01-02T00:00:00+00:00"
+    assert batch.deadline_dt is batch.deadline_dt
+    assert "deadline_dt" not in batch.model_dump()
+
+
+def test_batch_data_example_format_pads_short_batches() -> None:
+    """Test that the example estimate line repeats the first issue when needed."""
+    batch = BatchData(
+        id=1,
+        date="2024-01-01",
+        deadline="2024-01-02T00:00:00+00:00",
+        facilitator="facilitator",
+        issues=[
+            IssueData(issue_number="1234", url=""),
+            IssueData(issue_number="1235", url=""),
+        ],
+    )
+
+    assert batch.example_format == "#1234: 5, #1235: 8, #1234: 3"
+    assert "example_format" not in batch.model_dump()
+
+
+def test_issue_and_vote_records_are_immutable() -> None:
+    """Test that loaded issue and vote records cannot be mutated in place."""
+    issue = IssueData(issue_number="1234", url="")
+    vote = EstimationVote(voter="Alice", issue_number="1234", points=5)
+
+    with pytest.raises(PydanticValidationError):
+        issue.issue_number = "1235"
+    with pytest.raises(PydanticValidationError):
+        vote.points = 8
+    assert hash(issue) == hash(IssueData(issue_number="1234", url=""))
+
+
+def test_results_service_aggregate_votes_sorts_and_tallies_once() -> None:
+    """Test votes are grouped per issue with sorted points and counts."""
+    votes = [
+        EstimationVote(voter="Alice", issue_number="1234", points=8),
+        EstimationVote(voter="Bob", issue_number="1235", points=3),
+        EstimationVote(voter="Charlie", issue_number="1234", points=5),
+        EstimationVote(voter="Dana", issue_number="1234", points=8),
+    ]
+
+    aggregated = ResultsService._aggregate_votes(votes)
+
+    issue_votes, points, counts = aggregated["1234"]
+    assert [v.voter for v in issue_votes] == ["Alice", "Charlie", "Dana"]
+    assert points == [5, 8, 8]
+    assert counts == {5: 1, 8: 2}
+    assert aggregated["1235"][1] == [3]
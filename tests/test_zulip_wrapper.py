@@ -0,0 +1,42 @@
+"""Tests for the Zulip client wrapper."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from zulip_refinement_bot.zulip_wrapper import ZulipClientWrapper
+
+RATE_LIMITED = {"result": "error", "code": "RATE_LIMIT_HIT", "retry-after": 0.5}
+
+
+@pytest.fixture
+def wrapper() -> ZulipClientWrapper:
+    """Create a wrapper around a mocked zulip.Client."""
+    with patch("zulip_refinement_bot.zulip_wrapper.zulip.Client", return_value=MagicMock()):
+        return ZulipClientWrapper("bot@example.com", "key", "https://example.zulipchat.com")
+
+
+def test_update_message_retries_after_rate_limit(wrapper: ZulipClientWrapper) -> None:
+    """Test message edits wait for retry-after and retry on rate limits."""
+    wrapper.client.update_message.side_effect = [RATE_LIMITED, {"result": "success"}]
+
+    with patch("zulip_refinement_bot.zulip_wrapper.time.sleep") as sleep:
+        response = wrapper.update_message({"message_id": 1, "content": "updated"})
+
+    assert response == {"result": "success"}
+    assert wrapper.client.update_message.call_count == 2
+    sleep.assert_called_once_with(0.5)
+
+
+def test_send_message_raises_when_retries_exhausted(wrapper: ZulipClientWrapper) -> None:
+    """Test sending gives up after the maximum number of rate-limited attempts."""
+    wrapper.client.send_message.return_value = {"result": "error", "code": "RATE_LIMIT_HIT"}
+
+    with patch("zulip_refinement_bot.zulip_wrapper.time.sleep") as sleep:
+        with pytest.raises(Exception, match="Rate limit exceeded after 3 retries"):
+            wrapper.send_message({"type": "private", "to": ["a@example.com"], "content": "hi"})
+
+    assert wrapper.client.send_message.call_count == 4
+    assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0, 4.0]